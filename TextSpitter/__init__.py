@@ -12,55 +12,112 @@ except PackageNotFoundError:
 try:
     from TextSpitter._core import (  # type: ignore[import]
         Chunk,
+        ChunkBatch,
         TextChunker,
         TextNormalizer,
         TokenCounter,
+        decode_auto,
         detect_encoding,
+        detect_encoding_batch,
+        detect_encoding_stream,
+        tokenizer_cache_info,
+        warm_up,
     )
 
     _RUST_AVAILABLE = True
 except ImportError:
     from TextSpitter._fallback import (
         Chunk,
+        ChunkBatch,
         TextChunker,
         TextNormalizer,
         TokenCounter,
+        decode_auto,
         detect_encoding,
+        detect_encoding_batch,
+        detect_encoding_stream,
+        tokenizer_cache_info,
+        warm_up,
     )
 
     _RUST_AVAILABLE = False
 
+from .batch import ExtractionResult, extract_many
+from .cache import ResultCache
+from .core import PdfPage
 from .main import WordLoader
 
 __all__ = [
     "TextSpitter",
     "WordLoader",
+    "extract_many",
+    "ExtractionResult",
+    "aextract",
+    "aextract_many",
+    "PdfPage",
+    "ResultCache",
     "TextNormalizer",
     "TextChunker",
     "TokenCounter",
     "Chunk",
+    "ChunkBatch",
+    "decode_auto",
     "detect_encoding",
+    "detect_encoding_batch",
+    "detect_encoding_stream",
+    "tokenizer_cache_info",
+    "warm_up",
     "_RUST_AVAILABLE",
     "__version__",
 ]
 
 
+def __getattr__(name: str):
+    # The asyncio API is loaded on first use; importing asyncio eagerly
+    # would more than double the cost of `import TextSpitter`
+    if name in ("aextract", "aextract_many"):
+        from . import aio
+
+        return getattr(aio, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def TextSpitter(
-    file_obj=None, filename: str | None = None, file_attr: str = "name"
+    file_obj=None,
+    filename: str | None = None,
+    file_attr: str = "name",
+    use_mmap: bool = False,
+    pdf_workers: int = 1,
+    page_range: tuple[int, int | None] | None = None,
+    max_pages: int | None = None,
+    cache: "ResultCache | None" = None,
 ) -> str:
     """
     Extract text from a file and return it as a string.
 
     Args:
-        file_obj: A file path (str/Path), file-like object, bytes, or None.
+        file_obj: A file path (str/Path), file-like object, bytes,
+                  bytearray, memoryview, or None.
         filename: Filename with extension. Used when file_obj has no name
                   attribute, or as the sole argument for path-based loading.
         file_attr: Attribute name to read from file_obj for its filename.
                    Defaults to "name".
+        use_mmap: Memory-map path inputs instead of reading them into memory.
+        pdf_workers: Processes used to extract pages of large PDFs.
+        page_range: 0-based `(start, stop)` PDF pages to extract, slice-style.
+        max_pages: Extract at most this many PDF pages.
+        cache: Optional :class:`ResultCache` to reuse earlier results.
 
     Returns:
         str: Extracted text content.
     """
     return WordLoader(
-        file_obj=file_obj, filename=filename, file_attr=file_attr
+        file_obj=file_obj,
+        filename=filename,
+        file_attr=file_attr,
+        use_mmap=use_mmap,
+        pdf_workers=pdf_workers,
+        page_range=page_range,
+        max_pages=max_pages,
+        cache=cache,
     ).file_load()
@@ -7,21 +7,198 @@ either path without branching.
 
 from __future__ import annotations
 
+import codecs
+import os
+import re
+import threading
 import unicodedata
-from typing import Literal
+from array import array
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from functools import partial
+from typing import IO, Any, Literal
+
+# bytes, bytearray, memoryview, mmap — anything exposing a byte buffer.
+_BytesLike = bytes | bytearray | memoryview
+
+# Process-wide tiktoken cache shared by TokenCounter and TextChunker, mirroring
+# the Rust registry (including its load/hit counters).
+_BPE_LOCK = threading.Lock()
+_BPE_CACHE: dict[str, Any] = {}
+_BPE_STATS = {"loads": 0, "hits": 0}
+
+
+def _get_bpe(name: str) -> Any:
+    """Return the shared tiktoken encoding for *name*, loading it once."""
+    with _BPE_LOCK:
+        bpe = _BPE_CACHE.get(name)
+        if bpe is not None:
+            _BPE_STATS["hits"] += 1
+            return bpe
+        import tiktoken
+
+        bpe = tiktoken.get_encoding(name)
+        _BPE_STATS["loads"] += 1
+        _BPE_CACHE[name] = bpe
+        return bpe
+
+
+def warm_up(names: list[str]) -> None:
+    """Preload tokenizers into the shared registry."""
+    try:
+        for name in names:
+            _get_bpe(name)
+    except ImportError:
+        pass
+
+
+def tokenizer_cache_info() -> dict:
+    """Return load/hit counters and cached names for the shared registry."""
+    with _BPE_LOCK:
+        return {
+            "loads": _BPE_STATS["loads"],
+            "hits": _BPE_STATS["hits"],
+            "encodings": sorted(_BPE_CACHE),
+        }
 
 
-def detect_encoding(data: bytes) -> str:
+def detect_encoding(data: _BytesLike) -> str:
     """Detect encoding by trying common codecs in priority order."""
-    if not data:
-        return "utf-8"
-    for enc in ("utf-8", "utf-8-sig", "cp1252", "latin-1"):
+    return decode_auto(data)[1]
+
+
+def detect_encoding_batch(data: list[_BytesLike]) -> list[str]:
+    """Detect the encoding of each item; mirrors the parallel Rust batch."""
+    return [detect_encoding(d) for d in data]
+
+
+def decode_auto(data: _BytesLike) -> tuple[str, str]:
+    """Detect and decode *data* in one call; returns ``(text, codec)``.
+
+    Codecs are tried in priority order and the first successful decode is
+    kept rather than thrown away. latin-1 maps every byte, so this never
+    raises. ``str(buf, codec)`` decodes any byte buffer (``bytearray``,
+    ``memoryview``, ``mmap``) without first copying it into ``bytes``.
+    """
+    view = memoryview(data)
+    if view[:3] == b"\xef\xbb\xbf":
+        return str(view[3:], "utf-8", "replace"), "utf-8-sig"
+    for enc in ("utf-8", "cp1252"):
         try:
-            data.decode(enc)
-            return enc
-        except (UnicodeDecodeError, LookupError):
+            return str(view, enc), enc
+        except UnicodeDecodeError:
             continue
-    return "utf-8"
+    return str(view, "latin-1"), "latin-1"
+
+
+_DEFAULT_SAMPLE_SIZE = 1 << 20
+_DEFAULT_CHUNK_SIZE = 64 * 1024
+# Confidence that a sampled answer matches detect_encoding on the whole input
+# (mirrors src/encoding.rs).
+_CONFIDENCE_EXACT = 1.0
+_CONFIDENCE_UTF8_SAMPLE = 0.9
+_CONFIDENCE_ASCII_SAMPLE = 0.75
+_CONFIDENCE_SAMPLE = 0.6
+# Bytes with no cp1252 mapping; any of them means latin-1.
+_CP1252_UNDEFINED = re.compile(rb"[\x81\x8d\x8f\x90\x9d]")
+
+
+def detect_encoding_stream(
+    source: str | os.PathLike | _BytesLike | IO[bytes] | Iterable[bytes],
+    sample_size: int = _DEFAULT_SAMPLE_SIZE,
+    chunk_size: int = _DEFAULT_CHUNK_SIZE,
+) -> tuple[str, float]:
+    """Sampled ``detect_encoding`` over a path, file, buffer or iterable.
+
+    Reads ``chunk_size`` pieces until ``sample_size`` bytes are examined or
+    the answer can no longer change; returns ``(codec, confidence)``.
+    """
+    chunk_size = max(chunk_size, 1)
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            pieces = iter(partial(f.read, chunk_size), b"")
+            return _detect_pieces(pieces, sample_size, size)
+    try:
+        view = memoryview(source).cast("B")  # type: ignore[arg-type]
+    except TypeError:
+        pass
+    else:
+        pieces = (
+            bytes(view[i : i + chunk_size])
+            for i in range(0, min(len(view), sample_size), chunk_size)
+        )
+        return _detect_pieces(pieces, sample_size, len(view))
+    if hasattr(source, "read"):
+        pieces = iter(partial(source.read, chunk_size), b"")
+        return _detect_pieces(pieces, sample_size)
+    return _detect_pieces(source, sample_size)
+
+
+def _detect_pieces(
+    pieces: Iterable[bytes], sample_size: int, total: int | None = None
+) -> tuple[str, float]:
+    utf8 = codecs.getincrementaldecoder("utf-8")()
+    utf8_ok = cp1252_ok = True
+    non_ascii = False
+    head = b""
+    seen = 0
+    eof = True
+    for piece in pieces:
+        piece = piece[: sample_size - seen]
+        seen += len(piece)
+        if len(head) < 3:
+            head += piece[: 3 - len(head)]
+            if head == b"\xef\xbb\xbf":
+                return "utf-8-sig", _CONFIDENCE_EXACT
+        ascii_only = piece.isascii()
+        non_ascii = non_ascii or not ascii_only
+        if utf8_ok and (not ascii_only or utf8.getstate()[0]):
+            try:
+                utf8.decode(piece)
+            except UnicodeDecodeError:
+                utf8_ok = False
+        if cp1252_ok and not ascii_only and _CP1252_UNDEFINED.search(piece):
+            cp1252_ok = False
+        if not (utf8_ok or cp1252_ok):
+            return "latin-1", _CONFIDENCE_EXACT
+        if seen >= sample_size:
+            eof = False
+            break
+    if total is not None:
+        eof = seen == total
+    if utf8_ok and eof:
+        try:
+            utf8.decode(b"", final=True)
+        except UnicodeDecodeError:
+            utf8_ok = False
+    if utf8_ok:
+        if eof:
+            return "utf-8", _CONFIDENCE_EXACT
+        if non_ascii:
+            return "utf-8", _CONFIDENCE_UTF8_SAMPLE
+        return "utf-8", _CONFIDENCE_ASCII_SAMPLE
+    return "cp1252", _CONFIDENCE_EXACT if eof else _CONFIDENCE_SAMPLE
+
+
+# Normalizer patterns, compiled once per process (see src/normalize.rs).
+_RN_TO_M = re.compile(r"([a-z])rn([a-z])")
+_L_BETWEEN_DIGITS = re.compile(r"(\d)l(\d)")
+_HORIZONTAL_WS = re.compile(r"[^\S\n]+")
+_EXCESS_NEWLINES = re.compile(r"\n{3,}")
+_FUSED = {
+    (True, True): re.compile(r"([a-z])rn([a-z])|(\d)l(\d)|[^\S\n]+|\n{3,}"),
+    (True, False): re.compile(r"([a-z])rn([a-z])|(\d)l(\d)"),
+    (False, True): re.compile(r"[^\S\n]+|\n{3,}"),
+}
+
+
+def _fused_replace(m: re.Match) -> str:
+    if m.lastindex == 2:
+        return f"{m[1]}m{m[2]}"
+    if m.lastindex == 4:
+        return f"{m[3]}1{m[4]}"
+    return "\n\n" if m[0][0] == "\n" else " "
 
 
 class TextNormalizer:
@@ -33,46 +210,72 @@ class TextNormalizer:
         collapse_whitespace: bool = True,
         repair_ocr: bool = False,
         strip_headers_footers: bool = False,
+        fused: bool = False,
     ) -> None:
         self.unicode_form: TextNormalizer._NormForm = unicode_form
         self.collapse_whitespace = collapse_whitespace
         self.repair_ocr = repair_ocr
         self.strip_headers_footers = strip_headers_footers
+        self.fused = fused
+        self._stats = {"calls": 0, "fast_path": 0, "ascii": 0}
 
     def normalize(self, text: str) -> str:
-        s = unicodedata.normalize(self.unicode_form, text)
+        s = self._unicode_normalize(text)
         if self.strip_headers_footers:
             s = self._strip_headers(s)
+        if self.fused:
+            return self._fused(s)
         if self.repair_ocr:
             s = self._repair_ocr(s)
         if self.collapse_whitespace:
-            import re
-
-            s = re.sub(r"[^\S\n]+", " ", s)
-            s = re.sub(r"\n{3,}", "\n\n", s)
+            s = _HORIZONTAL_WS.sub(" ", s)
+            s = _EXCESS_NEWLINES.sub("\n\n", s)
             s = s.strip()
         return s
 
     def normalize_batch(self, texts: list[str]) -> list[str]:
         return [self.normalize(t) for t in texts]
 
+    def stats(self) -> dict:
+        return dict(self._stats)
+
+    def config(self) -> dict:
+        return {
+            "unicode_form": self.unicode_form,
+            "collapse_whitespace": self.collapse_whitespace,
+            "repair_ocr": self.repair_ocr,
+            "strip_headers_footers": self.strip_headers_footers,
+            "fused": self.fused,
+        }
+
+    def _unicode_normalize(self, text: str) -> str:
+        """Skip ``unicodedata.normalize`` for ASCII or already-normal text."""
+        self._stats["calls"] += 1
+        if text.isascii():
+            self._stats["ascii"] += 1
+            self._stats["fast_path"] += 1
+            return text
+        if unicodedata.is_normalized(self.unicode_form, text):
+            self._stats["fast_path"] += 1
+            return text
+        return unicodedata.normalize(self.unicode_form, text)
+
     def _strip_headers(self, text: str) -> str:
         pages = text.split("\x0c")
         if len(pages) < 2:
             return text
-        all_lines = [p.splitlines() for p in pages]
-        candidates = {
-            ln.strip()
-            for ln in all_lines[0]
-            if ln.strip()
-            and sum(
-                1
-                for pl in all_lines
-                if ln.strip() in [row.strip() for row in pl]
+        # One set per page so each page counts a line at most once; the
+        # Counter then holds the number of pages every trimmed line is on.
+        page_counts: Counter[str] = Counter()
+        for page in pages:
+            page_counts.update(
+                {row.strip() for row in page.splitlines()} - {""}
             )
-            * 2
-            > len(pages)
+        candidates = {
+            line for line, n in page_counts.items() if n * 2 > len(pages)
         }
+        if not candidates:
+            return text
         return "\x0c".join(
             "\n".join(
                 row
@@ -83,12 +286,18 @@ class TextNormalizer:
         )
 
     def _repair_ocr(self, text: str) -> str:
-        import re
-
-        text = re.sub(r"([a-z])rn([a-z])", r"\1m\2", text)
-        text = re.sub(r"(\d)l(\d)", r"\g<1>1\2", text)
+        text = _RN_TO_M.sub(r"\1m\2", text)
+        text = _L_BETWEEN_DIGITS.sub(r"\g<1>1\2", text)
         return text
 
+    def _fused(self, text: str) -> str:
+        """OCR repair and whitespace collapse in one regex pass."""
+        pattern = _FUSED.get((self.repair_ocr, self.collapse_whitespace))
+        if pattern is None:
+            return text
+        text = pattern.sub(_fused_replace, text)
+        return text.strip() if self.collapse_whitespace else text
+
 
 class Chunk:
     def __init__(
@@ -119,6 +328,89 @@ class Chunk:
         )
 
 
+class ChunkBatch:
+    """Columnar ``chunk_batch`` result; mirrors ``_core.ChunkBatch``.
+
+    Columns are ``bytes`` / ``array.array`` objects, so ``memoryview`` works
+    on them exactly as on the Rust buffers.
+    """
+
+    FLAG_OVERSIZED = 1
+
+    def __init__(self, docs: list[list[Chunk]]) -> None:
+        buf = bytearray()
+        self.text_offsets = array("Q", [0])
+        self.token_counts = array("Q")
+        self.char_starts = array("Q")
+        self.char_ends = array("Q")
+        self.chunk_indices = array("Q")
+        self.doc_ids = array("I")
+        self.flags = array("B")
+        self.doc_offsets = array("Q", [0])
+        self.section_titles: list[str | None] = []
+        for doc_id, chunks in enumerate(docs):
+            for c in chunks:
+                buf += c.text.encode("utf-8")
+                self.text_offsets.append(len(buf))
+                self.token_counts.append(c.token_count)
+                self.char_starts.append(c.char_start)
+                self.char_ends.append(c.char_end)
+                self.chunk_indices.append(c.chunk_index)
+                self.doc_ids.append(doc_id)
+                oversized = c.metadata.get("oversized", False)
+                self.flags.append(self.FLAG_OVERSIZED if oversized else 0)
+                self.section_titles.append(c.section_title)
+            self.doc_offsets.append(len(self.token_counts))
+        self.text_buffer = bytes(buf)
+
+    @property
+    def num_documents(self) -> int:
+        return len(self.doc_offsets) - 1
+
+    def _row(self, i: int) -> Chunk:
+        start, end = self.text_offsets[i], self.text_offsets[i + 1]
+        doc = self.doc_ids[i]
+        total = self.doc_offsets[doc + 1] - self.doc_offsets[doc]
+        metadata = {}
+        if self.flags[i] & self.FLAG_OVERSIZED:
+            metadata["oversized"] = True
+        return Chunk(
+            text=self.text_buffer[start:end].decode("utf-8"),
+            token_count=self.token_counts[i],
+            char_start=self.char_starts[i],
+            char_end=self.char_ends[i],
+            section_title=self.section_titles[i],
+            chunk_index=self.chunk_indices[i],
+            total_chunks=total,
+            metadata=metadata,
+        )
+
+    def __len__(self) -> int:
+        return len(self.token_counts)
+
+    def __getitem__(self, index: int) -> Chunk:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("ChunkBatch index out of range")
+        return self._row(index)
+
+    def __iter__(self) -> Iterator[Chunk]:
+        return (self._row(i) for i in range(len(self)))
+
+    def document(self, doc: int) -> list[Chunk]:
+        if not 0 <= doc < self.num_documents:
+            raise IndexError("document index out of range")
+        start, end = self.doc_offsets[doc], self.doc_offsets[doc + 1]
+        return [self._row(i) for i in range(start, end)]
+
+    def to_lists(self) -> list[list[Chunk]]:
+        return [self.document(d) for d in range(self.num_documents)]
+
+    def __repr__(self) -> str:
+        return f"ChunkBatch(documents={self.num_documents}, chunks={len(self)})"
+
+
 class TextChunker:
     def __init__(
         self,
@@ -134,9 +426,7 @@ class TextChunker:
                 f"<= max_tokens ({max_tokens})"
             )
         try:
-            import tiktoken
-
-            tiktoken.get_encoding(tokenizer)
+            _get_bpe(tokenizer)
         except ImportError:
             pass
         self.max_tokens = max_tokens
@@ -145,24 +435,28 @@ class TextChunker:
         self.preserve_tables = preserve_tables
         self.section_patterns = section_patterns or []
 
+    def config(self) -> dict:
+        return {
+            "max_tokens": self.max_tokens,
+            "min_tokens": self.min_tokens,
+            "tokenizer": self.tokenizer,
+            "preserve_tables": self.preserve_tables,
+            "section_patterns": list(self.section_patterns),
+        }
+
     def _count(self, text: str) -> int:
         try:
-            import tiktoken
-
-            enc = tiktoken.get_encoding(self.tokenizer)
+            enc = _get_bpe(self.tokenizer)
             # Mirror Rust encode_with_special_tokens: allow all special tokens.
             return len(enc.encode(text, allowed_special="all"))
         except Exception:
             return len(text) // 4
 
-    def chunk(self, text: str) -> list[Chunk]:
-        import re
-
+    def _split(self, text: str) -> Iterator[Chunk]:
         # Split with a capturing group so we can measure the actual separator
         # length (2+ newlines). Without this, char_cursor drifts when gaps use
         # 3+ newlines because the old code always added a fixed +2.
         pieces = re.split(r"(\n\n+)", text)
-        chunks: list[Chunk] = []
         current_parts: list[str] = []
         current_tokens = 0
         char_cursor = 0
@@ -186,33 +480,29 @@ class TextChunker:
             if para_tokens > self.max_tokens:
                 if current_parts:
                     chunk_text = "\n\n".join(current_parts)
-                    chunks.append(
-                        Chunk(
-                            text=chunk_text,
-                            token_count=current_tokens,
-                            char_start=current_start,
-                            char_end=char_cursor,
-                            section_title=section_title,
-                            chunk_index=0,
-                            total_chunks=None,
-                            metadata={},
-                        )
+                    yield Chunk(
+                        text=chunk_text,
+                        token_count=current_tokens,
+                        char_start=current_start,
+                        char_end=char_cursor,
+                        section_title=section_title,
+                        chunk_index=0,
+                        total_chunks=None,
+                        metadata={},
                     )
                     current_parts = []
                     current_tokens = 0
                     current_start = char_cursor
                 end = char_cursor + len(piece)
-                chunks.append(
-                    Chunk(
-                        text=para,
-                        token_count=para_tokens,
-                        char_start=char_cursor,
-                        char_end=end,
-                        section_title=section_title,
-                        chunk_index=0,
-                        total_chunks=None,
-                        metadata={"oversized": True},
-                    )
+                yield Chunk(
+                    text=para,
+                    token_count=para_tokens,
+                    char_start=char_cursor,
+                    char_end=end,
+                    section_title=section_title,
+                    chunk_index=0,
+                    total_chunks=None,
+                    metadata={"oversized": True},
                 )
                 char_cursor = end
                 current_start = char_cursor
@@ -220,17 +510,15 @@ class TextChunker:
 
             if current_tokens + para_tokens > self.max_tokens and current_parts:
                 chunk_text = "\n\n".join(current_parts)
-                chunks.append(
-                    Chunk(
-                        text=chunk_text,
-                        token_count=current_tokens,
-                        char_start=current_start,
-                        char_end=char_cursor,
-                        section_title=section_title,
-                        chunk_index=0,
-                        total_chunks=None,
-                        metadata={},
-                    )
+                yield Chunk(
+                    text=chunk_text,
+                    token_count=current_tokens,
+                    char_start=current_start,
+                    char_end=char_cursor,
+                    section_title=section_title,
+                    chunk_index=0,
+                    total_chunks=None,
+                    metadata={},
                 )
                 current_parts = []
                 current_tokens = 0
@@ -242,44 +530,48 @@ class TextChunker:
 
         if current_parts:
             chunk_text = "\n\n".join(current_parts)
-            chunks.append(
-                Chunk(
-                    text=chunk_text,
-                    token_count=current_tokens,
-                    char_start=current_start,
-                    char_end=char_cursor,
-                    section_title=section_title,
-                    chunk_index=0,
-                    total_chunks=None,
-                    metadata={},
-                )
+            yield Chunk(
+                text=chunk_text,
+                token_count=current_tokens,
+                char_start=current_start,
+                char_end=char_cursor,
+                section_title=section_title,
+                chunk_index=0,
+                total_chunks=None,
+                metadata={},
             )
 
+    def chunk(self, text: str) -> list[Chunk]:
+        chunks = list(self.chunk_iter(text))
         total = len(chunks)
-        for i, c in enumerate(chunks):
-            c.chunk_index = i
+        for c in chunks:
             c.total_chunks = total
         return chunks
 
-    def chunk_batch(self, texts: list[str]) -> list[list[Chunk]]:
-        return [self.chunk(t) for t in texts]
+    def chunk_iter(self, text: str) -> Iterator[Chunk]:
+        """Yield chunks lazily; ``total_chunks`` is left as ``None``."""
+        for i, c in enumerate(self._split(text)):
+            c.chunk_index = i
+            yield c
+
+    def chunk_batch(
+        self, texts: list[str], columnar: bool = False
+    ) -> list[list[Chunk]] | ChunkBatch:
+        docs = [self.chunk(t) for t in texts]
+        return ChunkBatch(docs) if columnar else docs
 
 
 class TokenCounter:
     def __init__(self, model: str = "cl100k_base") -> None:
         try:
-            import tiktoken
-
-            tiktoken.get_encoding(model)
+            _get_bpe(model)
         except ImportError:
             pass
         self.model = model
 
     def _bpe(self):
         try:
-            import tiktoken
-
-            return tiktoken.get_encoding(self.model)
+            return _get_bpe(self.model)
         except Exception:
             return None
 
@@ -0,0 +1,145 @@
+"""
+Manifest of files processed by incremental CLI runs (``--incremental``).
+
+Each row records a file's absolute path, size, modification time, content
+digest and the fingerprint of the settings it was processed with. A file
+whose size and mtime match is unchanged without being read; one whose
+mtime changed but whose size and digest match (a touch or a copy) is also
+unchanged, and its row is refreshed. A row is only written once the file's
+output has been written, so an interrupted run re-processes whatever it did
+not finish. Previous text is stored (zlib-compressed) only when it is to be
+reused.
+"""
+
+import hashlib
+import os
+import sqlite3
+import zlib
+from pathlib import Path
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    digest TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    text BLOB
+);
+"""
+
+_HASH_CHUNK_SIZE = 1 << 20
+
+
+def file_digest(path: str) -> str:
+    """BLAKE2b-128 hex digest of the file at `path`, read in chunks."""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        while chunk := f.read(_HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class Manifest:
+    """
+    SQLite manifest consulted and updated by one CLI run.
+
+    Args:
+        path: Database file; created if missing.
+        fingerprint: Settings that affect the output; rows recorded with a
+            different fingerprint count as changed.
+        keep_text: Store each file's text so unchanged files can be
+            re-emitted; rows without text then count as changed.
+    """
+
+    # Rows written per transaction
+    COMMIT_EVERY = 256
+
+    def __init__(self, path: str | Path, fingerprint: str, keep_text: bool):
+        self.fingerprint = fingerprint
+        self.keep_text = keep_text
+        self.unchanged = 0
+        self.changed = 0
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._conn.execute("BEGIN")
+        self._uncommitted = 0
+        # stat and digest of changed files, until their output is written
+        self._pending: dict[str, tuple[int, int, str]] = {}
+
+    def check(self, path: str) -> tuple[bool, str | None]:
+        """
+        Return ``(unchanged, previous_text)`` for `path`; the text is None
+        unless ``keep_text``.
+        """
+        key = os.path.abspath(path)
+        st = os.stat(path)
+        row = self._conn.execute(
+            "SELECT size, mtime_ns, digest, fingerprint, text FROM files "
+            "WHERE path = ?",
+            (key,),
+        ).fetchone()
+        digest = None
+        if (
+            row is not None
+            and row[3] == self.fingerprint
+            and (row[4] is not None or not self.keep_text)
+            and row[0] == st.st_size
+        ):
+            if row[1] == st.st_mtime_ns:
+                return self._hit(row[4])
+            digest = file_digest(path)
+            if digest == row[2]:
+                self._write(
+                    "UPDATE files SET mtime_ns = ? WHERE path = ?",
+                    (st.st_mtime_ns, key),
+                )
+                return self._hit(row[4])
+
+        self.changed += 1
+        self._pending[key] = (
+            st.st_size,
+            st.st_mtime_ns,
+            digest or file_digest(path),
+        )
+        return False, None
+
+    def _hit(self, data: bytes | None) -> tuple[bool, str | None]:
+        self.unchanged += 1
+        if not self.keep_text:
+            return True, None
+        return True, zlib.decompress(data).decode("utf-8")
+
+    def record(self, path: str, text: str) -> None:
+        """Record a changed file once its output has been written."""
+        key = os.path.abspath(path)
+        stat = self._pending.pop(key, None)
+        if stat is None:
+            return  # unchanged, or not checked against this manifest
+        data = zlib.compress(text.encode("utf-8")) if self.keep_text else None
+        self._write(
+            "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?)",
+            (key, *stat, self.fingerprint, data),
+        )
+
+    def _write(self, sql: str, params: tuple) -> None:
+        self._conn.execute(sql, params)
+        self._uncommitted += 1
+        if self._uncommitted >= self.COMMIT_EVERY:
+            self._conn.execute("COMMIT")
+            self._conn.execute("BEGIN")
+            self._uncommitted = 0
+
+    def close(self) -> None:
+        """Commit outstanding rows and close the database."""
+        self._conn.execute("COMMIT")
+        self._conn.close()
+
+    def __enter__(self) -> "Manifest":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -0,0 +1,135 @@
+"""
+Streaming text extraction for OOXML word-processing documents (DOCX).
+
+The main document part is decompressed and fed to an incremental expat
+parser in fixed-size chunks, so paragraph text is produced as the file is
+read and no element tree is ever built. Paragraph text follows python-docx's
+``Paragraph.text`` (runs directly under the paragraph or one of its
+hyperlinks, with ``w:tab``/``w:br``/``w:cr``/``w:noBreakHyphen`` translated);
+unlike ``Document.paragraphs``, paragraphs inside tables and block-level
+content controls are included, in document order. Text boxes and
+``mc:Fallback`` content are skipped, as the latter duplicates ``mc:Choice``.
+"""
+
+import posixpath
+import zipfile
+from collections.abc import Iterator
+from typing import BinaryIO
+from xml.etree import ElementTree
+from xml.parsers import expat
+
+_WORD_NS = frozenset(
+    {
+        "http://schemas.openxmlformats.org/wordprocessingml/2006/main",
+        "http://purl.oclc.org/ooxml/wordprocessingml/main",  # Strict OOXML
+    }
+)
+_MC_NS = "http://schemas.openxmlformats.org/markup-compatibility/2006"
+_RELS_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+_DEFAULT_PART = "word/document.xml"
+_CHUNK_SIZE = 1 << 16
+
+# Run children that stand for a fixed character, as in python-docx
+_RUN_CHARS = {"tab": "\t", "ptab": "\t", "cr": "\n", "noBreakHyphen": "-"}
+
+
+def _main_part_name(archive: zipfile.ZipFile) -> str:
+    """Resolve the main document part from the package relationships."""
+    try:
+        rels = ElementTree.fromstring(archive.read("_rels/.rels"))
+    except KeyError:
+        return _DEFAULT_PART
+    for rel in rels.iter(f"{{{_RELS_NS}}}Relationship"):
+        if rel.get("Type", "").endswith("/officeDocument"):
+            return posixpath.normpath(rel.get("Target", "").lstrip("/"))
+    return _DEFAULT_PART
+
+
+class _DocumentHandler:
+    """expat callbacks that collect finished paragraphs."""
+
+    def __init__(self):
+        self.paragraphs: list[str] = []
+        self._stack: list[str] = []  # local names of open elements
+        self._skip = 0  # depth inside mc:Fallback / w:txbxContent
+        self._parts: list[str] | None = None  # text of the open paragraph
+        self._in_text = False
+
+    def _in_run(self) -> bool:
+        """Whether the innermost element is a run python-docx would read."""
+        stack = self._stack
+        return (
+            len(stack) >= 2
+            and stack[-1] == "r"
+            and (stack[-2] == "p" or stack[-3:-1] == ["p", "hyperlink"])
+        )
+
+    def start(self, name: str, attrs: dict[str, str]) -> None:
+        uri, _, local = name.rpartition(" ")
+        if (
+            self._skip
+            or (uri == _MC_NS and local == "Fallback")
+            or (uri in _WORD_NS and local == "txbxContent")
+        ):
+            self._skip += 1
+            return
+        if uri not in _WORD_NS:
+            self._stack.append("")
+            return
+
+        if local == "p":
+            self._parts = []
+        elif self._parts is not None and self._in_run():
+            if local == "t":
+                self._in_text = True
+            elif local in _RUN_CHARS:
+                self._parts.append(_RUN_CHARS[local])
+            elif local == "br":
+                # Page and column breaks contribute no text
+                if attrs.get(f"{uri} type", "textWrapping") == "textWrapping":
+                    self._parts.append("\n")
+        self._stack.append(local)
+
+    def end(self, name: str) -> None:
+        if self._skip:
+            self._skip -= 1
+            return
+        local = self._stack.pop()
+        if local == "t":
+            self._in_text = False
+        elif local == "p" and self._parts is not None:
+            self.paragraphs.append("".join(self._parts))
+            self._parts = None
+
+    def text(self, data: str) -> None:
+        if self._in_text:
+            self._parts.append(data)
+
+
+def iter_docx_paragraphs(stream: BinaryIO) -> Iterator[str]:
+    """
+    Yield the text of each paragraph of a DOCX file, in document order.
+
+    Args:
+        stream: Seekable binary stream over the DOCX (zip) package.
+
+    Raises:
+        zipfile.BadZipFile: If the stream is not a zip archive.
+        KeyError: If the main document part is missing.
+        xml.parsers.expat.ExpatError: If the document XML is malformed.
+    """
+    with zipfile.ZipFile(stream) as archive:
+        with archive.open(_main_part_name(archive)) as part:
+            handler = _DocumentHandler()
+            parser = expat.ParserCreate(namespace_separator=" ")
+            parser.buffer_text = True
+            parser.StartElementHandler = handler.start
+            parser.EndElementHandler = handler.end
+            parser.CharacterDataHandler = handler.text
+
+            while chunk := part.read(_CHUNK_SIZE):
+                parser.Parse(chunk, False)
+                yield from handler.paragraphs
+                handler.paragraphs.clear()
+            parser.Parse(b"", True)
+            yield from handler.paragraphs
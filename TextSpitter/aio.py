@@ -0,0 +1,198 @@
+"""
+asyncio API for extracting text without blocking the event loop.
+
+:func:`aextract` and :func:`aextract_many` read async byte streams (such as
+Starlette/FastAPI ``UploadFile`` objects or ``request.stream()``) on the
+event loop, then run the blocking parse on an executor. Concurrency is
+bounded with an :class:`asyncio.Semaphore`, which callers can share across
+requests. A parse running on an executor cannot be interrupted, so
+cancelling the awaiting task stops reading the stream straight away, but
+once parsing has started it waits for the parse to finish (still holding
+the semaphore) before raising :class:`asyncio.CancelledError`.
+
+The default executor is the event loop's thread pool. Parsers hold the GIL
+for much of their work, so a web service that must stay responsive under
+large PDFs should pass a :class:`concurrent.futures.ProcessPoolExecutor`;
+sources are then pickled to the worker, which rules out sync file objects.
+
+This module imports asyncio, so it is not imported by ``import
+TextSpitter``; ``TextSpitter.aextract`` loads it on first access.
+"""
+
+import asyncio
+import os
+import time
+from collections.abc import AsyncIterable, Iterable
+from concurrent.futures import Executor
+from functools import partial
+from pathlib import Path
+from typing import Any
+
+from .batch import ExtractionResult
+from .main import WordLoader
+
+# Read size for async streams that expose ``read(size)``
+STREAM_CHUNK_SIZE = 1 << 20
+
+
+def _extract(file_obj: Any, filename: str | None, loader_kwargs: dict) -> str:
+    """Blocking extraction run on the executor (module level: picklable)."""
+    return WordLoader(
+        file_obj=file_obj, filename=filename, **loader_kwargs
+    ).file_load()
+
+
+def _is_async_source(source: Any) -> bool:
+    read = getattr(source, "read", None)
+    return isinstance(source, AsyncIterable) or (
+        read is not None and asyncio.iscoroutinefunction(read)
+    )
+
+
+async def _read_async(source: Any) -> bytearray:
+    """Drain an async stream (``await read(n)`` or ``async for``)."""
+    data = bytearray()
+    read = getattr(source, "read", None)
+    if read is not None and asyncio.iscoroutinefunction(read):
+        while chunk := await read(STREAM_CHUNK_SIZE):
+            data += chunk
+    else:
+        async for chunk in source:
+            data += chunk
+    return data
+
+
+async def _run_blocking(future: asyncio.Future) -> Any:
+    """
+    Await an executor future; if cancelled, wait for the work to finish
+    before re-raising, so callers keep holding their semaphore until then.
+    """
+    try:
+        return await asyncio.shield(future)
+    except asyncio.CancelledError:
+        while not future.done():
+            try:
+                await asyncio.wait([future])
+            except asyncio.CancelledError:
+                pass
+        if not future.cancelled():
+            future.exception()  # retrieved, so asyncio does not log it
+        raise
+
+
+async def aextract(
+    file_obj=None,
+    filename: str | None = None,
+    *,
+    executor: Executor | None = None,
+    semaphore: asyncio.Semaphore | None = None,
+    **loader_kwargs,
+) -> str:
+    """
+    Extract text from a file without blocking the event loop.
+
+    Args:
+        file_obj: Anything :class:`~TextSpitter.main.WordLoader` accepts, or
+            an async byte stream: an object with an async ``read(size)``
+            method (``UploadFile``, aiofiles) or an async iterable of bytes.
+        filename: Filename with extension. Required for async streams that
+            have no ``filename`` or ``name`` attribute.
+        executor: Executor for the blocking parse; the event loop's
+            default thread pool when None.
+        semaphore: Held while the source is read and parsed, bounding how
+            many extractions run at once. A cancelled call keeps holding
+            it until its parse has finished.
+        **loader_kwargs: Passed to ``WordLoader`` (e.g. ``max_pages``).
+
+    Returns:
+        str: Extracted text content.
+
+    Raises:
+        ValueError: If an async stream has no filename to dispatch on.
+    """
+    if semaphore is not None:
+        async with semaphore:
+            return await aextract(
+                file_obj, filename, executor=executor, **loader_kwargs
+            )
+
+    if _is_async_source(file_obj):
+        filename = (
+            filename
+            or getattr(file_obj, "filename", None)
+            or getattr(file_obj, "name", None)
+        )
+        if not filename:
+            raise ValueError("filename is required for async streams")
+        file_obj = await _read_async(file_obj)
+        filename = os.path.basename(str(filename))
+
+    loop = asyncio.get_running_loop()
+    return await _run_blocking(
+        loop.run_in_executor(
+            executor, partial(_extract, file_obj, filename, loader_kwargs)
+        )
+    )
+
+
+async def aextract_many(
+    sources: Iterable[Any],
+    concurrency: int = 4,
+    *,
+    executor: Executor | None = None,
+    **loader_kwargs,
+) -> list[ExtractionResult]:
+    """
+    Extract text from many sources concurrently, at most `concurrency` at
+    a time.
+
+    Failures are reported per source in :attr:`ExtractionResult.error`
+    rather than raised. Cancelling the call cancels every extraction that
+    has not started parsing and returns once running parses finish.
+
+    Args:
+        sources: Paths or async byte streams, as accepted by
+            :func:`aextract` with no separate filename.
+        concurrency: Maximum number of extractions in flight.
+        executor: Executor for the blocking parse, as for :func:`aextract`.
+        **loader_kwargs: Passed to ``WordLoader``.
+
+    Returns:
+        list[ExtractionResult]: One result per source, in input order.
+
+    Raises:
+        ValueError: If `concurrency` is below 1.
+    """
+    if concurrency < 1:
+        raise ValueError(f"concurrency must be >= 1, got {concurrency}")
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(index: int, source: Any) -> ExtractionResult:
+        path = str(
+            source
+            if isinstance(source, str | Path)
+            else getattr(source, "filename", None)
+            or getattr(source, "name", None)
+            or source
+        )
+        start = time.perf_counter()
+        try:
+            text = await aextract(
+                source,
+                executor=executor,
+                semaphore=semaphore,
+                **loader_kwargs,
+            )
+            error = None
+        except Exception as e:
+            text, error = None, f"{type(e).__name__}: {e}"
+        return ExtractionResult(
+            index, path, text, error, time.perf_counter() - start, None
+        )
+
+    async with asyncio.TaskGroup() as group:
+        tasks = [
+            group.create_task(run(index, source))
+            for index, source in enumerate(sources)
+        ]
+    return [task.result() for task in tasks]
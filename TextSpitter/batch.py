@@ -0,0 +1,302 @@
+"""
+Parallel batch extraction over a pool of worker processes.
+
+:func:`extract_many` feeds file paths to long-lived worker processes and
+yields one :class:`ExtractionResult` per input, in input order or as
+completed. Failures are reported per file instead of raised. A file that
+exceeds its time limit has its worker killed and replaced. Workers are
+recycled after a fixed number of tasks or once their resident memory has
+grown past a ceiling, which contains leaks in the native PDF libraries.
+"""
+
+import multiprocessing
+import os
+import time
+from collections.abc import Iterable, Iterator
+from multiprocessing.connection import Connection, wait
+from pathlib import Path
+from typing import NamedTuple
+
+from .logger import logger
+from .main import WordLoader
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None  # type: ignore[assignment]
+
+
+class ExtractionResult(NamedTuple):
+    """Outcome of extracting one input of :func:`extract_many`."""
+
+    index: int  # position of the input in `paths`
+    path: str
+    text: str | None  # None when `error` is set
+    error: str | None  # "ExceptionType: message", or None on success
+    seconds: float  # wall time spent on this file
+    pid: int | None  # worker process that handled it
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def _rss_mb() -> float | None:
+    """
+    Resident set size of this process in MiB (None if unknown).
+
+    Current RSS from ``/proc`` where available; otherwise the peak RSS,
+    which can only grow.
+    """
+    try:
+        with open("/proc/self/statm", "rb") as f:
+            resident = int(f.read().split()[1])
+        return resident * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, IndexError):
+        pass
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return (
+        peak / (1024 * 1024) if os.uname().sysname == "Darwin" else peak / 1024
+    )
+
+
+def _worker_main(conn: Connection, loader_kwargs: dict) -> None:
+    """Worker loop: extract each ``(index, path)`` until told to stop."""
+    # Memory is reported relative to startup, so what a forked worker
+    # inherits from its parent does not count against `max_rss_mb`
+    baseline = _rss_mb()
+    while True:
+        try:
+            task = conn.recv()
+        except EOFError:
+            break
+        if task is None:
+            break
+        index, path = task
+        start = time.perf_counter()
+        try:
+            text = WordLoader(file_obj=path, **loader_kwargs).file_load()
+            error = None
+        except Exception as e:
+            text, error = None, f"{type(e).__name__}: {e}"
+        rss = _rss_mb()
+        growth = None if rss is None or baseline is None else rss - baseline
+        conn.send((index, text, error, time.perf_counter() - start, growth))
+
+
+class _Worker:
+    """One worker process and the task it is currently running."""
+
+    def __init__(self, ctx, loader_kwargs: dict):
+        self.conn, child_conn = ctx.Pipe()
+        self.process = ctx.Process(
+            target=_worker_main, args=(child_conn, loader_kwargs), daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+        self.tasks = 0
+        self.task: tuple[int, str] | None = None
+        self.started = 0.0
+
+    def submit(self, index: int, path: str) -> None:
+        self.conn.send((index, path))
+        self.task = (index, path)
+        self.started = time.monotonic()
+
+    def stop(self) -> None:
+        """Ask the worker to exit, killing it if it does not."""
+        try:
+            self.conn.send(None)
+        except OSError:
+            pass
+        self.process.join(timeout=1)
+        if self.process.is_alive():
+            self.kill()
+        self.conn.close()
+
+    def kill(self) -> None:
+        self.process.kill()
+        self.process.join()
+
+
+def extract_many(
+    paths: Iterable[str | Path],
+    workers: int | None = None,
+    *,
+    ordered: bool = True,
+    timeout: float | None = None,
+    max_tasks_per_worker: int | None = None,
+    max_rss_mb: float | None = None,
+    start_method: str | None = None,
+    **loader_kwargs,
+) -> Iterator[ExtractionResult]:
+    """
+    Extract text from many files on a pool of worker processes.
+
+    `paths` is consumed lazily, so it may be a generator over millions of
+    files; only the files in flight (plus, when `ordered`, a small reorder
+    buffer) are held at once. Results are yielded as an iterator of
+    :class:`ExtractionResult`; closing the iterator early shuts the pool
+    down.
+
+    Args:
+        paths: File paths to extract.
+        workers: Number of worker processes (default: CPU count).
+        ordered: Yield results in input order; otherwise as completed.
+        timeout: Per-file time limit in seconds. A file that runs over has
+            its worker killed and is reported with a `TimeoutError`.
+        max_tasks_per_worker: Replace a worker after this many files.
+        max_rss_mb: Replace a worker once its RSS has grown by more than
+            this many MiB since it started (ignored where the platform
+            cannot report it).
+        start_method: `multiprocessing` start method ("fork", "spawn",
+            "forkserver"); the platform default when None.
+        **loader_kwargs: Passed to :class:`~TextSpitter.main.WordLoader`
+            (e.g. `max_pages`, `cache`).
+
+    Yields:
+        ExtractionResult
+
+    Raises:
+        ValueError: If `workers` or `max_tasks_per_worker` is below 1.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError(f"workers must be >= 1, got {workers}")
+    if max_tasks_per_worker is not None and max_tasks_per_worker < 1:
+        raise ValueError(
+            f"max_tasks_per_worker must be >= 1, got {max_tasks_per_worker}"
+        )
+    return _run(
+        iter(enumerate(paths)),
+        workers,
+        ordered,
+        timeout,
+        max_tasks_per_worker,
+        max_rss_mb,
+        multiprocessing.get_context(start_method),
+        loader_kwargs,
+    )
+
+
+def _run(
+    source: Iterator[tuple[int, str | Path]],
+    workers: int,
+    ordered: bool,
+    timeout: float | None,
+    max_tasks: int | None,
+    max_rss_mb: float | None,
+    ctx,
+    loader_kwargs: dict,
+) -> Iterator[ExtractionResult]:
+    pool: list[_Worker] = []
+    reorder: dict[int, ExtractionResult] = {}
+    next_index = 0
+    # Stop reading input while this many results wait for a slow earlier one
+    reorder_cap = workers * 4
+    exhausted = False
+
+    def replace(slot: int, reason: str) -> None:
+        logger.debug(
+            f"Recycling extraction worker {pool[slot].process.pid}: {reason}"
+        )
+        pool[slot].stop()
+        pool[slot] = _Worker(ctx, loader_kwargs)
+
+    try:
+        while True:
+            # Hand the next inputs to idle workers, starting workers lazily
+            while not exhausted and not (
+                ordered and len(reorder) >= reorder_cap
+            ):
+                idle = next((w for w in pool if w.task is None), None)
+                if idle is None and len(pool) < workers:
+                    idle = _Worker(ctx, loader_kwargs)
+                    pool.append(idle)
+                if idle is None:
+                    break
+                item = next(source, None)
+                if item is None:
+                    exhausted = True
+                    break
+                idle.submit(item[0], str(item[1]))
+
+            busy = [slot for slot, w in enumerate(pool) if w.task is not None]
+            if not busy:
+                break
+
+            wait_for = None
+            if timeout is not None:
+                now = time.monotonic()
+                deadline = min(pool[slot].started for slot in busy) + timeout
+                wait_for = max(deadline - now, 0)
+            ready = wait([pool[slot].conn for slot in busy], wait_for)
+
+            done: list[ExtractionResult] = []
+            for slot in busy:
+                worker = pool[slot]
+                index, path = worker.task
+                pid = worker.process.pid
+                if worker.conn in ready:
+                    try:
+                        _, text, error, seconds, growth = worker.conn.recv()
+                    except (EOFError, OSError):
+                        worker.process.join()
+                        code = worker.process.exitcode
+                        done.append(
+                            ExtractionResult(
+                                index,
+                                path,
+                                None,
+                                f"WorkerError: worker exited with code {code}",
+                                time.monotonic() - worker.started,
+                                pid,
+                            )
+                        )
+                        replace(slot, f"exited with code {code}")
+                        continue
+                    done.append(
+                        ExtractionResult(index, path, text, error, seconds, pid)
+                    )
+                    worker.task = None
+                    worker.tasks += 1
+                    if max_tasks is not None and worker.tasks >= max_tasks:
+                        replace(slot, f"completed {worker.tasks} tasks")
+                    elif (
+                        max_rss_mb is not None
+                        and growth is not None
+                        and growth > max_rss_mb
+                    ):
+                        replace(slot, f"RSS grew by {growth:.0f} MiB")
+                elif (
+                    timeout is not None
+                    and time.monotonic() - worker.started >= timeout
+                ):
+                    worker.kill()
+                    done.append(
+                        ExtractionResult(
+                            index,
+                            path,
+                            None,
+                            f"TimeoutError: extraction exceeded {timeout}s",
+                            time.monotonic() - worker.started,
+                            pid,
+                        )
+                    )
+                    replace(slot, "timed out")
+
+            for result in done:
+                if not ordered:
+                    yield result
+                    continue
+                reorder[result.index] = result
+                while next_index in reorder:
+                    yield reorder.pop(next_index)
+                    next_index += 1
+    finally:
+        for worker in pool:
+            worker.stop()
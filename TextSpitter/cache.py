@@ -0,0 +1,379 @@
+"""
+Opt-in, on-disk cache of extraction results.
+
+Entries are content-addressed: the key is a BLAKE2b digest of the file's
+bytes plus a fingerprint of every setting that affects the result (the
+extractor's page selection and file type, and the normalizer and chunker
+configuration for later stages). Extracted text, normalized text and chunks
+are cached as separate stages, so changing only the chunker re-uses the
+extracted and normalized text.
+
+Results are zlib-compressed into a SQLite database in WAL mode, which makes
+the cache safe to share between processes. When the stored size exceeds
+``max_bytes``, least recently used entries are evicted.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from TextSpitter import _RUST_AVAILABLE, Chunk, __version__
+
+from .core import FileExtractor, _LazyModule, docx, pymupdf, pypdf
+from .logger import logger
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    key TEXT PRIMARY KEY,
+    stage TEXT NOT NULL,
+    data BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    accessed REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_accessed ON results (accessed);
+"""
+
+# The fallback token counts differ with and without tiktoken
+_tiktoken = _LazyModule("tiktoken")
+
+_CHUNK_FIELDS = (
+    "text",
+    "token_count",
+    "char_start",
+    "char_end",
+    "section_title",
+    "chunk_index",
+    "total_chunks",
+    "metadata",
+)
+
+
+def default_cache_path() -> Path:
+    """``$XDG_CACHE_HOME/textspitter/results.sqlite3`` (or ``~/.cache``)."""
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "textspitter" / "results.sqlite3"
+
+
+class CachedResult(NamedTuple):
+    """Stages returned by :meth:`ResultCache.process`."""
+
+    text: str
+    normalized: str | None  # None without a normalizer
+    chunks: list | None  # list[Chunk]; None without a chunker
+
+
+class ResultCache:
+    """
+    Content-addressed cache of extracted text, normalized text and chunks.
+
+    Pass an instance as ``cache=`` to :func:`TextSpitter.TextSpitter` or
+    :class:`~TextSpitter.main.WordLoader`, or run the whole pipeline through
+    :meth:`process`. Instances can be shared between threads, and any
+    number of processes may open the same ``path``.
+
+    Args:
+        path: SQLite database file; defaults to :func:`default_cache_path`.
+        max_bytes: Cap on the compressed size of all entries.
+        compression_level: zlib level (1 = fastest, 9 = smallest).
+    """
+
+    DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+    # Evict down to this fraction of max_bytes, so eviction is not re-run
+    # on every insert once the cache is full
+    EVICT_TO = 0.9
+
+    def __init__(
+        self,
+        path: str | Path | None = None,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        compression_level: int = 6,
+    ):
+        if max_bytes <= 0:
+            raise ValueError(f"max_bytes must be > 0, got {max_bytes}")
+        self.path = Path(path) if path is not None else default_cache_path()
+        self.max_bytes = max_bytes
+        self.compression_level = compression_level
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._pid = 0
+
+    # --- Storage ---
+
+    def _connection(self) -> sqlite3.Connection:
+        """Open (or re-open after fork) the per-process connection."""
+        if self._conn is None or self._pid != os.getpid():
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(
+                self.path,
+                timeout=30.0,
+                isolation_level=None,  # explicit transactions only
+                check_same_thread=False,
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._conn, self._pid = conn, os.getpid()
+        return self._conn
+
+    @staticmethod
+    def content_digest(extractor: FileExtractor) -> str:
+        """BLAKE2b-128 hex digest of ``extractor``'s raw contents."""
+        with extractor.open_buffer() as contents:
+            return hashlib.blake2b(contents, digest_size=16).hexdigest()
+
+    def key(
+        self, extractor: FileExtractor, *stages: Any, digest: str | None = None
+    ) -> str:
+        """
+        Cache key for ``extractor``'s contents after the given stages.
+
+        Each stage is ``None`` (skipped), a config ``dict``, or an object
+        with a ``config()`` method such as ``TextNormalizer`` and
+        ``TextChunker``. Pass a precomputed :meth:`content_digest` as
+        ``digest`` to avoid hashing the contents again.
+        """
+        if digest is None:
+            digest = self.content_digest(extractor)
+        configs = [extractor.config()] + [
+            stage if isinstance(stage, dict) else stage.config()
+            for stage in stages
+            if stage is not None
+        ]
+        # Installing a backend can change what a file extracts to, or how
+        # its chunks are counted
+        backends = {
+            "pymupdf": pymupdf.installed(),
+            "pypdf": pypdf.installed(),
+            "docx": docx.installed(),
+            "tiktoken": _tiktoken.installed(),
+        }
+        fingerprint = json.dumps(
+            [__version__, _RUST_AVAILABLE, backends, configs],
+            sort_keys=True,
+            default=str,
+        )
+        key = hashlib.blake2b(digest.encode("ascii"), digest_size=16)
+        key.update(fingerprint.encode("utf-8"))
+        return key.hexdigest()
+
+    def get(self, key: str) -> Any | None:
+        """Return the cached value for ``key``, or None on a miss."""
+        with self._lock:
+            conn = self._connection()
+            row = conn.execute(
+                "SELECT stage, data FROM results WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            conn.execute(
+                "UPDATE results SET accessed = ? WHERE key = ?",
+                (time.time(), key),
+            )
+            self.hits += 1
+        stage, data = row
+        return self._decode(stage, zlib.decompress(data))
+
+    def put(self, key: str, stage: str, value: Any) -> None:
+        """Store ``value`` under ``key``, evicting old entries if needed."""
+        data = zlib.compress(self._encode(stage, value), self.compression_level)
+        if len(data) > self.max_bytes:
+            logger.debug(f"Not caching {stage} result of {len(data)} bytes")
+            return
+        with self._lock:
+            conn = self._connection()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.execute(
+                    "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?)",
+                    (key, stage, data, len(data), time.time()),
+                )
+                self._evict(conn)
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """Drop least recently used entries while over ``max_bytes``."""
+        (total,) = conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM results"
+        ).fetchone()
+        if total <= self.max_bytes:
+            return
+        excess = total - int(self.max_bytes * self.EVICT_TO)
+        victims = []
+        for key, size in conn.execute(
+            "SELECT key, size FROM results ORDER BY accessed"
+        ):
+            victims.append((key,))
+            excess -= size
+            if excess <= 0:
+                break
+        conn.executemany("DELETE FROM results WHERE key = ?", victims)
+        logger.debug(f"Evicted {len(victims)} cached results")
+
+    @staticmethod
+    def _encode(stage: str, value: Any) -> bytes:
+        if stage == "chunks":
+            value = json.dumps(
+                [{f: getattr(c, f) for f in _CHUNK_FIELDS} for c in value]
+            )
+        return value.encode("utf-8")
+
+    @staticmethod
+    def _decode(stage: str, data: bytes) -> Any:
+        text = data.decode("utf-8")
+        if stage == "chunks":
+            return [Chunk(**fields) for fields in json.loads(text)]
+        return text
+
+    # --- Pipeline ---
+
+    def _cached(
+        self,
+        key: str,
+        stage: str,
+        compute: Callable[[], Any],
+        failed: Callable[[], str | None] = lambda: None,
+    ) -> Any:
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            if (error := failed()) is None:
+                self.put(key, stage, value)
+            else:
+                logger.debug(f"Not caching failed {stage} result: {error}")
+        return value
+
+    def text(
+        self,
+        extractor: FileExtractor,
+        extract: Callable[[], str],
+        digest: str | None = None,
+    ) -> str:
+        """
+        Extracted text for ``extractor``, running ``extract`` on a miss.
+
+        A result is not stored if the extractor reported a read error
+        (``extractor.read_error``), so a failed read is retried next time.
+        """
+        extractor.read_error = None
+        return self._cached(
+            self.key(extractor, digest=digest),
+            "text",
+            extract,
+            lambda: extractor.read_error,
+        )
+
+    def process(
+        self,
+        file_obj=None,
+        filename: str | None = None,
+        *,
+        normalizer=None,
+        chunker=None,
+        **loader_kwargs,
+    ) -> CachedResult:
+        """
+        Extract, then optionally normalize and chunk, a file through the
+        cache; each stage is only computed on a miss.
+
+        Args:
+            file_obj: Anything :class:`~TextSpitter.main.WordLoader` accepts.
+            filename: Filename hint, as for ``WordLoader``.
+            normalizer: Optional ``TextNormalizer`` applied to the text.
+            chunker: Optional ``TextChunker`` applied to the normalized text
+                (or to the raw text without a normalizer).
+            **loader_kwargs: Passed to ``WordLoader`` (e.g. ``max_pages``).
+
+        Returns:
+            CachedResult
+        """
+        from .main import WordLoader
+
+        # Uncached loader: this method handles every stage itself, hashing
+        # the contents only once
+        loader = WordLoader(
+            file_obj=file_obj, filename=filename, **loader_kwargs
+        )
+        digest = self.content_digest(loader.file)
+        text = self.text(loader.file, loader.file_load, digest)
+
+        def failed() -> str | None:
+            # Later stages of a failed read are computed but not stored
+            return loader.file.read_error
+
+        normalized = None
+        if normalizer is not None:
+            normalized = self._cached(
+                self.key(loader.file, normalizer, digest=digest),
+                "normalized",
+                lambda: normalizer.normalize(text),
+                failed,
+            )
+        chunks = None
+        if chunker is not None:
+            source = normalized if normalized is not None else text
+            chunks = self._cached(
+                self.key(loader.file, normalizer, chunker, digest=digest),
+                "chunks",
+                lambda: chunker.chunk(source),
+                failed,
+            )
+        return CachedResult(text, normalized, chunks)
+
+    # --- Maintenance ---
+
+    def stats(self) -> dict:
+        """``{"entries", "bytes", "hits", "misses"}``; hits/misses are
+        counted by this instance only."""
+        with self._lock:
+            entries, size = (
+                self._connection()
+                .execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM results")
+                .fetchone()
+            )
+        return {
+            "entries": entries,
+            "bytes": size,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._connection().execute("DELETE FROM results")
+
+    def close(self) -> None:
+        """Close this process's database connection."""
+        with self._lock:
+            if self._conn is not None and self._pid == os.getpid():
+                self._conn.close()
+            self._conn = None
+
+    def __getstate__(self) -> dict:
+        # Worker processes open their own connection; see extract_many
+        state = self.__dict__.copy()
+        state.update(_lock=None, _conn=None, _pid=0)
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "ResultCache":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -2,13 +2,397 @@
 Command-line interface for textspitter.
 
 Usage:
-    textspitter FILE [FILE ...]
-    textspitter FILE [FILE ...] -o OUTPUT
+    textspitter PATH [PATH ...]
+    textspitter PATH [PATH ...] -o OUTPUT
+    textspitter PATH [PATH ...] -j JOBS [--as-completed]
+    textspitter DIR --include GLOB --exclude GLOB --ext EXT
+    find . -name '*.pdf' -print0 | textspitter --files-from - -0
+    textspitter PATH [PATH ...] --format jsonl --max-tokens N
+    textspitter DIR --incremental MANIFEST [--unchanged reuse]
 """
 
 import argparse
+import json
+import os
+import queue
 import sys
-from pathlib import Path
+import threading
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import nullcontext, suppress
+from fnmatch import fnmatch
+from itertools import chain
+from typing import TYPE_CHECKING, NamedTuple, TextIO
+
+if TYPE_CHECKING:
+    from ._manifest import Manifest
+
+# Read size for --files-from lists
+_LIST_CHUNK_SIZE = 1 << 16
+
+
+class _WalkFilter(NamedTuple):
+    """Which files a directory walk yields."""
+
+    include: list[str]  # globs; empty = everything
+    exclude: list[str]  # globs; also prune directories
+    extensions: set[str]  # lower-case, without the dot; empty = any
+    follow_symlinks: bool
+
+    @staticmethod
+    def _matches(name: str, rel_path: str, patterns: list[str]) -> bool:
+        return any(
+            fnmatch(name, pattern) or fnmatch(rel_path, pattern)
+            for pattern in patterns
+        )
+
+    def excludes(self, name: str, rel_path: str) -> bool:
+        return self._matches(name, rel_path, self.exclude)
+
+    def includes(self, name: str, rel_path: str) -> bool:
+        if self.include and not self._matches(name, rel_path, self.include):
+            return False
+        ext = os.path.splitext(name)[1][1:].lower()
+        return not self.extensions or ext in self.extensions
+
+
+def _walk(
+    root: str, walk_filter: _WalkFilter
+) -> Iterator[tuple[str, str | None]]:
+    """
+    Yield ``(path, error)`` for the files under `root`, depth-first in name
+    order, as they are found. Globs are matched against both the entry name
+    and its `/`-separated path relative to `root`. Symlinks are skipped
+    unless `walk_filter.follow_symlinks`, in which case directory cycles
+    are detected by device and inode.
+    """
+    follow = walk_filter.follow_symlinks
+    seen: set[tuple[int, int]] = set()
+    if follow:
+        st = os.stat(root)
+        seen.add((st.st_dev, st.st_ino))
+
+    def visit(directory: str) -> Iterator[tuple[str, str | None]]:
+        try:
+            with os.scandir(directory) as it:
+                entries = sorted(it, key=lambda entry: entry.name)
+        except OSError as e:
+            yield directory, f"cannot read directory: {e.strerror}"
+            return
+        for entry in entries:
+            rel_path = os.path.relpath(entry.path, root).replace(os.sep, "/")
+            if walk_filter.excludes(entry.name, rel_path):
+                continue
+            try:
+                if entry.is_dir(follow_symlinks=follow):
+                    if follow:
+                        st = entry.stat()
+                        if (st.st_dev, st.st_ino) in seen:
+                            continue
+                        seen.add((st.st_dev, st.st_ino))
+                    yield from visit(entry.path)
+                elif entry.is_file(
+                    follow_symlinks=follow
+                ) and walk_filter.includes(entry.name, rel_path):
+                    yield entry.path, None
+            except OSError:
+                continue  # vanished or dangling; nothing to extract
+
+    yield from visit(root)
+
+
+def _read_list(source: str, separator: bytes) -> Iterator[str]:
+    """Lazily read a `separator`-delimited list of paths ('-' = stdin)."""
+    with (
+        nullcontext(sys.stdin.buffer) if source == "-" else open(source, "rb")
+    ) as stream:
+        pending = b""
+        while chunk := stream.read(_LIST_CHUNK_SIZE):
+            *items, pending = (pending + chunk).split(separator)
+            yield from _list_entries(items, separator)
+        yield from _list_entries([pending], separator)
+
+
+def _list_entries(items: list[bytes], separator: bytes) -> Iterator[str]:
+    for item in items:
+        if separator == b"\n":
+            item = item.rstrip(b"\r")
+        if item:
+            yield os.fsdecode(item)
+
+
+# ``(text, error)`` of a file that needs no extraction: a missing path has
+# an error, a file reused from the manifest has its previous text, and an
+# unchanged file that is skipped has neither
+_Resolved = tuple[str | None, str | None]
+
+
+def _iter_inputs(
+    paths: Iterable[str], walk_filter: _WalkFilter
+) -> Iterator[tuple[str, _Resolved | None]]:
+    """
+    Expand `paths` into ``(path, resolved)`` pairs: directories are walked,
+    files are passed through unfiltered (``resolved`` None, to be
+    extracted) and missing paths resolve to an error.
+    """
+    for path in paths:
+        if os.path.isdir(path):
+            for file_path, error in _walk(path, walk_filter):
+                yield file_path, None if error is None else (None, error)
+        elif os.path.exists(path):
+            yield path, None
+        else:
+            yield path, (None, "file not found")
+
+
+def _extract(
+    inputs: Iterable[tuple[str, _Resolved | None]],
+    jobs: int,
+    ordered: bool = True,
+) -> Iterator[tuple[str, str | None, str | None]]:
+    """
+    Yield ``(path, text, error)`` for each of `inputs`, in input order or,
+    when not `ordered`, as each file finishes. Only inputs that are not
+    already resolved are extracted. `inputs` is consumed lazily, so
+    extraction starts while directories are still being walked, and
+    resolved inputs are not held back by extractions that come after them.
+    """
+    # Import here so the CLI fails gracefully if the package is broken
+    from . import TextSpitter, extract_many
+
+    if jobs == 1:
+        for file_path, resolved in inputs:
+            if resolved is not None:
+                yield file_path, *resolved
+                continue
+            try:
+                yield file_path, TextSpitter(filename=file_path), None
+            except Exception as exc:
+                yield file_path, None, str(exc)
+        return
+
+    # The pool runs on a thread fed through `todo`, so inputs keep being
+    # read here and resolved ones are yielded as soon as every unresolved
+    # input before them has been (at once when not `ordered`). The pool is
+    # only started by the first unresolved input.
+    window = (jobs or os.cpu_count() or 1) * 4
+    todo: queue.Queue[str | None] = queue.Queue(maxsize=window)
+    results: queue.Queue = queue.Queue()  # ExtractionResult or exception
+    stop = threading.Event()
+    # Inputs not yet yielded, in order (only used when `ordered`); reading
+    # stops while `window` are held behind a slow extraction
+    pending: deque[tuple[str, _Resolved | None]] = deque()
+    in_flight = 0
+    pool: threading.Thread | None = None
+
+    def feed() -> Iterator[str]:
+        while not stop.is_set() and (path := todo.get()) is not None:
+            yield path
+
+    def run_pool(extracted: Iterator) -> None:
+        try:
+            for result in extracted:
+                results.put(result)
+                if stop.is_set():
+                    break
+        except BaseException as exc:
+            results.put(exc)
+            while todo.get() is not None:  # never leave the reader blocked
+                pass
+        finally:
+            extracted.close()
+
+    def ready(limit: int) -> Iterator[tuple[str, str | None, str | None]]:
+        """
+        Yield what can be yielded now, waiting for results while more than
+        `limit` inputs are outstanding.
+        """
+        nonlocal in_flight
+        while True:
+            if pending and pending[0][1] is not None:
+                file_path, resolved = pending.popleft()
+                yield file_path, *resolved
+                continue
+            if not in_flight:
+                return
+            outstanding = len(pending) if ordered else in_flight
+            try:
+                result = results.get(block=outstanding > limit)
+            except queue.Empty:
+                return
+            if isinstance(result, BaseException):
+                raise result
+            in_flight -= 1
+            if ordered:
+                pending.popleft()  # this result's own entry
+            error = result.error
+            if error is not None:
+                # "ExceptionType: message" -> the message, as reported by
+                # the serial path
+                error = error.partition(": ")[2] or error
+            yield result.path, result.text, error
+
+    try:
+        for file_path, resolved in inputs:
+            if resolved is None:
+                if pool is None:
+                    extracted = extract_many(
+                        feed(), workers=jobs or None, ordered=ordered
+                    )
+                    pool = threading.Thread(
+                        target=run_pool, args=(extracted,), daemon=True
+                    )
+                    pool.start()
+                todo.put(file_path)
+                in_flight += 1
+                if ordered:
+                    pending.append((file_path, None))
+            elif ordered and pending:
+                pending.append((file_path, resolved))
+            else:
+                yield file_path, *resolved
+            yield from ready(window)
+        if pool is not None:
+            todo.put(None)
+        yield from ready(0)
+        if pool is not None:
+            pool.join()
+    finally:
+        if pool is not None and pool.is_alive():
+            stop.set()
+            with suppress(queue.Full):
+                todo.put_nowait(None)
+
+
+def _skip_unchanged(
+    inputs: Iterable[tuple[str, _Resolved | None]], manifest: "Manifest"
+) -> Iterator[tuple[str, _Resolved | None]]:
+    """Resolve inputs the manifest reports as unchanged."""
+    for file_path, resolved in inputs:
+        if resolved is not None:
+            yield file_path, resolved
+            continue
+        try:
+            unchanged, text = manifest.check(file_path)
+        except OSError as exc:  # vanished or unreadable since the walk
+            yield file_path, (None, exc.strerror or str(exc))
+            continue
+        yield file_path, (text, None) if unchanged else None
+
+
+def _report(file_path: str, error: str) -> None:
+    print(
+        f"Error processing {file_path!r}: {error}", file=sys.stderr, flush=True
+    )
+
+
+def _write_text(
+    results: Iterable[tuple[str, str | None, str | None]],
+    out: TextIO | None,
+    on_written: Callable[[str, str], None] | None = None,
+) -> bool:
+    """
+    Write each file's text as it completes, calling ``on_written(path,
+    text)`` once it is flushed; return whether any file failed. Files
+    resolved without text (unchanged and skipped) are not written.
+    """
+    failed = False
+    written = 0
+    for file_path, text, error in results:
+        if error is not None:
+            failed = True
+            _report(file_path, error)
+            continue
+        if text is None:
+            continue
+        if out is None:
+            print(text, flush=True)
+        else:
+            if written:
+                out.write("\n")
+            out.write(text)
+            out.flush()
+        written += 1
+        if on_written is not None:
+            on_written(file_path, text)
+    return failed
+
+
+def _write_jsonl(
+    results: Iterable[tuple[str, str | None, str | None]],
+    out: TextIO | None,
+    normalizer,
+    chunker,
+    batch_size: int,
+    on_written: Callable[[str, str], None] | None = None,
+) -> bool:
+    """
+    Normalize and chunk files in batches of `batch_size` and write one JSON
+    record per chunk; return whether any file failed. Files resolved
+    without text (unchanged and skipped) get a single ``{"path",
+    "unchanged": true}`` record instead, and files with no chunks (empty
+    text) a ``{"path", "total_chunks": 0}`` record, so consumers still see
+    every file.
+
+    ``normalize_batch`` and ``chunk_batch`` run across the files of a batch
+    on the Rust thread pool. Chunk offsets are into the normalized text.
+    """
+    failed = False
+    batch: list[tuple[str, str | None]] = []
+
+    def flush() -> None:
+        texts = [text for _, text in batch if text is not None]
+        chunked = iter(chunker.chunk_batch(normalizer.normalize_batch(texts)))
+        lines = []
+        for path, text in batch:
+            if text is None:
+                record = {"path": path, "unchanged": True}
+                lines.append(json.dumps(record, ensure_ascii=False))
+                continue
+            chunks = next(chunked)
+            if not chunks:
+                record = {"path": path, "total_chunks": 0}
+                lines.append(json.dumps(record, ensure_ascii=False))
+                continue
+            lines.extend(
+                json.dumps(
+                    {
+                        "path": path,
+                        "chunk_index": chunk.chunk_index,
+                        "total_chunks": chunk.total_chunks,
+                        "char_start": chunk.char_start,
+                        "char_end": chunk.char_end,
+                        "token_count": chunk.token_count,
+                        "section_title": chunk.section_title,
+                        "text": chunk.text,
+                    },
+                    ensure_ascii=False,
+                )
+                for chunk in chunks
+            )
+        if lines:
+            if out is None:
+                print("\n".join(lines), flush=True)
+            else:
+                out.write("".join(line + "\n" for line in lines))
+                out.flush()
+        if on_written is not None:
+            for path, text in batch:
+                if text is not None:
+                    on_written(path, text)
+        batch.clear()
+
+    for file_path, text, error in results:
+        if error is not None:
+            failed = True
+            _report(file_path, error)
+            continue
+        batch.append((file_path, text))
+        if len(batch) >= batch_size:
+            flush()
+    if batch:
+        flush()
+    return failed
 
 
 def main() -> None:
@@ -21,9 +405,12 @@ def main() -> None:
     )
     parser.add_argument(
         "files",
-        nargs="+",
-        metavar="FILE",
-        help="Path(s) to the file(s) to extract text from.",
+        nargs="*",
+        metavar="PATH",
+        help=(
+            "File(s) to extract text from; directories are searched "
+            "recursively."
+        ),
     )
     parser.add_argument(
         "-o",
@@ -32,35 +419,223 @@ def main() -> None:
         default=None,
         help="Write extracted text to FILE instead of stdout.",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        metavar="N",
+        type=int,
+        default=1,
+        help=(
+            "Extract files on N worker processes (0 = one per CPU). "
+            "Output order is unchanged."
+        ),
+    )
+    parser.add_argument(
+        "--as-completed",
+        action="store_true",
+        help=(
+            "With --jobs, write each file as soon as it finishes instead of "
+            "in argument order."
+        ),
+    )
+    walk = parser.add_argument_group("directory and list input")
+    walk.add_argument(
+        "--include",
+        action="append",
+        default=[],
+        metavar="GLOB",
+        help=(
+            "When walking directories, only extract files whose name or "
+            "relative path matches GLOB (repeatable)."
+        ),
+    )
+    walk.add_argument(
+        "--exclude",
+        action="append",
+        default=[],
+        metavar="GLOB",
+        help="Skip files and directories matching GLOB (repeatable).",
+    )
+    walk.add_argument(
+        "--ext",
+        action="append",
+        default=[],
+        metavar="EXT",
+        help=(
+            "Only extract files with these extensions, e.g. --ext pdf,docx "
+            "(repeatable)."
+        ),
+    )
+    walk.add_argument(
+        "--follow-symlinks",
+        action="store_true",
+        help="Follow symlinks while walking directories (skipped by default).",
+    )
+    walk.add_argument(
+        "--files-from",
+        metavar="LIST",
+        help="Read more paths from LIST, one per line ('-' for stdin).",
+    )
+    walk.add_argument(
+        "-0",
+        "--null",
+        action="store_true",
+        help="Paths in --files-from are NUL-separated (find -print0).",
+    )
+    pipeline = parser.add_argument_group(
+        "jsonl pipeline",
+        "With --format jsonl, extracted text is normalized (TextNormalizer "
+        "defaults) and chunked, and one JSON record is written per chunk: "
+        "path, chunk_index, total_chunks, char_start, char_end, "
+        "token_count, section_title and text.",
+    )
+    pipeline.add_argument(
+        "--format",
+        choices=("text", "jsonl"),
+        default="text",
+        help="Output format (default: text).",
+    )
+    pipeline.add_argument(
+        "--max-tokens",
+        type=int,
+        default=2000,
+        metavar="N",
+        help="Maximum tokens per chunk (default: 2000).",
+    )
+    pipeline.add_argument(
+        "--min-tokens",
+        type=int,
+        default=100,
+        metavar="N",
+        help="Minimum tokens per chunk (default: 100).",
+    )
+    pipeline.add_argument(
+        "--tokenizer",
+        default="cl100k_base",
+        metavar="NAME",
+        help="tiktoken encoding used to count tokens (default: cl100k_base).",
+    )
+    pipeline.add_argument(
+        "--batch-size",
+        type=int,
+        default=32,
+        metavar="N",
+        help="Files normalized and chunked per batch (default: 32).",
+    )
+    incremental = parser.add_argument_group(
+        "incremental runs",
+        "With --incremental, a manifest records each file's size, mtime, "
+        "content digest and the output settings. Files unchanged since the "
+        "last run are not extracted again.",
+    )
+    incremental.add_argument(
+        "--incremental",
+        metavar="MANIFEST",
+        help="SQLite manifest file to read and update.",
+    )
+    incremental.add_argument(
+        "--unchanged",
+        choices=("skip", "reuse"),
+        help=(
+            "skip: omit unchanged files (jsonl writes one "
+            '{"path", "unchanged": true} record each); reuse: store text in '
+            "the manifest and write it again (default: reuse for text "
+            "written to -o, which is overwritten each run; skip otherwise)."
+        ),
+    )
     args = parser.parse_args()
+    if args.jobs < 0:
+        parser.error("--jobs must be >= 0")
+    if args.batch_size < 1:
+        parser.error("--batch-size must be >= 1")
+    if not args.files and not args.files_from:
+        parser.error("the following arguments are required: PATH")
+    # Text output has no record for a skipped file, so skipping into a
+    # rewritten -o file would drop the previous run's text
+    text_file = args.format == "text" and args.output
+    if args.unchanged is None:
+        args.unchanged = "reuse" if text_file else "skip"
+    elif args.unchanged == "skip" and text_file and args.incremental:
+        parser.error(
+            "--unchanged skip would drop unchanged files from OUTPUT; use "
+            "--unchanged reuse or --format jsonl"
+        )
 
-    # Import here so the CLI fails gracefully if the package is broken
-    from . import TextSpitter
+    walk_filter = _WalkFilter(
+        include=args.include,
+        exclude=args.exclude,
+        extensions={
+            ext.strip().lstrip(".").lower()
+            for value in args.ext
+            for ext in value.split(",")
+            if ext.strip()
+        },
+        follow_symlinks=args.follow_symlinks,
+    )
 
-    parts: list[str] = []
-    errors: list[str] = []
+    normalizer = chunker = None
+    if args.format == "jsonl":
+        from . import TextChunker, TextNormalizer
 
-    for file_path in args.files:
-        p = Path(file_path)
-        if not p.exists():
-            errors.append(f"Error processing {file_path!r}: file not found")
-            continue
+        normalizer = TextNormalizer()
         try:
-            text = TextSpitter(filename=file_path)
-            parts.append(text)
-        except Exception as exc:
-            errors.append(f"Error processing {file_path!r}: {exc}")
+            chunker = TextChunker(
+                max_tokens=args.max_tokens,
+                min_tokens=args.min_tokens,
+                tokenizer=args.tokenizer,
+            )
+        except ValueError as exc:
+            parser.error(str(exc))
+
+    manifest = None
+    if args.incremental:
+        from . import _RUST_AVAILABLE, __version__
+        from ._manifest import Manifest
+
+        fingerprint = json.dumps(
+            [
+                __version__,
+                _RUST_AVAILABLE,
+                args.format,
+                normalizer.config() if normalizer else None,
+                chunker.config() if chunker else None,
+            ],
+            sort_keys=True,
+        )
+        manifest = Manifest(
+            args.incremental, fingerprint, keep_text=args.unchanged == "reuse"
+        )
+
+    paths: Iterable[str] = args.files
+    if args.files_from:
+        separator = b"\0" if args.null else b"\n"
+        paths = chain(paths, _read_list(args.files_from, separator))
 
-    result = "\n".join(parts)
+    inputs = _iter_inputs(paths, walk_filter)
+    if manifest is not None:
+        inputs = _skip_unchanged(inputs, manifest)
+    on_written = manifest.record if manifest is not None else None
 
-    if args.output:
-        Path(args.output).write_text(result, encoding="utf-8")
-    else:
-        print(result)
+    # Each file (or, for jsonl, each batch of files) is written and flushed
+    # as it completes, so memory does not grow with the run and an
+    # interrupted run keeps finished output
+    with (
+        (
+            open(args.output, "w", encoding="utf-8")
+            if args.output
+            else nullcontext()
+        ) as out,
+        manifest or nullcontext(),
+    ):
+        results = _extract(inputs, args.jobs, ordered=not args.as_completed)
+        if args.format == "jsonl":
+            failed = _write_jsonl(
+                results, out, normalizer, chunker, args.batch_size, on_written
+            )
+        else:
+            failed = _write_text(results, out, on_written)
 
-    if errors:
-        for err in errors:
-            print(err, file=sys.stderr)
+    if failed:
         sys.exit(1)
 
 
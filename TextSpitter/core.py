@@ -2,29 +2,252 @@
 Core application that contains the `FileExtractor` class object
 """
 
+import importlib.util
 import mimetypes
-from io import BytesIO
+import mmap
+from collections import deque
+from collections.abc import Iterator, Sequence
+from contextlib import ExitStack, closing, contextmanager
+from io import SEEK_CUR, SEEK_END, SEEK_SET, BytesIO, RawIOBase
 from pathlib import Path
 from tempfile import SpooledTemporaryFile
-from typing import IO, BinaryIO, cast
+from typing import IO, BinaryIO, NamedTuple, cast
 
-from docx import Document
+from TextSpitter import decode_auto
 
-from TextSpitter import detect_encoding
+from ._ooxml import iter_docx_paragraphs
+from .logger import logger
 
-# --- Module-level imports for optional PDF libraries ---
-try:
-    import pymupdf
-except ImportError:
-    pymupdf = None  # type: ignore[assignment]
 
-try:
-    import pypdf
-except ImportError:
-    pypdf = None  # type: ignore[assignment]
-# --- End of module-level imports ---
+class _LazyModule:
+    """
+    Module proxy that imports on first attribute access.
 
-from .logger import logger
+    The extraction backends take hundreds of milliseconds to import, so they
+    are only loaded once a file actually needs them. Truth-testing the proxy
+    loads it and is False if the module is not installed, which keeps the
+    `if not pymupdf:` availability checks working.
+    """
+
+    def __init__(self, name: str):
+        self._name = name
+        self._module = None
+        self._error: ImportError | None = None
+
+    def _load(self):
+        if self._module is None:
+            if self._error is not None:
+                raise self._error
+            try:
+                self._module = importlib.import_module(self._name)
+            except ImportError as e:
+                self._error = e
+                raise
+        return self._module
+
+    def __getattr__(self, attr: str):
+        return getattr(self._load(), attr)
+
+    def __bool__(self) -> bool:
+        try:
+            self._load()
+        except ImportError:
+            return False
+        return True
+
+    def installed(self) -> bool:
+        """Whether the module can be imported, without importing it."""
+        if self._module is not None:
+            return True
+        if self._error is not None:
+            return False
+        return importlib.util.find_spec(self._name) is not None
+
+
+# --- Lazily imported backends (PDF libraries are optional) ---
+pymupdf = _LazyModule("pymupdf")
+pypdf = _LazyModule("pypdf")
+docx = _LazyModule("docx")
+# --- End of backend imports ---
+
+
+def Document(stream: BinaryIO):  # noqa: N802 - mirrors docx.Document
+    """Open a python-docx document, importing python-docx on first use."""
+    return docx.Document(stream)
+
+
+# Per-process document opened by the PDF page-pool initializer
+_worker_pdf = None
+
+
+def _init_pdf_worker(source: str | bytes) -> None:
+    """Open the PDF once per worker process, from a path or raw bytes."""
+    global _worker_pdf
+    if isinstance(source, str):
+        _worker_pdf = pymupdf.open(source, filetype="pdf")
+    else:
+        _worker_pdf = pymupdf.open(stream=source, filetype="pdf")
+
+
+def _pdf_pages_text(start: int, stop: int) -> list[str]:
+    """Return the text of pages ``[start, stop)`` of the worker's document."""
+    return [_worker_pdf[i].get_text("text") for i in range(start, stop)]
+
+
+class PdfPage(NamedTuple):
+    """One page yielded by :meth:`FileExtractor.iter_pdf_pages`."""
+
+    number: int  # 0-based page index
+    text: str
+    backend: str | None  # "pymupdf", "pypdf", or None if every backend failed
+
+
+class _PyMuPDFBackend:
+    """PyMuPDF document opened from a bytes-like buffer."""
+
+    name = "pymupdf"
+    label = "PyMuPDF"
+
+    def __init__(self, contents: bytes | memoryview, stack: ExitStack):
+        if not pymupdf:  # Check if module-level import was successful
+            raise ImportError("pymupdf module not available or import failed.")
+        # PyMuPDF's Document constructor can take bytes or a memoryview
+        # directly via the 'stream' argument
+        self._doc = stack.enter_context(
+            pymupdf.open(stream=contents, filetype="pdf")
+        )
+
+    def __len__(self) -> int:
+        return len(self._doc)
+
+    def page_text(self, number: int) -> str:
+        return self._doc[number].get_text("text")
+
+
+class _PyPDFBackend:
+    """pypdf reader over a stream wrapping the buffer."""
+
+    name = "pypdf"
+    label = "PyPDF2"
+
+    def __init__(self, contents: bytes | memoryview, stack: ExitStack):
+        if not pypdf:  # Check if module-level import was successful
+            raise ImportError("pypdf module not available or import failed.")
+        # PyPDF2 needs a stream; memoryviews are read in place
+        stream = stack.enter_context(FileExtractor._open_stream(contents))
+        self._reader = pypdf.PdfReader(stream)
+
+    def __len__(self) -> int:
+        return len(self._reader.pages)
+
+    def page_text(self, number: int) -> str:
+        return self._reader.pages[number].extract_text() or ""
+
+
+class _PdfPageSource:
+    """
+    Per-page PDF extraction that fails over between backends.
+
+    Backends are opened lazily in preference order, so pypdf is only
+    parsed once PyMuPDF fails to open or fails on a page. A page that
+    fails is retried on the next backend alone; the following page goes
+    back to the preferred backend.
+    """
+
+    BACKENDS = (_PyMuPDFBackend, _PyPDFBackend)
+
+    def __init__(
+        self, contents: bytes | memoryview, stack: ExitStack, file_name: str
+    ):
+        self._contents = contents
+        self._stack = stack
+        self._file_name = file_name
+        self._pending = list(self.BACKENDS)
+        self._opened: list[_PyMuPDFBackend | _PyPDFBackend] = []
+
+    def backend(self, index: int) -> _PyMuPDFBackend | _PyPDFBackend | None:
+        """
+        The ``index``-th backend that opens successfully, or None once no
+        more backends can be opened. Raises only if none opens at all.
+        """
+        while len(self._opened) <= index and self._pending:
+            backend_cls = self._pending.pop(0)
+            try:
+                self._opened.append(backend_cls(self._contents, self._stack))
+            except Exception as e:
+                if self._pending:
+                    logger.warning(
+                        f"{backend_cls.label} failed ({e}), trying "
+                        f"{self._pending[0].label} for PDF: {self._file_name}"
+                    )
+                elif not self._opened:
+                    raise
+                else:
+                    logger.warning(
+                        f"{backend_cls.label} failed ({e}) for PDF: "
+                        f"{self._file_name}"
+                    )
+        return self._opened[index] if index < len(self._opened) else None
+
+    def page_count(self) -> int:
+        """Page count from the first backend that opens; raises if none do."""
+        return len(self.backend(0))
+
+    def extract(self, number: int) -> PdfPage:
+        """Extract one page, failing over to later backends on error."""
+        index = 0
+        while (backend := self.backend(index)) is not None:
+            try:
+                return PdfPage(number, backend.page_text(number), backend.name)
+            except Exception as e:
+                logger.warning(
+                    f"{backend.label} failed on page {number} ({e}) for PDF:"
+                    f" {self._file_name}"
+                )
+            index += 1
+        logger.error(
+            f"No PDF backend could extract page {number} of {self._file_name}"
+        )
+        return PdfPage(number, "", None)
+
+
+class _BufferReader(RawIOBase):
+    """
+    Seekable read-only file object over a buffer, without copying it.
+
+    pypdf and python-docx (via zipfile) need a file-like object; `mmap`
+    itself lacks `seekable()` before Python 3.13 and `BytesIO` copies
+    anything that is not `bytes`.
+    """
+
+    def __init__(self, view: memoryview):
+        self._view = view.cast("B")
+        self._pos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = SEEK_SET) -> int:
+        base = {SEEK_SET: 0, SEEK_CUR: self._pos, SEEK_END: len(self._view)}
+        self._pos = max(base[whence] + offset, 0)
+        return self._pos
+
+    def readinto(self, buffer) -> int:
+        chunk = self._view[self._pos : self._pos + len(buffer)]
+        n = len(chunk)
+        buffer[:n] = chunk
+        self._pos += n
+        return n
+
+    def close(self) -> None:
+        self._view.release()
+        super().close()
 
 
 class FileExtractor:
@@ -110,13 +333,63 @@ class FileExtractor:
         }
     )
 
+    # Extension -> MIME subtype, consulted before `mimetypes` so common files
+    # never trigger its first-call read of the system MIME databases
+    MIME_SUBTYPES: dict[str, str] = {
+        "pdf": "pdf",
+        "docx": "vnd.openxmlformats-officedocument.wordprocessingml.document",
+        "doc": "msword",
+        "xlsx": "vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        "xls": "vnd.ms-excel",
+        "pptx": "vnd.openxmlformats-officedocument.presentationml"
+        ".presentation",
+        "odt": "vnd.oasis.opendocument.text",
+        "rtf": "rtf",
+        "epub": "epub+zip",
+        "zip": "zip",
+        "txt": "plain",
+        "text": "plain",
+        "csv": "csv",
+        "tsv": "tab-separated-values",
+        "md": "markdown",
+        "markdown": "markdown",
+        "html": "html",
+        "htm": "html",
+        "xml": "xml",
+        "json": "json",
+        "js": "javascript",
+        "mjs": "javascript",
+        "css": "css",
+        "py": "x-python",
+        "c": "x-csrc",
+        "cpp": "x-c++src",
+        "java": "x-java",
+        "sh": "x-sh",
+    }
+
+    # Minimum page count before pdf_workers > 1 switches to the process pool
+    PDF_PARALLEL_MIN_PAGES: int = 200
+
     def __init__(
         self,
         file_obj: (
-            str | Path | IO | BytesIO | SpooledTemporaryFile | bytes | None
+            str
+            | Path
+            | IO
+            | BytesIO
+            | SpooledTemporaryFile
+            | bytes
+            | bytearray
+            | memoryview
+            | None
         ) = None,  # Expanded type hint
         filename: str | None = None,
         file_attr: str = "name",
+        use_mmap: bool = False,
+        pdf_workers: int = 1,
+        page_range: tuple[int, int | None] | None = None,
+        max_pages: int | None = None,
+        cache_pages: bool = False,
     ):
         """
         The extractor wrapper will initialize by assigning the filename to the
@@ -128,12 +401,48 @@ class FileExtractor:
         instance, the `filename` is used to determine the file extension and
         should not be a fully qualified path.
 
+        `bytearray` and `memoryview` inputs are read in place. With
+        `use_mmap=True`, path inputs are memory-mapped instead of read into a
+        `bytes` object, and the mapping is handed to the PDF/DOCX backends
+        and the encoding detectors without further copies.
+
+        With `pdf_workers > 1`, PDFs of at least `PDF_PARALLEL_MIN_PAGES`
+        pages are extracted by a process pool (see :meth:`pdf_file_read`).
+
+        `page_range` is a 0-based, half-open `(start, stop)` pair with slice
+        semantics (negative indices count from the end, `stop=None` means
+        the last page) and `max_pages` caps the number of pages extracted
+        after the range is applied. Pages outside the selection are never
+        parsed, by either PDF backend. With `cache_pages=True`, extracted
+        PDF pages are kept for later calls (see :meth:`iter_pdf_pages`).
+
         Args:
             file_obj: str | Path | IO | BytesIO | SpooledTemporaryFile |
-            bytes | None
+            bytes | bytearray | memoryview | None
             filename: : str | None
             file_attr: str
+            use_mmap: bool
+            pdf_workers: int
+            page_range: tuple[int, int | None] | None
+            max_pages: int | None
+            cache_pages: bool
+
+        Raises:
+            ValueError: If `max_pages` is negative.
         """
+        if max_pages is not None and max_pages < 0:
+            raise ValueError(f"max_pages must be >= 0, got {max_pages}")
+        self.use_mmap = use_mmap
+        self.pdf_workers = pdf_workers
+        self.page_range = page_range
+        self.max_pages = max_pages
+        self.cache_pages = cache_pages
+        # Set by the readers when they fall back to returning "" (or, for
+        # PDFs, an empty page), so callers such as ResultCache can tell a
+        # failed extraction from an empty document
+        self.read_error: str | None = None
+        self._pdf_pages: dict[int, PdfPage] = {}
+        self._pdf_page_count: int | None = None
 
         if filename and not file_obj:
             self.file = Path(filename)
@@ -169,7 +478,16 @@ class FileExtractor:
             else:
                 # If file_obj is a stream without a name and no filename is
                 # provided
-                if isinstance(file_obj, (BytesIO, SpooledTemporaryFile, bytes)):
+                if isinstance(
+                    file_obj,
+                    (
+                        BytesIO,
+                        SpooledTemporaryFile,
+                        bytes,
+                        bytearray,
+                        memoryview,
+                    ),
+                ):
                     raise ValueError(
                         "A 'filename' with an extension is required when "
                         "'file_obj' is a stream or bytes "
@@ -186,14 +504,22 @@ class FileExtractor:
                 "Either 'file_obj' or 'filename' must be provided."
             )
 
+    def config(self) -> dict:
+        """Settings that affect the extracted text, e.g. for cache keys."""
+        return {
+            "file_ext": self.file_ext,
+            "page_range": self.page_range,
+            "max_pages": self.max_pages,
+        }
+
     @staticmethod
     def get_file_type(
         file_name_or_path: str | Path,
     ) -> str:  # Added return type hint
         """
         A static method that guesses the mime type for a given file object.
-        The return value is taken from the sliced value from
-        `mimetypes.guess_type`
+        Known extensions are looked up in `MIME_SUBTYPES`; anything else
+        is taken from the sliced value from `mimetypes.guess_type`.
         Args:
             file_name_or_path: str | Path
 
@@ -201,39 +527,19 @@ class FileExtractor:
             str: The subtype of the mime type (e.g., 'pdf',
             'vnd.openxmlformats-officedocument.wordprocessingml.document')
         """
-        mime_type, _ = mimetypes.guess_type(
-            str(file_name_or_path)
-        )  # Ensure it's a string for guess_type
-        if mime_type:
-            return mime_type.split("/")[1]
-        # Fallback if mimetypes can't guess, rely on extension (already in
-        # self.file_ext)
         if isinstance(file_name_or_path, Path):
             ext = file_name_or_path.suffix[1:].lower()
         else:  # str
             ext = str(file_name_or_path).split(".")[-1].lower()
+        if ext in FileExtractor.MIME_SUBTYPES:
+            return FileExtractor.MIME_SUBTYPES[ext]
 
-        # Map common extensions to mime subtypes if mimetypes fails
-        ext_to_mime_subtype = {
-            "docx": "vnd.openxmlformats-officedocument.wordprocessingml"
-            ".document",
-            "pdf": "pdf",
-            "txt": "plain",
-            "csv": "csv",
-            # Add programming language mappings
-            "py": "x-python",
-            "js": "javascript",
-            "java": "x-java-source",
-            "c": "x-c",
-            "cpp": "x-c++",
-            "html": "html",
-            "css": "css",
-            "json": "json",
-            "xml": "xml",
-        }
-        return ext_to_mime_subtype.get(
-            ext, "octet-stream"
-        )  # Default to octet-stream
+        mime_type, _ = mimetypes.guess_type(
+            str(file_name_or_path)
+        )  # Ensure it's a string for guess_type
+        if mime_type:
+            return mime_type.split("/")[1]
+        return "octet-stream"  # Default to octet-stream
 
     @staticmethod
     def is_programming_language_file(file_ext: str) -> bool:
@@ -290,6 +596,9 @@ class FileExtractor:
         elif isinstance(self.file, bytes):
             return self.file  # Already bytes
 
+        elif isinstance(self.file, (bytearray, memoryview)):
+            return bytes(self.file)
+
         else:
             # This path should ideally not be reached if __init__ correctly
             # sets self.file
@@ -300,6 +609,61 @@ class FileExtractor:
                 f"nor is it a Path or bytes."
             )
 
+    @contextmanager
+    def open_buffer(self) -> Iterator[bytes | memoryview]:
+        """
+        Context manager yielding the file contents as a bytes-like object
+        with as few copies as possible.
+
+        With `use_mmap`, a path is memory-mapped read-only and a
+        `memoryview` of the mapping is yielded; `bytearray`/`memoryview`
+        inputs are yielded as a `memoryview` of the caller's buffer. Anything
+        else falls back to :meth:`get_contents`. The buffer is only valid
+        inside the `with` block.
+        """
+        if self.use_mmap and isinstance(self.file, Path):
+            with self.file.open("rb") as f:
+                try:
+                    mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                except ValueError:  # empty files cannot be mapped
+                    mapped = None
+            if mapped is not None:
+                view = memoryview(mapped)
+                try:
+                    yield view
+                finally:
+                    self._release(view, mapped)
+                return
+        if isinstance(self.file, (bytearray, memoryview)):
+            yield memoryview(self.file)
+            return
+        yield self.get_contents()
+
+    def _release(self, view: memoryview, mapped: mmap.mmap) -> None:
+        """Unmap after use unless a backend still holds an export."""
+        try:
+            view.release()
+            mapped.close()
+        except BufferError:
+            # The mapping is closed when the last export is collected.
+            logger.debug(f"Deferred unmapping {self.file_name}")
+
+    @staticmethod
+    @contextmanager
+    def _open_stream(contents: bytes | memoryview) -> Iterator[BinaryIO]:
+        """
+        Wrap a buffer from :meth:`open_buffer` as a seekable binary stream
+        for backends that need a file object (pypdf, python-docx).
+
+        `bytes` share their buffer with `BytesIO`; memoryviews (including
+        memory-mapped files) are read in place.
+        """
+        if isinstance(contents, memoryview):
+            with _BufferReader(contents) as reader:
+                yield cast(BinaryIO, reader)
+        else:
+            yield BytesIO(contents)
+
     def code_file_read(self) -> str:
         """
         Reads contents from programming language files (.py, .js, .java, etc.)
@@ -308,20 +672,10 @@ class FileExtractor:
         Returns:
             str: The file content as a string
         """
-        contents_bytes = self.get_contents()
-        encoding = detect_encoding(contents_bytes)
-        try:
-            content = contents_bytes.decode(encoding)
-            logger.info(
-                f"Successfully decoded {self.file_name} using {encoding}"
-            )
-            return content
-        except (UnicodeDecodeError, LookupError):
-            logger.warning(
-                f"Could not decode {self.file_name} with detected encoding "
-                f"'{encoding}', falling back to utf-8 with replacement."
-            )
-            return contents_bytes.decode("utf-8", errors="replace")
+        with self.open_buffer() as contents:
+            content, encoding = decode_auto(contents)
+        logger.info(f"Successfully decoded {self.file_name} using {encoding}")
+        return content
 
     def pdf_file_read(self) -> str:  # Added return type hint
         """
@@ -330,100 +684,230 @@ class FileExtractor:
         instances, the module relies on PyPDF to extract text data. However,
         because of the likelihood of white spaces being rampant in the
         extracted string data, those characters get filtered out.
-        """
-        contents = self.get_contents()  # This should now reliably return bytes
-        text = ""  # Default to empty string
 
+        Pages come from :meth:`iter_pdf_pages`.
+        """
         try:
-            if not pymupdf:  # Check if module-level import was successful
-                raise ImportError(
-                    "pymupdf module not available or import failed."
-                )
-
-            # PyMuPDF's Document constructor can take bytes directly via the
-            # 'stream' argument
-            with pymupdf.open(
-                stream=contents, filetype="pdf"
-            ) as pdf_file:  # Use with for resource management
-                raw_text = [page.get_text("text") for page in pdf_file]
-            text = "".join(raw_text)
-        except Exception as e_pymupdf:
-            logger.warning(
-                f"PyMuPDF failed ({e_pymupdf}), trying PyPDF2 for PDF:"
-                f" {self.file_name}"
+            return "".join(page.text for page in self.iter_pdf_pages())
+        except Exception as e_pypdf:
+            logger.error(
+                f"Both PyMuPDF and PyPDF2 failed for PDF "
+                f"{self.file_name}: {e_pypdf}"
             )
-            try:
-                if not pypdf:  # Check if module-level import was successful
-                    raise ImportError(
-                        "pypdf module not available or import failed."
-                    )
+            self.read_error = f"{type(e_pypdf).__name__}: {e_pypdf}"
+            return ""
 
-                # PyPDF2 needs a stream, so wrap bytes in BytesIO
-                pdf_stream = BytesIO(contents)
-                pdf_reader = pypdf.PdfReader(pdf_stream)
-                raw_text = [
-                    page.extract_text()
-                    for page in pdf_reader.pages
-                    if page.extract_text()  # Ensure text is not None or empty
-                ]
-                text = "".join(raw_text)
-            except Exception as e_pypdf:
-                logger.error(
-                    f"Both PyMuPDF and PyPDF2 failed for PDF "
-                    f"{self.file_name}: {e_pypdf}"
+    def iter_pdf_pages(self) -> Iterator[PdfPage]:
+        """
+        Lazily yield the text of each PDF page as a :class:`PdfPage`.
+
+        Pages are extracted one at a time with PyMuPDF, so only the current
+        page's text is held in memory. Failover is per page: a page PyMuPDF
+        cannot extract is retried with PyPDF alone, and a document PyMuPDF
+        cannot open is read with PyPDF throughout. `PdfPage.backend` names
+        the backend that produced each page (None if every backend failed
+        on it). If no backend can open the document, the error is raised.
+        The input stays open until the iterator is exhausted or closed.
+
+        Each call parses a page at most once. With `cache_pages=True`,
+        extracted pages are also kept on the extractor, so repeated calls
+        never parse a page twice; this holds every page's text for the
+        extractor's lifetime, so it is off by default.
+
+        PyMuPDF documents cannot be shared between threads, so with
+        `pdf_workers > 1` large PDFs are split into contiguous page ranges
+        that a process pool extracts, each worker opening the document once
+        (by path where available); pages are still yielded in order, as
+        their range arrives, and only a few ranges per worker are in flight.
+        If the pool fails, the remaining pages are read serially.
+
+        Yields:
+            PdfPage
+        """
+        if self._pdf_page_count is not None:
+            selected = self._page_selection(self._pdf_page_count)
+            if all(number in self._pdf_pages for number in selected):
+                for number in selected:
+                    page = self._pdf_pages[number]
+                    self._check_page(page)
+                    yield page
+                return
+
+        # Backends read lazily, so all parsing happens inside the buffer scope
+        with self.open_buffer() as contents, ExitStack() as stack:
+            source = _PdfPageSource(contents, stack, self.file_name)
+            page_count = source.page_count()
+            if self.cache_pages:
+                self._pdf_page_count = page_count
+            selected = self._page_selection(page_count)
+
+            parallel = None
+            missing = [n for n in selected if n not in self._pdf_pages]
+            if (
+                self.pdf_workers > 1
+                and len(missing) >= self.PDF_PARALLEL_MIN_PAGES
+                and isinstance(source.backend(0), _PyMuPDFBackend)
+            ):
+                # Only uncached pages, so none is parsed twice
+                parallel = stack.enter_context(
+                    closing(self._pdf_text_parallel(contents, missing))
                 )
-                # text remains "" as initialized
-        return text
+
+            for number in selected:
+                page = self._pdf_pages.get(number)
+                if page is None:
+                    text = None
+                    if parallel is not None:
+                        try:
+                            _, text = next(parallel)  # pages of `missing`
+                        except Exception as e:
+                            logger.warning(
+                                f"Parallel PDF extraction failed ({e}), "
+                                f"reading the rest of {self.file_name} "
+                                f"serially"
+                            )
+                            parallel = None
+                    if text is not None:
+                        page = PdfPage(number, text, _PyMuPDFBackend.name)
+                    else:
+                        page = source.extract(number)
+                    if self.cache_pages:
+                        self._pdf_pages[number] = page
+                self._check_page(page)
+                yield page
+
+    def _check_page(self, page: PdfPage) -> None:
+        """Record a page that every backend failed on in `read_error`."""
+        if page.backend is None:
+            self.read_error = f"no PDF backend could extract page {page.number}"
+
+    def _page_selection(self, page_count: int) -> range:
+        """Page indices selected by `page_range` and `max_pages`."""
+        pages = range(page_count)
+        if self.page_range is not None:
+            start, stop = self.page_range
+            pages = pages[start:stop]
+        if self.max_pages is not None:
+            pages = pages[: self.max_pages]
+        return pages
+
+    def _pdf_text_parallel(
+        self, contents: bytes | memoryview, pages: Sequence[int]
+    ) -> Iterator[tuple[int, str]]:
+        """
+        Yield ``(number, text)`` for each of `pages` (ascending) from a
+        process pool, in order; raises if the pool fails, so the caller can
+        read the remaining pages serially.
+
+        Workers open the file by path when there is one (including mmap
+        mode) and otherwise receive the bytes once, via the pool
+        initializer. Pages are split into contiguous ranges, a few per
+        worker to even out slow pages, and at most two ranges per worker
+        are submitted or waiting to be yielded at once, so memory is
+        bounded by the ranges in flight rather than the document.
+        """
+        source = (
+            str(self.file) if isinstance(self.file, Path) else bytes(contents)
+        )
+        # Deferred: the process-pool machinery is slow to import
+        from concurrent.futures import ProcessPoolExecutor
+
+        workers = min(self.pdf_workers, len(pages))
+        step = -(-len(pages) // (workers * 4))  # ceil division
+        spans: list[list[int]] = []  # [start, stop) runs of at most `step`
+        for number in pages:
+            if (
+                spans
+                and spans[-1][1] == number
+                and number - spans[-1][0] < step
+            ):
+                spans[-1][1] += 1
+            else:
+                spans.append([number, number + 1])
+
+        queued = iter(spans)
+        in_flight: deque = deque()  # (start, future), in page order
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_pdf_worker,
+            initargs=(source,),
+        ) as pool:
+            try:
+                for start, stop in queued:
+                    future = pool.submit(_pdf_pages_text, start, stop)
+                    in_flight.append((start, future))
+                    if len(in_flight) >= workers * 2:
+                        break
+                while in_flight:
+                    start, future = in_flight.popleft()
+                    texts = future.result()
+                    span = next(queued, None)
+                    if span is not None:
+                        future = pool.submit(_pdf_pages_text, *span)
+                        in_flight.append((span[0], future))
+                    yield from enumerate(texts, start)
+            finally:
+                # Closed early or failed: don't run the remaining ranges
+                for _, future in in_flight:
+                    future.cancel()
 
     def docx_file_read(self) -> str:  # Added return type hint
         """
         Reads contents from an MS Word file, extracts text data from paragraph
         objects, and then concatenates them to form a returnable string value.
+
+        `word/document.xml` is streamed through an incremental XML parser
+        (see :mod:`TextSpitter._ooxml`), which also picks up table cell text;
+        python-docx is only used if that fails.
+
         Returns:
             str
         """
-        contents = self.get_contents()  # This should now reliably return bytes
-
-        # python-docx's Document constructor needs a file-like object (stream)
-        # or a path to a .docx file. We have bytes, so wrap in BytesIO.
+        # Both readers need a file-like object (stream), so wrap the buffer.
         try:
-            f_stream = BytesIO(contents)
-            document = Document(f_stream)
+            with (
+                self.open_buffer() as contents,
+                self._open_stream(contents) as f_stream,
+            ):
+                try:
+                    return "\n".join(iter_docx_paragraphs(f_stream))
+                except Exception as e_stream:
+                    logger.debug(
+                        f"Streaming DOCX parse failed ({e_stream}), using "
+                        f"python-docx for {self.file_name}"
+                    )
+                f_stream.seek(0)
+                document = Document(f_stream)
             raw_text = [p.text for p in document.paragraphs]
             text = "\n".join(raw_text)
         except Exception as e:
             logger.error(
                 f"Error reading DOCX file {self.file_name}: {e}", exc_info=True
             )
+            self.read_error = f"{type(e).__name__}: {e}"
             text = ""  # Return empty string on failure
         return text
 
-    def _decode_bytes(self, data: bytes, label: str) -> str:
+    def _decode_bytes(self, data: bytes | memoryview, label: str) -> str:
         """
-        Decode bytes to str, trying UTF-8, cp1252, then latin-1, then UTF-8
-        with replacement characters.
+        Decode bytes to str with :func:`TextSpitter.decode_auto`, which
+        detects the encoding and decodes in a single call instead of trying
+        codecs one after another.
 
-        cp1252 is tried before latin-1 so Windows smart-quote bytes (0x80-0x9F)
-        decode to printable characters instead of C1 control characters.
-        latin-1 always succeeds and acts as the final deterministic fallback.
+        Valid UTF-8 (with or without a BOM) is decoded as such; anything else
+        is decoded with the detected codec (cp1252/latin-1 on the fallback
+        path), with undecodable bytes replaced rather than raising.
 
         Args:
             data: Raw bytes to decode.
-            label: Human-readable label used in log/warning messages.
+            label: Human-readable label used in log messages.
 
         Returns:
             str
         """
-        for enc in ("utf-8", "cp1252", "latin-1"):
-            try:
-                return data.decode(enc)
-            except (UnicodeDecodeError, LookupError):
-                continue
-        logger.warning(
-            f"Could not decode {label} with utf-8, cp1252, or latin-1, "
-            f"using utf-8 with replacement characters."
-        )
-        return data.decode("utf-8", errors="replace")
+        text, encoding = decode_auto(data)
+        logger.debug(f"Decoded {label} using {encoding}")
+        return text
 
     def text_file_read(self) -> str:
         """
@@ -433,14 +917,16 @@ class FileExtractor:
             str
         """
         try:
-            return self._decode_bytes(
-                self.get_contents(), f"text file {self.file_name}"
-            )
+            with self.open_buffer() as contents:
+                return self._decode_bytes(
+                    contents, f"text file {self.file_name}"
+                )
         except Exception as e:
             logger.error(
                 f"Error reading text file {self.file_name}: {e}",
                 exc_info=True,
             )
+            self.read_error = f"{type(e).__name__}: {e}"
             return ""
 
     def csv_file_read(self) -> str:
@@ -451,12 +937,14 @@ class FileExtractor:
             str
         """
         try:
-            return self._decode_bytes(
-                self.get_contents(), f"CSV file {self.file_name}"
-            )
+            with self.open_buffer() as contents:
+                return self._decode_bytes(
+                    contents, f"CSV file {self.file_name}"
+                )
         except Exception as e:
             logger.error(
                 f"Error reading CSV file {self.file_name}: {e}",
                 exc_info=True,
             )
+            self.read_error = f"{type(e).__name__}: {e}"
             return ""
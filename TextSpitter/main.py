@@ -3,10 +3,14 @@ The main application to host the `WordLoader` object.
 """
 
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from .core import FileExtractor
 from .logger import logger
 
+if TYPE_CHECKING:
+    from .cache import ResultCache
+
 
 class WordLoader:
     """
@@ -49,11 +53,23 @@ class WordLoader:
         file_obj: str | Path | None = None,
         filename: str | None = None,
         file_attr: str = "name",
+        use_mmap: bool = False,
+        pdf_workers: int = 1,
+        page_range: tuple[int, int | None] | None = None,
+        max_pages: int | None = None,
+        cache: "ResultCache | None" = None,
     ):
+        self.cache = cache
         if isinstance(file_obj, str):
             file_obj = Path(file_obj)
         self.file = FileExtractor(
-            file_obj=file_obj, filename=filename, file_attr=file_attr
+            file_obj=file_obj,
+            filename=filename,
+            file_attr=file_attr,
+            use_mmap=use_mmap,
+            pdf_workers=pdf_workers,
+            page_range=page_range,
+            max_pages=max_pages,
         )
 
     def file_load(self) -> str:
@@ -62,9 +78,18 @@ class WordLoader:
         sent to the appropriate text extraction function based on the
         appropriate file mimetype.
 
+        With a `cache`, previously extracted text for identical contents
+        and settings is returned without extracting again.
+
         Returns:
             str
         """
+        if self.cache is not None:
+            return self.cache.text(self.file, self._file_load)
+        return self._file_load()
+
+    def _file_load(self) -> str:
+        """Dispatch to the reader for the file's type (uncached)."""
         file_type = self.file.file_ext.lower()
 
         # Check if it's a specific supported format first
@@ -1,19 +1,15 @@
 use pyo3::prelude::*;
+use pyo3::types::PyDict;
 use rayon::prelude::*;
+use std::cell::Cell;
 use std::collections::HashMap;
-use tiktoken_rs::{get_bpe_from_model, CoreBPE};
-
-fn load_bpe(name: &str) -> Result<CoreBPE, String> {
-    let result = match name {
-        "cl100k_base" => tiktoken_rs::cl100k_base(),
-        "o200k_base"  => tiktoken_rs::o200k_base(),
-        "r50k_base"   => tiktoken_rs::r50k_base(),
-        "p50k_base"   => tiktoken_rs::p50k_base(),
-        "p50k_edit"   => tiktoken_rs::p50k_edit(),
-        other         => get_bpe_from_model(other),
-    };
-    result.map_err(|e| e.to_string())
-}
+use std::sync::mpsc::{self, Receiver};
+use std::sync::{Arc, Mutex};
+use std::thread;
+use tiktoken_rs::CoreBPE;
+
+use crate::columnar::ChunkBatch;
+use crate::registry::get_bpe;
 
 /// A single chunk produced by ``TextChunker``.
 #[pyclass(get_all)]
@@ -39,6 +35,40 @@ pub struct Chunk {
 
 #[pymethods]
 impl Chunk {
+    #[new]
+    #[pyo3(signature = (
+        text,
+        token_count,
+        char_start,
+        char_end,
+        section_title,
+        chunk_index,
+        total_chunks,
+        metadata,
+    ))]
+    #[allow(clippy::too_many_arguments)]
+    fn new(
+        text: String,
+        token_count: usize,
+        char_start: usize,
+        char_end: usize,
+        section_title: Option<String>,
+        chunk_index: usize,
+        total_chunks: Option<usize>,
+        metadata: HashMap<String, bool>,
+    ) -> Self {
+        Self {
+            text,
+            token_count,
+            char_start,
+            char_end,
+            section_title,
+            chunk_index,
+            total_chunks,
+            metadata,
+        }
+    }
+
     fn __repr__(&self) -> String {
         format!(
             "Chunk(index={}/{:?}, tokens={}, chars={}..{})",
@@ -51,6 +81,28 @@ impl Chunk {
     }
 }
 
+/// Finished chunks buffered ahead of a ``chunk_iter`` consumer.
+const CHUNK_ITER_BUFFER: usize = 16;
+
+/// Iterator returned by ``TextChunker.chunk_iter``.
+#[pyclass]
+pub struct ChunkIter {
+    rx: Mutex<Receiver<Chunk>>,
+}
+
+#[pymethods]
+impl ChunkIter {
+    fn __iter__(slf: PyRef<'_, Self>) -> PyRef<'_, Self> {
+        slf
+    }
+
+    fn __next__(&self, py: Python<'_>) -> Option<Chunk> {
+        let rx = &self.rx;
+        // Wait for the producer without holding the GIL.
+        py.allow_threads(|| rx.lock().unwrap_or_else(|e| e.into_inner()).recv().ok())
+    }
+}
+
 #[pyclass]
 pub struct TextChunker {
     max_tokens: usize,
@@ -58,6 +110,7 @@ pub struct TextChunker {
     tokenizer: String,
     preserve_tables: bool,
     section_patterns: Vec<String>,
+    bpe: Arc<CoreBPE>,
 }
 
 #[pymethods]
@@ -82,10 +135,22 @@ impl TextChunker {
                 "min_tokens ({min_tokens}) must be <= max_tokens ({max_tokens})"
             )));
         }
-        // Validate tokenizer name at construction time.
-        load_bpe(&tokenizer)
+        // Validate tokenizer name at construction time; the shared BPE is
+        // reused by every subsequent call on this instance.
+        let bpe = get_bpe(&tokenizer)
             .map_err(|e| pyo3::exceptions::PyValueError::new_err(e))?;
-        Ok(Self { max_tokens, min_tokens, tokenizer, preserve_tables, section_patterns })
+        Ok(Self { max_tokens, min_tokens, tokenizer, preserve_tables, section_patterns, bpe })
+    }
+
+    /// Return the constructor arguments as a dict, e.g. for cache keys.
+    pub fn config<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyDict>> {
+        let config = PyDict::new_bound(py);
+        config.set_item("max_tokens", self.max_tokens)?;
+        config.set_item("min_tokens", self.min_tokens)?;
+        config.set_item("tokenizer", &self.tokenizer)?;
+        config.set_item("preserve_tables", self.preserve_tables)?;
+        config.set_item("section_patterns", self.section_patterns.clone())?;
+        Ok(config)
     }
 
     /// Chunk text into a list of ``Chunk`` objects.
@@ -99,30 +164,55 @@ impl TextChunker {
         }).collect())
     }
 
+    /// Lazily chunk text, yielding each ``Chunk`` as soon as it is complete.
+    ///
+    /// Segmentation and token counting run on a background thread without
+    /// the GIL; at most ``CHUNK_ITER_BUFFER`` finished chunks are held ahead
+    /// of the consumer. ``total_chunks`` is left as ``None``.
+    pub fn chunk_iter(&self, text: String) -> ChunkIter {
+        let (tx, rx) = mpsc::sync_channel::<Chunk>(CHUNK_ITER_BUFFER);
+        let bpe = Arc::clone(&self.bpe);
+        let max_tokens = self.max_tokens;
+        let section_re = self.build_section_regex();
+        let table_re = self.build_table_regex();
+
+        thread::spawn(move || {
+            let mut builder = ChunkBuilder::new(&bpe, max_tokens);
+            let mut index = 0;
+            // A failed send means the iterator was dropped; stop early.
+            let open = Cell::new(true);
+            let mut emit = |mut chunk: Chunk| {
+                if open.get() {
+                    chunk.chunk_index = index;
+                    index += 1;
+                    open.set(tx.send(chunk).is_ok());
+                }
+            };
+            for_each_unit(&text, table_re.as_ref(), section_re.as_ref(), &mut |unit| {
+                builder.push(unit, &mut emit);
+                open.get()
+            });
+            builder.finish(&mut emit);
+        });
+
+        ChunkIter { rx: Mutex::new(rx) }
+    }
+
     /// Chunk a batch of texts in parallel (GIL released).
+    ///
+    /// Returns ``list[list[Chunk]]``, or a columnar ``ChunkBatch`` when
+    /// ``columnar=True`` (one Python object instead of one per chunk).
+    #[pyo3(signature = (texts, columnar = false))]
     pub fn chunk_batch(
         &self,
         py: Python<'_>,
         texts: Vec<String>,
-    ) -> PyResult<Vec<Vec<Chunk>>> {
-        // Capture config for use inside the thread closure.
-        let max_tokens = self.max_tokens;
-        let min_tokens = self.min_tokens;
-        let tokenizer = self.tokenizer.clone();
-        let preserve_tables = self.preserve_tables;
-        let section_patterns = self.section_patterns.clone();
-
-        py.allow_threads(|| {
+        columnar: bool,
+    ) -> PyResult<PyObject> {
+        let docs = py.allow_threads(|| {
             texts.par_iter()
                 .map(|text| {
-                    let chunker = TextChunker {
-                        max_tokens,
-                        min_tokens,
-                        tokenizer: tokenizer.clone(),
-                        preserve_tables,
-                        section_patterns: section_patterns.clone(),
-                    };
-                    let chunks = chunker.split(text)?;
+                    let chunks = self.split(text)?;
                     let total = chunks.len();
                     Ok(chunks.into_iter().enumerate().map(|(i, mut c)| {
                         c.chunk_index = i;
@@ -131,126 +221,42 @@ impl TextChunker {
                     }).collect::<Vec<_>>())
                 })
                 .collect::<PyResult<Vec<_>>>()
-        })
+        })?;
+
+        if columnar {
+            Ok(Py::new(py, ChunkBatch::from_documents(py, docs)?)?.into_py(py))
+        } else {
+            Ok(docs.into_py(py))
+        }
     }
 }
 
 impl TextChunker {
     fn split(&self, text: &str) -> PyResult<Vec<Chunk>> {
-        let bpe = load_bpe(&self.tokenizer)
-            .map_err(|e| pyo3::exceptions::PyValueError::new_err(e))?;
+        let bpe: &CoreBPE = &self.bpe;
 
         let section_re = self.build_section_regex();
-        let table_re = if self.preserve_tables {
-            Some(regex::Regex::new(r"(?m)^\|.+\|[ \t]*$").unwrap())
-        } else {
-            None
-        };
+        let table_re = self.build_table_regex();
 
         // Split text into logical units: tables (atomic) and paragraph blocks.
         let units = segment_units(text, table_re.as_ref(), section_re.as_ref());
 
         let mut chunks: Vec<Chunk> = Vec::new();
-        let mut current_text = String::new();
-        let mut current_start: usize = 0; // char offset
-        let mut current_section: Option<String> = None;
-        let mut char_cursor: usize = 0;
-
+        let mut emit = |chunk: Chunk| chunks.push(chunk);
+        let mut builder = ChunkBuilder::new(bpe, self.max_tokens);
         for unit in units {
-            let unit_tokens = bpe.encode_with_special_tokens(&unit.text).len();
-
-            // If this unit alone exceeds max_tokens, emit it as an oversized chunk.
-            if unit_tokens > self.max_tokens {
-                // Flush any pending content first.
-                if !current_text.is_empty() {
-                    chunks.push(self.make_chunk(
-                        &current_text,
-                        &bpe,
-                        current_start,
-                        char_cursor,
-                        current_section.clone(),
-                        false,
-                    ));
-                    current_text.clear();
-                    current_start = char_cursor;
-                }
-                let unit_len: usize = unit.text.chars().count();
-                chunks.push(self.make_chunk(
-                    &unit.text,
-                    &bpe,
-                    char_cursor,
-                    char_cursor + unit_len,
-                    unit.section_title.or(current_section.clone()),
-                    true, // oversized
-                ));
-                char_cursor += unit_len;
-                continue;
-            }
-
-            let pending_tokens = bpe.encode_with_special_tokens(&current_text).len();
-
-            // Always flush on overflow — max_tokens is a hard cap; min_tokens
-            // is a soft target that must not allow chunks to exceed max_tokens.
-            if pending_tokens + unit_tokens > self.max_tokens && !current_text.is_empty() {
-                chunks.push(self.make_chunk(
-                    &current_text,
-                    &bpe,
-                    current_start,
-                    char_cursor,
-                    current_section.clone(),
-                    false,
-                ));
-                current_text.clear();
-                current_start = char_cursor;
-            }
-
-            if let Some(title) = &unit.section_title {
-                current_section = Some(title.clone());
-            }
-
-            let unit_char_len = unit.text.chars().count();
-            current_text.push_str(&unit.text);
-            char_cursor += unit_char_len;
-        }
-
-        // Flush any remaining content.
-        if !current_text.is_empty() {
-            chunks.push(self.make_chunk(
-                &current_text,
-                &bpe,
-                current_start,
-                char_cursor,
-                current_section,
-                false,
-            ));
+            builder.push(unit, &mut emit);
         }
+        builder.finish(&mut emit);
 
         Ok(chunks)
     }
 
-    fn make_chunk(
-        &self,
-        text: &str,
-        bpe: &tiktoken_rs::CoreBPE,
-        char_start: usize,
-        char_end: usize,
-        section_title: Option<String>,
-        oversized: bool,
-    ) -> Chunk {
-        let token_count = bpe.encode_with_special_tokens(text).len();
-        let mut metadata = HashMap::new();
-        if oversized {
-            metadata.insert("oversized".to_string(), true);
-        }
-        Chunk {
-            text: text.to_string(),
-            token_count,
-            char_start,
-            char_end,
-            section_title,
-            chunk_index: 0,      // set by caller
-            total_chunks: None,  // set by caller
-            metadata,
+    fn build_table_regex(&self) -> Option<regex::Regex> {
+        if self.preserve_tables {
+            Some(regex::Regex::new(r"(?m)^\|.+\|[ \t]*$").unwrap())
+        } else {
+            None
         }
     }
 
@@ -272,6 +278,193 @@ struct Unit {
     section_title: Option<String>,
 }
 
+/// Words of context kept on each side of a unit junction when correcting the
+/// running token total. The pre-tokenizer pieces that BPE merges within
+/// rarely span more than one whitespace-delimited word, so two words on each
+/// side usually capture every piece the junction changes.
+const JUNCTION_WORDS: usize = 2;
+
+/// Assembles units into chunks, encoding each unit exactly once.
+///
+/// The running total approximates ``encode(current_text).len()``: adding a
+/// unit adds its own token count plus the (usually zero, occasionally
+/// negative) difference BPE makes at the junction, measured on a few words
+/// either side instead of the whole buffer. This is not guaranteed to match
+/// a re-encode: if the pre-tokenizer splits the junction's context
+/// differently from the same span inside the full buffer (long whitespace or
+/// punctuation runs, special tokens), the total can be off by a few tokens,
+/// and with it a chunk's ``token_count`` and whether it stays within
+/// ``max_tokens``. Without whitespace near the junction, the context grows to
+/// the whole unit and buffer, which is exact but no cheaper than
+/// re-encoding.
+struct ChunkBuilder<'a> {
+    bpe: &'a CoreBPE,
+    max_tokens: usize,
+    current_text: String,
+    current_tokens: usize,
+    current_start: usize, // char offset
+    current_section: Option<String>,
+    char_cursor: usize,
+}
+
+impl<'a> ChunkBuilder<'a> {
+    fn new(bpe: &'a CoreBPE, max_tokens: usize) -> Self {
+        Self {
+            bpe,
+            max_tokens,
+            current_text: String::new(),
+            current_tokens: 0,
+            current_start: 0,
+            current_section: None,
+            char_cursor: 0,
+        }
+    }
+
+    /// Add one unit, passing any chunks it completes to ``emit``.
+    fn push(&mut self, unit: Unit, emit: &mut impl FnMut(Chunk)) {
+        let unit_tokens = self.bpe.encode_with_special_tokens(&unit.text).len();
+        let unit_char_len = unit.text.chars().count();
+
+        // If this unit alone exceeds max_tokens, emit it as an oversized chunk.
+        if unit_tokens > self.max_tokens {
+            // Flush any pending content first.
+            self.flush(emit);
+            emit(make_chunk(
+                unit.text,
+                unit_tokens,
+                self.char_cursor,
+                self.char_cursor + unit_char_len,
+                unit.section_title.or(self.current_section.clone()),
+                true, // oversized
+            ));
+            self.char_cursor += unit_char_len;
+            return;
+        }
+
+        // Always flush on overflow — max_tokens is a hard cap; min_tokens
+        // is a soft target that must not allow chunks to exceed max_tokens.
+        if self.current_tokens + unit_tokens > self.max_tokens {
+            self.flush(emit);
+        }
+
+        if let Some(title) = &unit.section_title {
+            self.current_section = Some(title.clone());
+        }
+
+        self.current_tokens = if self.current_text.is_empty() {
+            unit_tokens
+        } else {
+            let delta = junction_delta(self.bpe, &self.current_text, &unit.text);
+            (self.current_tokens + unit_tokens).saturating_add_signed(delta)
+        };
+        self.current_text.push_str(&unit.text);
+        self.char_cursor += unit_char_len;
+    }
+
+    /// Emit any remaining content.
+    fn finish(mut self, emit: &mut impl FnMut(Chunk)) {
+        self.flush(emit);
+    }
+
+    fn flush(&mut self, emit: &mut impl FnMut(Chunk)) {
+        if self.current_text.is_empty() {
+            return;
+        }
+        emit(make_chunk(
+            std::mem::take(&mut self.current_text),
+            self.current_tokens,
+            self.current_start,
+            self.char_cursor,
+            self.current_section.clone(),
+            false,
+        ));
+        self.current_tokens = 0;
+        self.current_start = self.char_cursor;
+    }
+}
+
+fn make_chunk(
+    text: String,
+    token_count: usize,
+    char_start: usize,
+    char_end: usize,
+    section_title: Option<String>,
+    oversized: bool,
+) -> Chunk {
+    let mut metadata = HashMap::new();
+    if oversized {
+        metadata.insert("oversized".to_string(), true);
+    }
+    Chunk {
+        text,
+        token_count,
+        char_start,
+        char_end,
+        section_title,
+        chunk_index: 0,      // set by caller
+        total_chunks: None,  // set by caller
+        metadata,
+    }
+}
+
+/// Token-count change caused by appending ``next`` to ``prev``, estimated as
+/// ``encode(tail + head) - encode(tail) - encode(head)`` on the words
+/// adjacent to the junction (see [`ChunkBuilder`] for when this differs from
+/// ``encode(prev + next) - encode(prev) - encode(next)``).
+fn junction_delta(bpe: &CoreBPE, prev: &str, next: &str) -> isize {
+    let tail = &prev[tail_start(prev, JUNCTION_WORDS)..];
+    let head = &next[..head_end(next, JUNCTION_WORDS)];
+    let mut joined = String::with_capacity(tail.len() + head.len());
+    joined.push_str(tail);
+    joined.push_str(head);
+    let count = |s: &str| bpe.encode_with_special_tokens(s).len() as isize;
+    count(&joined) - count(tail) - count(head)
+}
+
+/// Byte offset where the last ``words`` whitespace-delimited words of ``s``
+/// begin, including the whitespace run in front of them.
+fn tail_start(s: &str, words: usize) -> usize {
+    let mut chars = s.char_indices().rev().peekable();
+    let mut start = s.len();
+    let mut skip = |want_ws: bool, start: &mut usize| {
+        while let Some(&(i, c)) = chars.peek() {
+            if c.is_whitespace() != want_ws {
+                break;
+            }
+            *start = i;
+            chars.next();
+        }
+    };
+    skip(true, &mut start);
+    for _ in 0..words {
+        skip(false, &mut start);
+        skip(true, &mut start);
+    }
+    start
+}
+
+/// Byte offset just past the first ``words`` whitespace-delimited words of
+/// ``s``, including the whitespace run that follows them.
+fn head_end(s: &str, words: usize) -> usize {
+    let mut chars = s.char_indices().peekable();
+    let mut end = 0;
+    let mut skip = |want_ws: bool, end: &mut usize| {
+        while let Some(&(i, c)) = chars.peek() {
+            if c.is_whitespace() != want_ws {
+                break;
+            }
+            *end = i + c.len_utf8();
+            chars.next();
+        }
+    };
+    skip(true, &mut end);
+    for _ in 0..words {
+        skip(false, &mut end);
+        skip(true, &mut end);
+    }
+    end
+}
+
 /// Segment text into atomic units: tables stay whole, text splits on
 /// paragraph breaks and section headers.
 fn segment_units(
@@ -280,6 +473,21 @@ fn segment_units(
     section_re: Option<&regex::Regex>,
 ) -> Vec<Unit> {
     let mut units = Vec::new();
+    for_each_unit(text, table_re, section_re, &mut |unit| {
+        units.push(unit);
+        true
+    });
+    units
+}
+
+/// Streaming form of ``segment_units``: hands each unit to ``f`` as soon as
+/// it is found. Stops early when ``f`` returns ``false``.
+fn for_each_unit(
+    text: &str,
+    table_re: Option<&regex::Regex>,
+    section_re: Option<&regex::Regex>,
+    f: &mut impl FnMut(Unit) -> bool,
+) {
     let mut remaining = text;
 
     while !remaining.is_empty() {
@@ -288,29 +496,33 @@ fn segment_units(
             // Emit any text before the table.
             if table_match.start() > 0 {
                 let before = &remaining[..table_match.start()];
-                push_text_units(before, section_re, &mut units);
+                if !push_text_units(before, section_re, f) {
+                    return;
+                }
             }
             // Find the end of the table block (last consecutive table line).
             let table_end = find_table_end(remaining, table_match.start());
-            units.push(Unit {
+            let table = Unit {
                 text: remaining[table_match.start()..table_end].to_string(),
                 section_title: None,
-            });
+            };
+            if !f(table) {
+                return;
+            }
             remaining = &remaining[table_end..];
         } else {
-            push_text_units(remaining, section_re, &mut units);
+            push_text_units(remaining, section_re, f);
             break;
         }
     }
-
-    units
 }
 
+/// Returns ``false`` if ``f`` asked to stop.
 fn push_text_units(
     text: &str,
     section_re: Option<&regex::Regex>,
-    units: &mut Vec<Unit>,
-) {
+    f: &mut impl FnMut(Unit) -> bool,
+) -> bool {
     let mut current_section: Option<String> = None;
 
     for para in text.split("\n\n") {
@@ -327,11 +539,15 @@ fn push_text_units(
             current_section = Some(t.clone());
         }
 
-        units.push(Unit {
+        let unit = Unit {
             text: format!("{trimmed}\n\n"),
             section_title: title.or(current_section.clone()),
-        });
+        };
+        if !f(unit) {
+            return false;
+        }
     }
+    true
 }
 
 fn find_table_end(text: &str, start: usize) -> usize {
@@ -353,3 +569,37 @@ fn find_table_end(text: &str, start: usize) -> usize {
     }
     (start + offset).min(text.len())
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn tail_and_head_windows() {
+        let prev = "hello world  foo bar\n\n";
+        assert_eq!(&prev[tail_start(prev, 2)..], "  foo bar\n\n");
+        assert_eq!(&prev[tail_start(prev, 9)..], prev);
+        let next = "\n  Next thing here";
+        assert_eq!(&next[..head_end(next, 2)], "\n  Next thing ");
+        assert_eq!(&next[..head_end(next, 9)], next);
+    }
+
+    #[test]
+    fn running_total_matches_full_encode() {
+        let bpe = get_bpe("r50k_base").unwrap();
+        let text = "SECTION 1: INTRO\n\nFirst para, ends with punctuation.\n\n\
+                    | a | b |\n| 1 | 2 |\n\nSecond   para 123\n\nthird.";
+        let units = segment_units(text, None, None);
+        let mut builder = ChunkBuilder::new(&bpe, usize::MAX / 2);
+        let mut buffer = String::new();
+        for unit in units {
+            buffer.push_str(&unit.text);
+            builder.push(unit, &mut |_| {});
+            assert_eq!(
+                builder.current_tokens,
+                bpe.encode_with_special_tokens(&buffer).len(),
+                "running total drifted after {buffer:?}",
+            );
+        }
+    }
+}
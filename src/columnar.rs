@@ -0,0 +1,342 @@
+use std::ffi::c_void;
+use std::os::raw::{c_char, c_int};
+use std::ptr;
+
+use pyo3::exceptions::{PyBufferError, PyIndexError};
+use pyo3::ffi;
+use pyo3::prelude::*;
+
+use crate::chunk::Chunk;
+
+/// ``ChunkBatch.flags`` bit set on chunks emitted as oversized.
+const FLAG_OVERSIZED: u8 = 1;
+
+enum ColumnData {
+    U8(Vec<u8>),
+    U32(Vec<u32>),
+    U64(Vec<u64>),
+}
+
+/// A read-only, typed column exported through the Python buffer protocol.
+///
+/// ``memoryview(col)``, ``numpy.frombuffer(col, ...)`` and
+/// ``pyarrow.py_buffer(col)`` all read the Rust-owned memory directly.
+#[pyclass(frozen)]
+pub struct Column {
+    data: ColumnData,
+    // Py_buffer.shape/strides must stay valid for the lifetime of the view;
+    // the view holds a reference to this object, so they live here.
+    shape: [isize; 1],
+    strides: [isize; 1],
+}
+
+impl Column {
+    fn new(data: ColumnData) -> Self {
+        let (len, itemsize) = match &data {
+            ColumnData::U8(v) => (v.len(), 1),
+            ColumnData::U32(v) => (v.len(), 4),
+            ColumnData::U64(v) => (v.len(), 8),
+        };
+        Self { data, shape: [len as isize], strides: [itemsize as isize] }
+    }
+
+    fn len(&self) -> usize {
+        self.shape[0] as usize
+    }
+
+    fn as_ptr(&self) -> *const c_void {
+        match &self.data {
+            ColumnData::U8(v) => v.as_ptr() as *const c_void,
+            ColumnData::U32(v) => v.as_ptr() as *const c_void,
+            ColumnData::U64(v) => v.as_ptr() as *const c_void,
+        }
+    }
+
+    /// struct-module format string for the element type.
+    fn format(&self) -> *const c_char {
+        let fmt: &'static [u8] = match &self.data {
+            ColumnData::U8(_) => b"B\0",
+            ColumnData::U32(_) => b"I\0",
+            ColumnData::U64(_) => b"Q\0",
+        };
+        fmt.as_ptr() as *const c_char
+    }
+
+    fn get(&self, i: usize) -> u64 {
+        match &self.data {
+            ColumnData::U8(v) => v[i] as u64,
+            ColumnData::U32(v) => v[i] as u64,
+            ColumnData::U64(v) => v[i],
+        }
+    }
+
+    fn bytes(&self) -> &[u8] {
+        match &self.data {
+            ColumnData::U8(v) => v,
+            _ => &[],
+        }
+    }
+}
+
+#[pymethods]
+impl Column {
+    fn __len__(&self) -> usize {
+        self.len()
+    }
+
+    unsafe fn __getbuffer__(
+        slf: Bound<'_, Self>,
+        view: *mut ffi::Py_buffer,
+        flags: c_int,
+    ) -> PyResult<()> {
+        if view.is_null() {
+            return Err(PyBufferError::new_err("View is null"));
+        }
+        if (flags & ffi::PyBUF_WRITABLE) == ffi::PyBUF_WRITABLE {
+            return Err(PyBufferError::new_err("Column is read-only"));
+        }
+        let col = slf.get();
+        (*view).buf = col.as_ptr() as *mut c_void;
+        (*view).len = col.shape[0] * col.strides[0];
+        (*view).readonly = 1;
+        (*view).itemsize = col.strides[0];
+        (*view).format = if (flags & ffi::PyBUF_FORMAT) == ffi::PyBUF_FORMAT {
+            col.format() as *mut c_char
+        } else {
+            ptr::null_mut()
+        };
+        (*view).ndim = 1;
+        (*view).shape = if (flags & ffi::PyBUF_ND) == ffi::PyBUF_ND {
+            col.shape.as_ptr() as *mut isize
+        } else {
+            ptr::null_mut()
+        };
+        (*view).strides = if (flags & ffi::PyBUF_STRIDES) == ffi::PyBUF_STRIDES {
+            col.strides.as_ptr() as *mut isize
+        } else {
+            ptr::null_mut()
+        };
+        (*view).suboffsets = ptr::null_mut();
+        (*view).internal = ptr::null_mut();
+        (*view).obj = slf.into_any().into_ptr();
+        Ok(())
+    }
+}
+
+/// Columnar result of ``TextChunker.chunk_batch(texts, columnar=True)``.
+///
+/// One UTF-8 text buffer plus per-chunk columns, all exported through the
+/// buffer protocol: ``text_buffer`` (u8), ``text_offsets`` (u64, rows + 1
+/// byte offsets into ``text_buffer``), ``token_counts``, ``char_starts``,
+/// ``char_ends``, ``chunk_indices`` (u64), ``doc_ids`` (u32), ``flags`` (u8,
+/// bit 0 = oversized) and ``doc_offsets`` (u64, documents + 1 row offsets).
+/// Indexing or iterating yields ordinary ``Chunk`` objects, built on demand.
+#[pyclass(frozen, sequence)]
+pub struct ChunkBatch {
+    text_buffer: Py<Column>,
+    text_offsets: Py<Column>,
+    token_counts: Py<Column>,
+    char_starts: Py<Column>,
+    char_ends: Py<Column>,
+    chunk_indices: Py<Column>,
+    doc_ids: Py<Column>,
+    flags: Py<Column>,
+    doc_offsets: Py<Column>,
+    section_titles: Vec<Option<String>>,
+    rows: usize,
+}
+
+impl ChunkBatch {
+    pub fn from_documents(py: Python<'_>, docs: Vec<Vec<Chunk>>) -> PyResult<Self> {
+        let rows: usize = docs.iter().map(Vec::len).sum();
+        let bytes: usize = docs.iter().flatten().map(|c| c.text.len()).sum();
+
+        let mut text_buffer: Vec<u8> = Vec::with_capacity(bytes);
+        let mut text_offsets: Vec<u64> = Vec::with_capacity(rows + 1);
+        let mut token_counts: Vec<u64> = Vec::with_capacity(rows);
+        let mut char_starts: Vec<u64> = Vec::with_capacity(rows);
+        let mut char_ends: Vec<u64> = Vec::with_capacity(rows);
+        let mut chunk_indices: Vec<u64> = Vec::with_capacity(rows);
+        let mut doc_ids: Vec<u32> = Vec::with_capacity(rows);
+        let mut flags: Vec<u8> = Vec::with_capacity(rows);
+        let mut doc_offsets: Vec<u64> = Vec::with_capacity(docs.len() + 1);
+        let mut section_titles: Vec<Option<String>> = Vec::with_capacity(rows);
+
+        text_offsets.push(0);
+        doc_offsets.push(0);
+        for (doc_id, chunks) in docs.into_iter().enumerate() {
+            for chunk in chunks {
+                text_buffer.extend_from_slice(chunk.text.as_bytes());
+                text_offsets.push(text_buffer.len() as u64);
+                token_counts.push(chunk.token_count as u64);
+                char_starts.push(chunk.char_start as u64);
+                char_ends.push(chunk.char_end as u64);
+                chunk_indices.push(chunk.chunk_index as u64);
+                doc_ids.push(doc_id as u32);
+                let oversized = chunk.metadata.get("oversized").copied().unwrap_or(false);
+                flags.push(if oversized { FLAG_OVERSIZED } else { 0 });
+                section_titles.push(chunk.section_title);
+            }
+            doc_offsets.push(token_counts.len() as u64);
+        }
+
+        let column = |data: ColumnData| Py::new(py, Column::new(data));
+        Ok(Self {
+            text_buffer: column(ColumnData::U8(text_buffer))?,
+            text_offsets: column(ColumnData::U64(text_offsets))?,
+            token_counts: column(ColumnData::U64(token_counts))?,
+            char_starts: column(ColumnData::U64(char_starts))?,
+            char_ends: column(ColumnData::U64(char_ends))?,
+            chunk_indices: column(ColumnData::U64(chunk_indices))?,
+            doc_ids: column(ColumnData::U32(doc_ids))?,
+            flags: column(ColumnData::U8(flags))?,
+            doc_offsets: column(ColumnData::U64(doc_offsets))?,
+            section_titles,
+            rows,
+        })
+    }
+
+    fn row(&self, i: usize) -> Chunk {
+        let offsets = self.text_offsets.get();
+        let (start, end) = (offsets.get(i) as usize, offsets.get(i + 1) as usize);
+        let text = String::from_utf8_lossy(&self.text_buffer.get().bytes()[start..end]);
+
+        let doc = self.doc_ids.get().get(i) as usize;
+        let doc_offsets = self.doc_offsets.get();
+        let total = (doc_offsets.get(doc + 1) - doc_offsets.get(doc)) as usize;
+
+        let mut metadata = std::collections::HashMap::new();
+        if self.flags.get().get(i) as u8 & FLAG_OVERSIZED != 0 {
+            metadata.insert("oversized".to_string(), true);
+        }
+        Chunk {
+            text: text.into_owned(),
+            token_count: self.token_counts.get().get(i) as usize,
+            char_start: self.char_starts.get().get(i) as usize,
+            char_end: self.char_ends.get().get(i) as usize,
+            section_title: self.section_titles[i].clone(),
+            chunk_index: self.chunk_indices.get().get(i) as usize,
+            total_chunks: Some(total),
+            metadata,
+        }
+    }
+}
+
+#[pymethods]
+impl ChunkBatch {
+    fn __len__(&self) -> usize {
+        self.rows
+    }
+
+    fn __getitem__(&self, index: isize) -> PyResult<Chunk> {
+        let i = if index < 0 { index + self.rows as isize } else { index };
+        if i < 0 || i as usize >= self.rows {
+            return Err(PyIndexError::new_err("ChunkBatch index out of range"));
+        }
+        Ok(self.row(i as usize))
+    }
+
+    fn __iter__(slf: Bound<'_, Self>) -> ChunkBatchIter {
+        ChunkBatchIter { batch: slf.unbind(), pos: 0 }
+    }
+
+    /// Number of input documents.
+    #[getter]
+    fn num_documents(&self) -> usize {
+        self.doc_offsets.get().len() - 1
+    }
+
+    /// Chunks of document ``doc`` as ``Chunk`` objects.
+    fn document(&self, doc: usize) -> PyResult<Vec<Chunk>> {
+        if doc >= self.num_documents() {
+            return Err(PyIndexError::new_err("document index out of range"));
+        }
+        let offsets = self.doc_offsets.get();
+        let (start, end) = (offsets.get(doc) as usize, offsets.get(doc + 1) as usize);
+        Ok((start..end).map(|i| self.row(i)).collect())
+    }
+
+    /// Materialise the same ``list[list[Chunk]]`` as ``chunk_batch(texts)``.
+    fn to_lists(&self) -> Vec<Vec<Chunk>> {
+        (0..self.num_documents())
+            .map(|doc| self.document(doc).unwrap_or_default())
+            .collect()
+    }
+
+    #[getter]
+    fn section_titles(&self) -> Vec<Option<String>> {
+        self.section_titles.clone()
+    }
+
+    #[getter]
+    fn text_buffer(&self, py: Python<'_>) -> Py<Column> {
+        self.text_buffer.clone_ref(py)
+    }
+
+    #[getter]
+    fn text_offsets(&self, py: Python<'_>) -> Py<Column> {
+        self.text_offsets.clone_ref(py)
+    }
+
+    #[getter]
+    fn token_counts(&self, py: Python<'_>) -> Py<Column> {
+        self.token_counts.clone_ref(py)
+    }
+
+    #[getter]
+    fn char_starts(&self, py: Python<'_>) -> Py<Column> {
+        self.char_starts.clone_ref(py)
+    }
+
+    #[getter]
+    fn char_ends(&self, py: Python<'_>) -> Py<Column> {
+        self.char_ends.clone_ref(py)
+    }
+
+    #[getter]
+    fn chunk_indices(&self, py: Python<'_>) -> Py<Column> {
+        self.chunk_indices.clone_ref(py)
+    }
+
+    #[getter]
+    fn doc_ids(&self, py: Python<'_>) -> Py<Column> {
+        self.doc_ids.clone_ref(py)
+    }
+
+    #[getter]
+    fn flags(&self, py: Python<'_>) -> Py<Column> {
+        self.flags.clone_ref(py)
+    }
+
+    #[getter]
+    fn doc_offsets(&self, py: Python<'_>) -> Py<Column> {
+        self.doc_offsets.clone_ref(py)
+    }
+
+    fn __repr__(&self) -> String {
+        format!("ChunkBatch(documents={}, chunks={})", self.num_documents(), self.rows)
+    }
+}
+
+/// Iterator over the rows of a ``ChunkBatch``.
+#[pyclass]
+pub struct ChunkBatchIter {
+    batch: Py<ChunkBatch>,
+    pos: usize,
+}
+
+#[pymethods]
+impl ChunkBatchIter {
+    fn __iter__(slf: PyRef<'_, Self>) -> PyRef<'_, Self> {
+        slf
+    }
+
+    fn __next__(&mut self) -> Option<Chunk> {
+        let batch = self.batch.get();
+        if self.pos >= batch.rows {
+            return None;
+        }
+        self.pos += 1;
+        Some(batch.row(self.pos - 1))
+    }
+}
@@ -1,5 +1,32 @@
+use std::fs::File;
+use std::io::Read;
+use std::path::PathBuf;
+
 use chardetng::EncodingDetector;
+use encoding_rs::Encoding;
+use pyo3::buffer::PyBuffer;
+use pyo3::exceptions::PyBufferError;
+use pyo3::marker::Ungil;
 use pyo3::prelude::*;
+use pyo3::types::{PyBytes, PyString};
+use rayon::prelude::*;
+
+const UTF8_BOM: &[u8] = b"\xef\xbb\xbf";
+
+/// Default byte budget for ``detect_encoding_stream``.
+const DEFAULT_SAMPLE_SIZE: usize = 1 << 20;
+/// Default read size for ``detect_encoding_stream``.
+const DEFAULT_CHUNK_SIZE: usize = 64 * 1024;
+/// Consecutive identical detector guesses after which the result is settled.
+const SETTLE_CHUNKS: usize = 4;
+
+// Confidence that a sampled answer matches ``detect_encoding`` on the whole
+// input (mirrored in ``_fallback.py``).
+const CONFIDENCE_EXACT: f64 = 1.0;
+const CONFIDENCE_UTF8_SAMPLE: f64 = 0.9;
+const CONFIDENCE_ASCII_SAMPLE: f64 = 0.75;
+const CONFIDENCE_SETTLED: f64 = 0.9;
+const CONFIDENCE_SAMPLE: f64 = 0.6;
 
 /// Map a WHATWG encoding label to a Python codec name.
 fn to_python_codec(whatwg_name: &str) -> String {
@@ -14,13 +41,55 @@ fn to_python_codec(whatwg_name: &str) -> String {
     }
 }
 
+/// Borrow the bytes behind any C-contiguous byte buffer — ``bytes``,
+/// ``bytearray``, ``memoryview``, ``mmap`` — without copying.
+///
+/// Writable buffers may only be read with the GIL held; run work on the
+/// slice through [`allow_threads_if`] with ``buf.readonly()``.
+fn buffer_bytes(buf: &PyBuffer<u8>) -> PyResult<&[u8]> {
+    if !buf.is_c_contiguous() {
+        return Err(PyBufferError::new_err("buffer must be C-contiguous"));
+    }
+    // SAFETY: the buffer stays exported for as long as ``buf`` lives, which
+    // keeps the memory alive and stops a bytearray from being resized. It
+    // does not stop writes to a writable buffer, so those are only read
+    // while the GIL is held (see ``allow_threads_if``): no Python thread
+    // can modify the memory while the slice is in use.
+    let ptr = buf.buf_ptr() as *const u8;
+    Ok(unsafe { std::slice::from_raw_parts(ptr, buf.len_bytes()) })
+}
+
+/// Run ``f`` with the GIL released if ``release`` is true, else with it
+/// held. Pass whether every buffer ``f`` reads is read-only: releasing the
+/// GIL while reading a writable one would race with Python threads writing
+/// to it.
+fn allow_threads_if<T, F>(py: Python<'_>, release: bool, f: F) -> T
+where
+    F: Ungil + FnOnce() -> T,
+    T: Ungil,
+{
+    if release {
+        py.allow_threads(f)
+    } else {
+        f()
+    }
+}
+
 /// Detect the character encoding of raw bytes.
 ///
 /// Uses chardetng for a single-pass, high-accuracy detection.
 /// Returns a Python codec name suitable for use with ``bytes.decode()``.
-/// Falls back to ``"utf-8"`` if detection is inconclusive.
+/// Falls back to ``"utf-8"`` if detection is inconclusive. Accepts any
+/// byte buffer (``bytes``, ``bytearray``, ``memoryview``, ``mmap``).
 #[pyfunction]
-pub fn detect_encoding(data: &[u8]) -> String {
+pub fn detect_encoding(py: Python<'_>, data: PyBuffer<u8>) -> PyResult<String> {
+    let bytes = buffer_bytes(&data)?;
+    Ok(allow_threads_if(py, data.readonly(), || {
+        detect_bytes(bytes)
+    }))
+}
+
+fn detect_bytes(data: &[u8]) -> String {
     if data.is_empty() {
         return "utf-8".into();
     }
@@ -28,17 +97,316 @@ pub fn detect_encoding(data: &[u8]) -> String {
     // Explicit BOM check before chardetng: chardetng returns "UTF-8" for
     // BOM-prefixed files, but Python's "utf-8" codec preserves the BOM at
     // position 0. "utf-8-sig" strips it during decode.
-    if data.starts_with(b"\xef\xbb\xbf") {
+    if data.starts_with(UTF8_BOM) {
         return "utf-8-sig".into();
     }
 
+    to_python_codec(guess_encoding(data, true).name())
+}
+
+/// Detect the encoding of many byte strings in parallel (GIL released
+/// unless a buffer is writable).
+///
+/// Equivalent to ``[detect_encoding(d) for d in data]``; the inputs are
+/// borrowed, not copied.
+#[pyfunction]
+pub fn detect_encoding_batch(py: Python<'_>, data: Vec<PyBuffer<u8>>) -> PyResult<Vec<String>> {
+    let slices = data
+        .iter()
+        .map(buffer_bytes)
+        .collect::<PyResult<Vec<&[u8]>>>()?;
+    let readonly = data.iter().all(|buf| buf.readonly());
+    Ok(allow_threads_if(py, readonly, || {
+        slices.par_iter().map(|d| detect_bytes(d)).collect()
+    }))
+}
+
+/// Detect the encoding of raw bytes and decode them in one call.
+///
+/// Returns ``(text, codec)``. Valid UTF-8 is recognised by a single
+/// validation pass and never reaches the detector; anything else is decoded
+/// with the encoding chardetng picks. Malformed sequences become U+FFFD, so
+/// this never raises.
+#[pyfunction]
+pub fn decode_auto(py: Python<'_>, data: PyBuffer<u8>) -> PyResult<(String, String)> {
+    let bytes = buffer_bytes(&data)?;
+    Ok(allow_threads_if(py, data.readonly(), || {
+        decode_bytes(bytes)
+    }))
+}
+
+fn decode_bytes(data: &[u8]) -> (String, String) {
+    if let Some(rest) = data.strip_prefix(UTF8_BOM) {
+        return (
+            String::from_utf8_lossy(rest).into_owned(),
+            "utf-8-sig".into(),
+        );
+    }
+
+    if let Ok(text) = std::str::from_utf8(data) {
+        return (text.to_owned(), "utf-8".into());
+    }
+
+    // Known not to be UTF-8, so keep it out of the candidate set.
+    let encoding = guess_encoding(data, false);
+    let (text, _had_errors) = encoding.decode_without_bom_handling(data);
+    (text.into_owned(), to_python_codec(encoding.name()))
+}
+
+fn guess_encoding(data: &[u8], allow_utf8: bool) -> &'static Encoding {
     // Feed the entire buffer; last=true signals end-of-stream.
     let mut detector = EncodingDetector::new();
     detector.feed(data, true);
 
-    // guess(tld, allow_utf8): None TLD, allow UTF-8 as a candidate.
-    let encoding = detector.guess(None, true);
-    to_python_codec(encoding.name())
+    // guess(tld, allow_utf8): None TLD.
+    detector.guess(None, allow_utf8)
+}
+
+/// Detect the encoding of a file, file object, byte buffer or iterable of bytes
+/// without reading all of it.
+///
+/// ``source`` is read in ``chunk_size`` pieces until ``sample_size`` bytes
+/// have been examined, the input ends, or the detector's guess has been
+/// stable for several pieces. Pure-ASCII and valid UTF-8 pieces only go
+/// through a validation scan; chardetng is engaged once the input proves
+/// not to be UTF-8. Paths and buffers are processed with the GIL released.
+///
+/// Returns ``(codec, confidence)``, where ``confidence`` (0–1) estimates how
+/// likely the answer matches ``detect_encoding`` on the complete input:
+/// ``1.0`` for a BOM or when the whole input was examined.
+#[pyfunction]
+#[pyo3(signature = (
+    source,
+    sample_size = DEFAULT_SAMPLE_SIZE,
+    chunk_size = DEFAULT_CHUNK_SIZE,
+))]
+pub fn detect_encoding_stream(
+    py: Python<'_>,
+    source: &Bound<'_, PyAny>,
+    sample_size: usize,
+    chunk_size: usize,
+) -> PyResult<(String, f64)> {
+    let chunk_size = chunk_size.max(1);
+    let mut det = StreamDetector::new(sample_size);
+
+    if let Ok(buf) = PyBuffer::<u8>::get_bound(source) {
+        let data = buffer_bytes(&buf)?;
+        let readonly = buf.readonly();
+        return Ok(allow_threads_if(py, readonly, move || {
+            det.run_slice(data, chunk_size)
+        }));
+    }
+    if source.is_instance_of::<PyString>() || source.hasattr("__fspath__")? {
+        let path: PathBuf = source.extract()?;
+        return py
+            .allow_threads(move || det.run_file(&path, chunk_size))
+            .map_err(PyErr::from);
+    }
+
+    let mut eof = false;
+    if source.hasattr("read")? {
+        while !det.is_done() {
+            let piece = source.call_method1("read", (chunk_size,))?;
+            let piece = piece.downcast::<PyBytes>()?.as_bytes();
+            if piece.is_empty() {
+                eof = true;
+                break;
+            }
+            py.allow_threads(|| det.push(piece));
+        }
+    } else {
+        let mut pieces = source.iter()?;
+        while !det.is_done() {
+            let Some(piece) = pieces.next() else {
+                eof = true;
+                break;
+            };
+            let piece = piece?;
+            let piece = piece.downcast::<PyBytes>()?.as_bytes();
+            py.allow_threads(|| det.push(piece));
+        }
+    }
+    Ok(det.finish(eof))
+}
+
+/// Incremental UTF-8 validation across arbitrary chunk boundaries.
+#[derive(Default)]
+struct Utf8Scan {
+    /// Leading bytes of a sequence split by the previous chunk boundary.
+    pending: Vec<u8>,
+    non_ascii: bool,
+}
+
+impl Utf8Scan {
+    /// Validate the next chunk; ``false`` once the input is not UTF-8.
+    fn push(&mut self, mut chunk: &[u8]) -> bool {
+        if !self.pending.is_empty() {
+            let need = utf8_sequence_len(self.pending[0]) - self.pending.len();
+            let take = need.min(chunk.len());
+            self.pending.extend_from_slice(&chunk[..take]);
+            chunk = &chunk[take..];
+            match std::str::from_utf8(&self.pending) {
+                Ok(_) => self.pending.clear(),
+                Err(e) if e.error_len().is_none() => return true,
+                Err(_) => return false,
+            }
+        }
+        // Word-at-a-time ASCII scan first; full validation only when needed.
+        if chunk.is_ascii() {
+            return true;
+        }
+        self.non_ascii = true;
+        match std::str::from_utf8(chunk) {
+            Ok(_) => true,
+            Err(e) if e.error_len().is_none() => {
+                self.pending.extend_from_slice(&chunk[e.valid_up_to()..]);
+                true
+            }
+            Err(_) => false,
+        }
+    }
+}
+
+fn utf8_sequence_len(lead: u8) -> usize {
+    match lead {
+        0xC0..=0xDF => 2,
+        0xE0..=0xEF => 3,
+        _ => 4,
+    }
+}
+
+/// State machine behind ``detect_encoding_stream``.
+///
+/// While the input is still valid UTF-8 the consumed bytes are held (up to
+/// the sample budget) so chardetng can see them if a later byte proves the
+/// input is something else; after that they are dropped and pieces go
+/// straight to the detector.
+struct StreamDetector {
+    remaining: usize,
+    seen: u64,
+    utf8: Option<Utf8Scan>,
+    held: Vec<u8>,
+    bom: bool,
+    detector: EncodingDetector,
+    last_guess: Option<&'static Encoding>,
+    stable: usize,
+    done: bool,
+}
+
+impl StreamDetector {
+    fn new(sample_size: usize) -> Self {
+        Self {
+            remaining: sample_size,
+            seen: 0,
+            utf8: Some(Utf8Scan::default()),
+            held: Vec::new(),
+            bom: false,
+            detector: EncodingDetector::new(),
+            last_guess: None,
+            stable: 0,
+            done: sample_size == 0,
+        }
+    }
+
+    fn is_done(&self) -> bool {
+        self.done
+    }
+
+    fn push(&mut self, chunk: &[u8]) {
+        if self.done {
+            return;
+        }
+        let chunk = &chunk[..chunk.len().min(self.remaining)];
+        self.remaining -= chunk.len();
+        self.seen += chunk.len() as u64;
+        self.done = self.remaining == 0;
+
+        if let Some(scan) = self.utf8.as_mut() {
+            let before = self.held.len();
+            self.held.extend_from_slice(chunk);
+            if before < UTF8_BOM.len() && self.held.starts_with(UTF8_BOM) {
+                self.bom = true;
+                self.done = true;
+                return;
+            }
+            if scan.push(chunk) {
+                return;
+            }
+            // Not UTF-8: show the detector everything seen so far.
+            self.utf8 = None;
+            let held = std::mem::take(&mut self.held);
+            self.detector.feed(&held, false);
+        } else {
+            self.detector.feed(chunk, false);
+        }
+
+        let guess = self.detector.guess(None, false);
+        if self.last_guess.is_some_and(|g| std::ptr::eq(g, guess)) {
+            self.stable += 1;
+        } else {
+            self.last_guess = Some(guess);
+            self.stable = 1;
+        }
+        if self.stable >= SETTLE_CHUNKS {
+            self.done = true;
+        }
+    }
+
+    fn finish(mut self, eof: bool) -> (String, f64) {
+        if self.bom || (eof && self.held.starts_with(UTF8_BOM)) {
+            return ("utf-8-sig".into(), CONFIDENCE_EXACT);
+        }
+        if let Some(scan) = self.utf8.take() {
+            if !(eof && !scan.pending.is_empty()) {
+                let confidence = if eof {
+                    CONFIDENCE_EXACT
+                } else if scan.non_ascii {
+                    CONFIDENCE_UTF8_SAMPLE
+                } else {
+                    CONFIDENCE_ASCII_SAMPLE
+                };
+                return ("utf-8".into(), confidence);
+            }
+            // Input ended inside a multi-byte sequence: not UTF-8 after all.
+            self.detector.feed(&self.held, false);
+        }
+        let confidence = if eof {
+            self.detector.feed(&[], true);
+            CONFIDENCE_EXACT
+        } else if self.stable >= SETTLE_CHUNKS {
+            CONFIDENCE_SETTLED
+        } else {
+            CONFIDENCE_SAMPLE
+        };
+        let encoding = self.detector.guess(None, false);
+        (to_python_codec(encoding.name()), confidence)
+    }
+
+    fn run_slice(mut self, data: &[u8], chunk_size: usize) -> (String, f64) {
+        for chunk in data.chunks(chunk_size) {
+            if self.done {
+                break;
+            }
+            self.push(chunk);
+        }
+        let eof = self.seen == data.len() as u64;
+        self.finish(eof)
+    }
+
+    fn run_file(mut self, path: &PathBuf, chunk_size: usize) -> std::io::Result<(String, f64)> {
+        let mut file = File::open(path)?;
+        let len = file.metadata()?.len();
+        let mut buf = vec![0u8; chunk_size];
+        while !self.done {
+            let n = file.read(&mut buf)?;
+            if n == 0 {
+                break;
+            }
+            self.push(&buf[..n]);
+        }
+        let eof = self.seen == len;
+        Ok(self.finish(eof))
+    }
 }
 
 #[cfg(test)]
@@ -48,19 +416,93 @@ mod tests {
     #[test]
     fn detects_utf8() {
         let data = "Hello, world! — Unicode café".as_bytes();
-        assert_eq!(detect_encoding(data), "utf-8");
+        assert_eq!(detect_bytes(data), "utf-8");
     }
 
     #[test]
     fn detects_windows1252() {
         // 0x93/0x94 are Windows-1252 "smart quotes", invalid in UTF-8.
         let data = b"Hello \x93world\x94";
-        let enc = detect_encoding(data);
+        let enc = detect_bytes(data);
         assert!(enc == "cp1252" || enc == "windows-1252", "got: {enc}");
     }
 
     #[test]
     fn empty_bytes_returns_utf8() {
-        assert_eq!(detect_encoding(b""), "utf-8");
+        assert_eq!(detect_bytes(b""), "utf-8");
+    }
+
+    fn stream(data: &[u8], sample_size: usize, chunk_size: usize) -> (String, f64) {
+        StreamDetector::new(sample_size).run_slice(data, chunk_size)
+    }
+
+    #[test]
+    fn stream_utf8_split_across_chunks() {
+        let data = "café — naïve ✓".as_bytes();
+        for chunk_size in 1..5 {
+            assert_eq!(
+                stream(data, 1024, chunk_size),
+                ("utf-8".into(), CONFIDENCE_EXACT)
+            );
+        }
+    }
+
+    #[test]
+    fn stream_bom_split_across_chunks() {
+        assert_eq!(
+            stream(b"\xef\xbb\xbfhi", 1024, 1),
+            ("utf-8-sig".into(), CONFIDENCE_EXACT)
+        );
+    }
+
+    #[test]
+    fn stream_sample_budget() {
+        let ascii = b"plain ascii text ".repeat(100);
+        assert_eq!(
+            stream(&ascii, 64, 16),
+            ("utf-8".into(), CONFIDENCE_ASCII_SAMPLE)
+        );
+        let utf8 = "é".repeat(100);
+        assert_eq!(
+            stream(utf8.as_bytes(), 64, 16),
+            ("utf-8".into(), CONFIDENCE_UTF8_SAMPLE)
+        );
+    }
+
+    #[test]
+    fn stream_truncated_sequence_at_eof_is_not_utf8() {
+        let (codec, confidence) = stream(b"abc\xc3", 1024, 2);
+        assert_ne!(codec, "utf-8");
+        assert_eq!(confidence, CONFIDENCE_EXACT);
+    }
+
+    #[test]
+    fn stream_invalid_utf8_uses_detector() {
+        let (codec, _) = stream(b"Hello \x93world\x94", 1024, 4);
+        assert_ne!(codec, "utf-8");
+    }
+
+    #[test]
+    fn decode_utf8_and_bom() {
+        let text = "Hello — café";
+        assert_eq!(
+            decode_bytes(text.as_bytes()),
+            (text.to_string(), "utf-8".to_string())
+        );
+        let mut bom = UTF8_BOM.to_vec();
+        bom.extend_from_slice(text.as_bytes());
+        assert_eq!(
+            decode_bytes(&bom),
+            (text.to_string(), "utf-8-sig".to_string())
+        );
+        assert_eq!(decode_bytes(b""), (String::new(), "utf-8".to_string()));
+    }
+
+    #[test]
+    fn decode_windows1252() {
+        let (text, codec) = decode_bytes(b"Hello \x93world\x94");
+        assert_eq!(codec, detect_bytes(b"Hello \x93world\x94"));
+        assert!(text.starts_with("Hello "));
+        assert!(text.contains("world"));
     }
 }
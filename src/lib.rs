@@ -2,16 +2,27 @@ use pyo3::prelude::*;
 
 mod encoding;
 mod normalize;
+mod registry;
 mod token;
 mod chunk;
+mod columnar;
 mod separator;
 
 #[pymodule]
 fn _core(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_function(wrap_pyfunction!(encoding::detect_encoding, m)?)?;
+    m.add_function(wrap_pyfunction!(encoding::detect_encoding_batch, m)?)?;
+    m.add_function(wrap_pyfunction!(encoding::decode_auto, m)?)?;
+    m.add_function(wrap_pyfunction!(encoding::detect_encoding_stream, m)?)?;
+    m.add_function(wrap_pyfunction!(registry::warm_up, m)?)?;
+    m.add_function(wrap_pyfunction!(registry::tokenizer_cache_info, m)?)?;
     m.add_class::<normalize::TextNormalizer>()?;
     m.add_class::<token::TokenCounter>()?;
     m.add_class::<chunk::TextChunker>()?;
     m.add_class::<chunk::Chunk>()?;
+    m.add_class::<chunk::ChunkIter>()?;
+    m.add_class::<columnar::ChunkBatch>()?;
+    m.add_class::<columnar::Column>()?;
+    m.add_class::<columnar::ChunkBatchIter>()?;
     Ok(())
 }
@@ -1,6 +1,30 @@
+use std::borrow::Cow;
+use std::collections::{HashMap, HashSet};
+use std::sync::atomic::{AtomicU64, Ordering};
+use std::sync::OnceLock;
+
 use pyo3::prelude::*;
 use rayon::prelude::*;
-use unicode_normalization::UnicodeNormalization;
+use pyo3::types::PyDict;
+use regex::{Captures, Regex, Replacer};
+use unicode_normalization::{
+    is_nfc_quick, is_nfd_quick, is_nfkc_quick, is_nfkd_quick, IsNormalized,
+    UnicodeNormalization,
+};
+
+// Patterns are compiled once per process and shared by every normalizer and
+// every rayon worker (``Regex`` is ``Sync``).
+static RN_TO_M: OnceLock<Regex> = OnceLock::new();
+static L_BETWEEN_DIGITS: OnceLock<Regex> = OnceLock::new();
+static HORIZONTAL_WS: OnceLock<Regex> = OnceLock::new();
+static EXCESS_NEWLINES: OnceLock<Regex> = OnceLock::new();
+static FUSED_ALL: OnceLock<Regex> = OnceLock::new();
+static FUSED_OCR: OnceLock<Regex> = OnceLock::new();
+static FUSED_WS: OnceLock<Regex> = OnceLock::new();
+
+fn cached(cell: &'static OnceLock<Regex>, pattern: &str) -> &'static Regex {
+    cell.get_or_init(|| Regex::new(pattern).unwrap())
+}
 
 #[pyclass]
 pub struct TextNormalizer {
@@ -8,6 +32,11 @@ pub struct TextNormalizer {
     collapse_whitespace: bool,
     repair_ocr: bool,
     strip_headers_footers: bool,
+    fused: bool,
+    // Fast-path counters reported by ``stats()``.
+    calls: AtomicU64,
+    ascii_hits: AtomicU64,
+    quick_check_hits: AtomicU64,
 }
 
 #[pymethods]
@@ -18,18 +47,29 @@ impl TextNormalizer {
         collapse_whitespace = true,
         repair_ocr = false,
         strip_headers_footers = false,
+        fused = false,
     ))]
     pub fn new(
         unicode_form: String,
         collapse_whitespace: bool,
         repair_ocr: bool,
         strip_headers_footers: bool,
+        fused: bool,
     ) -> Self {
-        Self { unicode_form, collapse_whitespace, repair_ocr, strip_headers_footers }
+        Self {
+            unicode_form,
+            collapse_whitespace,
+            repair_ocr,
+            strip_headers_footers,
+            fused,
+            calls: AtomicU64::new(0),
+            ascii_hits: AtomicU64::new(0),
+            quick_check_hits: AtomicU64::new(0),
+        }
     }
 
     pub fn normalize(&self, text: &str) -> String {
-        self.normalize_one(text)
+        self.normalize_one(text).into_owned()
     }
 
     pub fn normalize_batch(
@@ -38,93 +78,168 @@ impl TextNormalizer {
         texts: Vec<String>,
     ) -> Vec<String> {
         py.allow_threads(|| {
-            texts.par_iter().map(|t| self.normalize_one(t)).collect()
+            texts.into_par_iter()
+                .map(|t| {
+                    // Hand the input back when nothing changed it.
+                    let changed = match self.normalize_one(&t) {
+                        Cow::Borrowed(_) => None,
+                        Cow::Owned(s) => Some(s),
+                    };
+                    changed.unwrap_or(t)
+                })
+                .collect()
         })
     }
+
+    /// Return ``{"calls": int, "fast_path": int, "ascii": int}``.
+    ///
+    /// ``fast_path`` counts inputs that skipped the Unicode normalization
+    /// pass — pure ASCII (``ascii``) or already in ``unicode_form`` according
+    /// to the Unicode quick-check property.
+    pub fn stats<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyDict>> {
+        let ascii = self.ascii_hits.load(Ordering::Relaxed);
+        let quick = self.quick_check_hits.load(Ordering::Relaxed);
+        let stats = PyDict::new_bound(py);
+        stats.set_item("calls", self.calls.load(Ordering::Relaxed))?;
+        stats.set_item("fast_path", ascii + quick)?;
+        stats.set_item("ascii", ascii)?;
+        Ok(stats)
+    }
+
+    /// Return the constructor arguments as a dict, e.g. for cache keys.
+    pub fn config<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyDict>> {
+        let config = PyDict::new_bound(py);
+        config.set_item("unicode_form", &self.unicode_form)?;
+        config.set_item("collapse_whitespace", self.collapse_whitespace)?;
+        config.set_item("repair_ocr", self.repair_ocr)?;
+        config.set_item("strip_headers_footers", self.strip_headers_footers)?;
+        config.set_item("fused", self.fused)?;
+        Ok(config)
+    }
 }
 
 impl TextNormalizer {
-    fn normalize_one(&self, text: &str) -> String {
-        let mut s: String = match self.unicode_form.as_str() {
-            "NFC"  => text.nfc().collect(),
-            "NFD"  => text.nfd().collect(),
-            "NFKC" => text.nfkc().collect(),
-            "NFKD" => text.nfkd().collect(),
-            _      => text.nfc().collect(),
-        };
+    fn normalize_one<'a>(&self, text: &'a str) -> Cow<'a, str> {
+        let mut s = self.unicode_normalize(text);
 
         if self.strip_headers_footers {
-            s = strip_headers_footers(&s);
+            s = Cow::Owned(strip_headers_footers(&s));
+        }
+
+        if self.fused {
+            if self.repair_ocr || self.collapse_whitespace {
+                s = Cow::Owned(fused_repair_and_collapse(
+                    &s,
+                    self.repair_ocr,
+                    self.collapse_whitespace,
+                ));
+            }
+            return s;
         }
 
         if self.repair_ocr {
-            s = repair_ocr_artifacts(&s);
+            s = Cow::Owned(repair_ocr_artifacts(&s));
         }
 
         if self.collapse_whitespace {
-            s = collapse_whitespace(&s);
+            s = Cow::Owned(collapse_whitespace(&s));
         }
 
         s
     }
+
+    /// Apply ``unicode_form``, borrowing the input when it is pure ASCII
+    /// (invariant under every form) or the quick-check property already
+    /// answers "yes" — the common case, which then costs one scan and no
+    /// allocation.
+    fn unicode_normalize<'a>(&self, text: &'a str) -> Cow<'a, str> {
+        self.calls.fetch_add(1, Ordering::Relaxed);
+        if text.is_ascii() {
+            self.ascii_hits.fetch_add(1, Ordering::Relaxed);
+            return Cow::Borrowed(text);
+        }
+
+        let quick = match self.unicode_form.as_str() {
+            "NFD"  => is_nfd_quick(text.chars()),
+            "NFKC" => is_nfkc_quick(text.chars()),
+            "NFKD" => is_nfkd_quick(text.chars()),
+            _      => is_nfc_quick(text.chars()),
+        };
+        if quick == IsNormalized::Yes {
+            self.quick_check_hits.fetch_add(1, Ordering::Relaxed);
+            return Cow::Borrowed(text);
+        }
+
+        Cow::Owned(match self.unicode_form.as_str() {
+            "NFC"  => text.nfc().collect(),
+            "NFD"  => text.nfd().collect(),
+            "NFKC" => text.nfkc().collect(),
+            "NFKD" => text.nfkd().collect(),
+            _      => text.nfc().collect(),
+        })
+    }
 }
 
 /// Remove lines that repeat (similarity > 0.8) across form-feed page breaks.
 /// No-op when no \f characters are present — documented behavior.
+///
+/// Linear in the input: one pass builds a trimmed-line → page-count map
+/// (each page contributes at most once per line via a per-page set), and a
+/// second pass drops lines present on more than half the pages. Every unique
+/// line is considered, not just those on page 0, so running headers are
+/// still found when page 0 is a cover page with no shared lines.
 fn strip_headers_footers(text: &str) -> String {
     let pages: Vec<&str> = text.split('\x0c').collect();
     if pages.len() < 2 {
         return text.to_string();
     }
 
-    // Collect lines that appear on more than half the pages.
-    let all_lines: Vec<Vec<&str>> = pages.iter()
-        .map(|p| p.lines().collect())
-        .collect();
-
-    // Collect every unique non-empty line from all pages, then keep only those
-    // present on more than half the pages. Seeding from page 0 alone misses
-    // running headers when page 0 is a cover page with no shared lines.
-    let all_unique: std::collections::HashSet<&str> = all_lines.iter()
-        .flat_map(|pg| pg.iter().copied())
-        .filter(|l| !l.trim().is_empty())
-        .collect();
+    let mut page_counts: HashMap<&str, usize> = HashMap::new();
+    let mut on_page: HashSet<&str> = HashSet::new();
+    for page in &pages {
+        on_page.clear();
+        for line in page.lines() {
+            let trimmed = line.trim();
+            if !trimmed.is_empty() && on_page.insert(trimmed) {
+                *page_counts.entry(trimmed).or_insert(0) += 1;
+            }
+        }
+    }
 
-    let candidate_lines: std::collections::HashSet<&str> = all_unique
+    let candidate_lines: HashSet<&str> = page_counts
         .into_iter()
-        .filter(|line| {
-            let trimmed = line.trim();
-            let count = all_lines.iter()
-                .filter(|page_lines| {
-                    page_lines.iter().any(|l| l.trim() == trimmed)
-                })
-                .count();
-            count * 2 > pages.len()
-        })
+        .filter(|&(_, count)| count * 2 > pages.len())
+        .map(|(line, _)| line)
         .collect();
 
     if candidate_lines.is_empty() {
         return text.to_string();
     }
 
-    pages.iter()
-        .map(|page| {
-            page.lines()
-                .filter(|l| !candidate_lines.contains(l.trim()))
-                .collect::<Vec<_>>()
-                .join("\n")
-        })
-        .collect::<Vec<_>>()
-        .join("\x0c")
+    let mut out = String::with_capacity(text.len());
+    for (i, page) in pages.iter().enumerate() {
+        if i > 0 {
+            out.push('\x0c');
+        }
+        let mut first = true;
+        for line in page.lines().filter(|l| !candidate_lines.contains(l.trim())) {
+            if !first {
+                out.push('\n');
+            }
+            out.push_str(line);
+            first = false;
+        }
+    }
+    out
 }
 
 /// Heuristic OCR artifact repair for common Tesseract substitutions.
 /// Uses capture groups — Rust's regex crate does not support lookaround.
 fn repair_ocr_artifacts(text: &str) -> String {
     // ([a-z])rn([a-z]) → $1m$2  — 'rn' between lowercase letters
-    let rn_to_m = regex::Regex::new(r"([a-z])rn([a-z])").unwrap();
+    let rn_to_m = cached(&RN_TO_M, r"([a-z])rn([a-z])");
     // (\d)l(\d) → ${1}1${2}  — 'l' between digits
-    let l_between_digits = regex::Regex::new(r"(\d)l(\d)").unwrap();
+    let l_between_digits = cached(&L_BETWEEN_DIGITS, r"(\d)l(\d)");
 
     let s = rn_to_m.replace_all(text, "${1}m${2}");
     let s = l_between_digits.replace_all(&s, "${1}1${2}");
@@ -134,10 +249,111 @@ fn repair_ocr_artifacts(text: &str) -> String {
 fn collapse_whitespace(text: &str) -> String {
     // Replace runs of whitespace (excluding newlines) with a single space,
     // and collapse 3+ newlines to 2.
-    let horizontal = regex::Regex::new(r"[^\S\n]+").unwrap();
-    let excess_newlines = regex::Regex::new(r"\n{3,}").unwrap();
+    let horizontal = cached(&HORIZONTAL_WS, r"[^\S\n]+");
+    let excess_newlines = cached(&EXCESS_NEWLINES, r"\n{3,}");
 
     let s = horizontal.replace_all(text, " ");
     let s = excess_newlines.replace_all(&s, "\n\n");
     s.trim().to_string()
 }
+
+/// Single-pass equivalent of ``repair_ocr_artifacts`` followed by
+/// ``collapse_whitespace``.
+///
+/// The four patterns never overlap (letters, digits, horizontal whitespace
+/// and newlines are disjoint), and neither OCR rule can create or destroy a
+/// match for the other, so one leftmost-first alternation produces the same
+/// output as the sequential passes while scanning the text once.
+fn fused_repair_and_collapse(text: &str, repair_ocr: bool, collapse: bool) -> String {
+    let re = match (repair_ocr, collapse) {
+        (true, true) => cached(
+            &FUSED_ALL,
+            r"([a-z])rn([a-z])|(\d)l(\d)|[^\S\n]+|\n{3,}",
+        ),
+        (true, false) => cached(&FUSED_OCR, r"([a-z])rn([a-z])|(\d)l(\d)"),
+        (false, true) => cached(&FUSED_WS, r"[^\S\n]+|\n{3,}"),
+        (false, false) => return text.to_string(),
+    };
+    let s: Cow<'_, str> = re.replace_all(text, FusedReplacer);
+    if collapse {
+        s.trim().to_string()
+    } else {
+        s.into_owned()
+    }
+}
+
+/// Rewrites one match of a fused pattern in place, without allocating.
+struct FusedReplacer;
+
+impl Replacer for FusedReplacer {
+    fn replace_append(&mut self, caps: &Captures<'_>, dst: &mut String) {
+        if let (Some(a), Some(b)) = (caps.get(1), caps.get(2)) {
+            dst.push_str(a.as_str());
+            dst.push('m');
+            dst.push_str(b.as_str());
+        } else if let (Some(a), Some(b)) = (caps.get(3), caps.get(4)) {
+            dst.push_str(a.as_str());
+            dst.push('1');
+            dst.push_str(b.as_str());
+        } else if caps[0].starts_with('\n') {
+            dst.push_str("\n\n");
+        } else {
+            dst.push(' ');
+        }
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn fast_path_borrows_ascii_and_normalized_input() {
+        let norm = TextNormalizer::new("NFC".to_string(), false, false, false, false);
+        assert!(matches!(norm.normalize_one("plain ascii"), Cow::Borrowed(_)));
+        assert!(matches!(norm.normalize_one("caf\u{e9}"), Cow::Borrowed(_)));
+        let decomposed = norm.normalize_one("cafe\u{301}");
+        assert!(matches!(decomposed, Cow::Owned(_)));
+        assert_eq!(decomposed, "caf\u{e9}");
+        assert_eq!(norm.calls.load(Ordering::Relaxed), 3);
+        assert_eq!(norm.ascii_hits.load(Ordering::Relaxed), 1);
+        assert_eq!(norm.quick_check_hits.load(Ordering::Relaxed), 1);
+
+        let nfd = TextNormalizer::new("NFD".to_string(), false, false, false, false);
+        assert_eq!(nfd.normalize_one("caf\u{e9}"), "cafe\u{301}");
+    }
+
+    #[test]
+    fn strip_headers_uses_trimmed_page_counts() {
+        let text = "Cover\x0c  ACME Corp\nbody one\nPage\x0cACME Corp \nbody two\nPage\x0cACME Corp\nbody three";
+        assert_eq!(
+            strip_headers_footers(text),
+            "Cover\x0cbody one\nPage\x0cbody two\nPage\x0cbody three"
+        );
+        assert_eq!(strip_headers_footers("no breaks\nhere"), "no breaks\nhere");
+    }
+
+    #[test]
+    fn fused_matches_sequential_passes() {
+        let samples = [
+            "",
+            "  leading and   trailing \t ",
+            "arnrnb cornrnon 1l1l1 2l3",
+            "para one\n\n\n\n  para   two\t\n \n\n\nend",
+            "rn at edges: rnx xrn 1l l1",
+            "mixed\u{00a0}nbsp\u{2003}em\u{3000}ideo ١l٢",
+        ];
+        for text in samples {
+            for (ocr, ws) in [(true, true), (true, false), (false, true), (false, false)] {
+                let mut expected = text.to_string();
+                if ocr {
+                    expected = repair_ocr_artifacts(&expected);
+                }
+                if ws {
+                    expected = collapse_whitespace(&expected);
+                }
+                assert_eq!(fused_repair_and_collapse(text, ocr, ws), expected, "{text:?}");
+            }
+        }
+    }
+}
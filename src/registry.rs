@@ -0,0 +1,83 @@
+use std::collections::HashMap;
+use std::sync::atomic::{AtomicU64, Ordering};
+use std::sync::{Arc, OnceLock, RwLock};
+
+use pyo3::prelude::*;
+use pyo3::types::PyDict;
+use tiktoken_rs::{get_bpe_from_model, CoreBPE};
+
+/// Process-wide tokenizer cache, keyed by the encoding or model name the
+/// caller asked for. Building a ``CoreBPE`` parses the full merge table, so
+/// every ``TokenCounter`` and ``TextChunker`` shares one instance per name.
+static REGISTRY: OnceLock<RwLock<HashMap<String, Arc<CoreBPE>>>> = OnceLock::new();
+static LOADS: AtomicU64 = AtomicU64::new(0);
+static HITS: AtomicU64 = AtomicU64::new(0);
+
+fn registry() -> &'static RwLock<HashMap<String, Arc<CoreBPE>>> {
+    REGISTRY.get_or_init(|| RwLock::new(HashMap::new()))
+}
+
+/// Resolve an encoding name ("cl100k_base") or model name ("gpt-4") to a BPE.
+fn build_bpe(name: &str) -> Result<CoreBPE, String> {
+    let result = match name {
+        "cl100k_base" => tiktoken_rs::cl100k_base(),
+        "o200k_base"  => tiktoken_rs::o200k_base(),
+        "r50k_base"   => tiktoken_rs::r50k_base(),
+        "p50k_base"   => tiktoken_rs::p50k_base(),
+        "p50k_edit"   => tiktoken_rs::p50k_edit(),
+        // Fall through to model-name lookup (e.g. "gpt-4" → cl100k_base)
+        other         => get_bpe_from_model(other),
+    };
+    result.map_err(|e| e.to_string())
+}
+
+/// Return the shared BPE for ``name``, building it on first use.
+pub fn get_bpe(name: &str) -> Result<Arc<CoreBPE>, String> {
+    {
+        let map = registry().read().unwrap_or_else(|e| e.into_inner());
+        if let Some(bpe) = map.get(name) {
+            HITS.fetch_add(1, Ordering::Relaxed);
+            return Ok(Arc::clone(bpe));
+        }
+    }
+
+    let mut map = registry().write().unwrap_or_else(|e| e.into_inner());
+    // Another thread may have built it while we waited for the write lock.
+    if let Some(bpe) = map.get(name) {
+        HITS.fetch_add(1, Ordering::Relaxed);
+        return Ok(Arc::clone(bpe));
+    }
+    let bpe = Arc::new(build_bpe(name)?);
+    LOADS.fetch_add(1, Ordering::Relaxed);
+    map.insert(name.to_string(), Arc::clone(&bpe));
+    Ok(bpe)
+}
+
+/// Preload tokenizers into the shared registry (GIL released).
+///
+/// Call this before forking worker processes so children inherit the
+/// already-built tables instead of each building their own.
+#[pyfunction]
+pub fn warm_up(py: Python<'_>, names: Vec<String>) -> PyResult<()> {
+    py.allow_threads(|| names.iter().try_for_each(|name| get_bpe(name).map(|_| ())))
+        .map_err(pyo3::exceptions::PyValueError::new_err)
+}
+
+/// Return ``{"loads": int, "hits": int, "encodings": list[str]}`` for the
+/// shared tokenizer registry.
+#[pyfunction]
+pub fn tokenizer_cache_info(py: Python<'_>) -> PyResult<Bound<'_, PyDict>> {
+    let mut names: Vec<String> = registry()
+        .read()
+        .unwrap_or_else(|e| e.into_inner())
+        .keys()
+        .cloned()
+        .collect();
+    names.sort();
+
+    let info = PyDict::new_bound(py);
+    info.set_item("loads", LOADS.load(Ordering::Relaxed))?;
+    info.set_item("hits", HITS.load(Ordering::Relaxed))?;
+    info.set_item("encodings", names)?;
+    Ok(info)
+}
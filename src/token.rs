@@ -1,24 +1,14 @@
+use std::sync::Arc;
+
 use pyo3::prelude::*;
 use rayon::prelude::*;
-use tiktoken_rs::{get_bpe_from_model, CoreBPE};
+use tiktoken_rs::CoreBPE;
 
-/// Resolve an encoding name ("cl100k_base") or model name ("gpt-4") to a BPE.
-fn load_bpe(name: &str) -> Result<CoreBPE, String> {
-    let result = match name {
-        "cl100k_base" => tiktoken_rs::cl100k_base(),
-        "o200k_base"  => tiktoken_rs::o200k_base(),
-        "r50k_base"   => tiktoken_rs::r50k_base(),
-        "p50k_base"   => tiktoken_rs::p50k_base(),
-        "p50k_edit"   => tiktoken_rs::p50k_edit(),
-        // Fall through to model-name lookup (e.g. "gpt-4" → cl100k_base)
-        other         => get_bpe_from_model(other),
-    };
-    result.map_err(|e| e.to_string())
-}
+use crate::registry::get_bpe;
 
 #[pyclass]
 pub struct TokenCounter {
-    model: String,
+    bpe: Arc<CoreBPE>,
 }
 
 #[pymethods]
@@ -26,17 +16,15 @@ impl TokenCounter {
     #[new]
     #[pyo3(signature = (model = "cl100k_base".to_string()))]
     pub fn new(model: String) -> PyResult<Self> {
-        load_bpe(&model)
+        let bpe = get_bpe(&model)
             .map_err(|e| pyo3::exceptions::PyValueError::new_err(
                 format!("Unknown tiktoken model '{}': {}", model, e)
             ))?;
-        Ok(Self { model })
+        Ok(Self { bpe })
     }
 
     pub fn count(&self, text: &str) -> PyResult<usize> {
-        let bpe = load_bpe(&self.model)
-            .map_err(|e| pyo3::exceptions::PyValueError::new_err(e))?;
-        Ok(bpe.encode_with_special_tokens(text).len())
+        Ok(self.bpe.encode_with_special_tokens(text).len())
     }
 
     pub fn count_batch(
@@ -44,16 +32,12 @@ impl TokenCounter {
         py: Python<'_>,
         texts: Vec<String>,
     ) -> PyResult<Vec<usize>> {
-        let model = self.model.clone();
-        py.allow_threads(|| {
+        let bpe = &self.bpe;
+        Ok(py.allow_threads(|| {
             texts.par_iter()
-                .map(|t| {
-                    load_bpe(&model)
-                        .map(|bpe| bpe.encode_with_special_tokens(t).len())
-                })
-                .collect::<Result<Vec<_>, _>>()
-        })
-        .map_err(|e| pyo3::exceptions::PyValueError::new_err(e))
+                .map(|t| bpe.encode_with_special_tokens(t).len())
+                .collect()
+        }))
     }
 
     /// Truncate text to at most ``max_tokens`` tokens.
@@ -69,10 +53,7 @@ impl TokenCounter {
         max_tokens: usize,
         strategy: String,
     ) -> PyResult<String> {
-        let bpe = load_bpe(&self.model)
-            .map_err(|e| pyo3::exceptions::PyValueError::new_err(e))?;
-
-        let tokens = bpe.encode_with_special_tokens(text);
+        let tokens = self.bpe.encode_with_special_tokens(text);
         if tokens.len() <= max_tokens {
             return Ok(text.to_string());
         }
@@ -88,7 +69,7 @@ impl TokenCounter {
             _ => tokens[..max_tokens].to_vec(),
         };
 
-        bpe.decode(kept)
+        self.bpe.decode(kept)
             .map_err(|e| pyo3::exceptions::PyValueError::new_err(e.to_string()))
     }
 }
@@ -0,0 +1,199 @@
+"""
+Tests for the asyncio API (aextract / aextract_many).
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import TextSpitter
+from TextSpitter.aio import aextract, aextract_many
+from TextSpitter.main import WordLoader
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+class FakeUpload:
+    """Minimal stand-in for Starlette's UploadFile."""
+
+    def __init__(self, data: bytes, filename: str):
+        self._data = data
+        self._pos = 0
+        self.filename = filename
+
+    async def read(self, size: int = -1) -> bytes:
+        end = len(self._data) if size < 0 else self._pos + size
+        chunk = self._data[self._pos : end]
+        self._pos += len(chunk)
+        return chunk
+
+
+async def _chunks(*parts: bytes):
+    for part in parts:
+        yield part
+
+
+@pytest.fixture
+def notes(tmp_path):
+    path = tmp_path / "notes.txt"
+    path.write_text("hello async", encoding="utf-8")
+    return path
+
+
+# ---------------------------------------------------------------------------
+# aextract
+# ---------------------------------------------------------------------------
+
+def test_aextract_path(notes):
+    assert asyncio.run(aextract(notes)) == "hello async"
+
+
+def test_aextract_upload_file():
+    upload = FakeUpload(b"uploaded text", "upload.txt")
+    assert asyncio.run(aextract(upload)) == "uploaded text"
+
+
+def test_aextract_async_iterable_needs_filename():
+    stream = _chunks(b"streamed ", b"text")
+    assert asyncio.run(aextract(stream, "s.txt")) == "streamed text"
+    with pytest.raises(ValueError, match="filename"):
+        asyncio.run(aextract(_chunks(b"x")))
+
+
+def test_aextract_uses_given_executor(notes):
+    threads = []
+    original = WordLoader.file_load
+
+    def record(self):
+        threads.append(threading.current_thread().name)
+        return original(self)
+
+    with ThreadPoolExecutor(thread_name_prefix="extract") as executor:
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr(WordLoader, "file_load", record)
+            asyncio.run(aextract(notes, executor=executor))
+    assert threads[0].startswith("extract")
+
+
+def test_event_loop_is_not_blocked(notes, monkeypatch):
+    def slow(self):
+        time.sleep(0.3)
+        return "done"
+
+    monkeypatch.setattr(WordLoader, "file_load", slow)
+
+    async def main():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        tick_task = asyncio.create_task(ticker())
+        text = await aextract(notes)
+        tick_task.cancel()
+        return text, ticks
+
+    text, ticks = asyncio.run(main())
+    assert text == "done"
+    assert ticks >= 5
+
+
+def test_cancellation_propagates(notes, monkeypatch):
+    monkeypatch.setattr(WordLoader, "file_load", lambda self: time.sleep(0.5))
+
+    async def main():
+        task = asyncio.create_task(aextract(notes))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        await task
+
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(main())
+
+
+def test_cancelled_call_holds_semaphore_until_parse_finishes(
+    notes, monkeypatch
+):
+    active = peak = 0
+    lock = threading.Lock()
+
+    def tracked(self):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.3)
+        with lock:
+            active -= 1
+        return "done"
+
+    monkeypatch.setattr(WordLoader, "file_load", tracked)
+
+    async def main():
+        semaphore = asyncio.Semaphore(1)
+        tasks = [
+            asyncio.create_task(aextract(notes, semaphore=semaphore))
+            for _ in range(4)
+        ]
+        await asyncio.sleep(0.05)
+        for task in tasks:
+            task.cancel()
+            await asyncio.sleep(0.02)
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        return results, active
+
+    results, still_running = asyncio.run(main())
+    assert all(isinstance(r, asyncio.CancelledError) for r in results)
+    assert peak == 1
+    assert still_running == 0
+
+
+# ---------------------------------------------------------------------------
+# aextract_many
+# ---------------------------------------------------------------------------
+
+def test_aextract_many_bounds_concurrency(tmp_path, monkeypatch):
+    active = peak = 0
+    lock = threading.Lock()
+
+    def tracked(self):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.05)
+        with lock:
+            active -= 1
+        return self.file.file_name
+
+    monkeypatch.setattr(WordLoader, "file_load", tracked)
+    paths = [tmp_path / f"f{i}.txt" for i in range(8)]
+    results = asyncio.run(aextract_many(paths, concurrency=2))
+    assert peak <= 2
+    assert [r.text for r in results] == [f"f{i}.txt" for i in range(8)]
+    assert [r.index for r in results] == list(range(8))
+
+
+def test_aextract_many_reports_errors_per_source(notes):
+    sources = [notes, _chunks(b"no name"), FakeUpload(b"up", "u.txt")]
+    results = asyncio.run(aextract_many(sources))
+    assert [r.ok for r in results] == [True, False, True]
+    assert results[1].error.startswith("ValueError")
+    assert results[2].path == "u.txt"
+
+
+def test_aextract_many_invalid_concurrency():
+    with pytest.raises(ValueError, match="concurrency"):
+        asyncio.run(aextract_many([], concurrency=0))
+
+
+def test_package_exports_are_lazy():
+    assert TextSpitter.aextract is aextract
+    assert "aextract_many" in TextSpitter.__all__
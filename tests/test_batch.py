@@ -0,0 +1,168 @@
+"""
+Tests for extract_many (parallel batch extraction).
+"""
+
+import os
+import time
+
+import pytest
+
+from TextSpitter import ExtractionResult, ResultCache, extract_many
+from TextSpitter.main import WordLoader
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+@pytest.fixture
+def text_files(tmp_path):
+    paths = []
+    for i in range(8):
+        path = tmp_path / f"file{i}.txt"
+        path.write_text(f"contents of file {i}", encoding="utf-8")
+        paths.append(path)
+    return paths
+
+
+def _marked_file_load(self):
+    name = self.file.file_name
+    if "bad" in name:
+        raise RuntimeError(f"cannot read {name}")
+    if "crash" in name:
+        os._exit(3)
+    if "slow" in name:
+        time.sleep(30)
+    if "late" in name:
+        time.sleep(0.5)
+    return f"text of {name}"
+
+
+# ---------------------------------------------------------------------------
+# Results
+# ---------------------------------------------------------------------------
+
+def test_results_in_input_order(text_files):
+    results = list(extract_many(text_files, workers=3))
+    assert [r.index for r in results] == list(range(len(text_files)))
+    assert [r.text for r in results] == [
+        f"contents of file {i}" for i in range(len(text_files))
+    ]
+    assert all(isinstance(r, ExtractionResult) and r.ok for r in results)
+    assert [r.path for r in results] == [str(p) for p in text_files]
+
+
+def test_errors_are_reported_per_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(WordLoader, "file_load", _marked_file_load)
+    paths = [tmp_path / "a.txt", tmp_path / "bad.txt", tmp_path / "b.txt"]
+    results = list(extract_many(paths, workers=2, start_method="fork"))
+    assert [r.ok for r in results] == [True, False, True]
+    assert results[1].text is None
+    assert results[1].error == "RuntimeError: cannot read bad.txt"
+
+
+def test_as_completed_yields_fast_files_first(tmp_path, monkeypatch):
+    monkeypatch.setattr(WordLoader, "file_load", _marked_file_load)
+    paths = [tmp_path / "late.txt", tmp_path / "a.txt", tmp_path / "b.txt"]
+    results = list(
+        extract_many(paths, workers=3, ordered=False, start_method="fork")
+    )
+    assert sorted(r.index for r in results) == [0, 1, 2]
+    assert results[-1].index == 0
+
+
+def test_timeout_kills_worker_and_continues(tmp_path, monkeypatch):
+    monkeypatch.setattr(WordLoader, "file_load", _marked_file_load)
+    paths = [tmp_path / "slow.txt", tmp_path / "a.txt", tmp_path / "b.txt"]
+    start = time.monotonic()
+    results = list(
+        extract_many(paths, workers=2, timeout=1, start_method="fork")
+    )
+    assert time.monotonic() - start < 10
+    assert results[0].error.startswith("TimeoutError")
+    assert [r.ok for r in results[1:]] == [True, True]
+
+
+def test_crashed_worker_is_replaced(tmp_path, monkeypatch):
+    monkeypatch.setattr(WordLoader, "file_load", _marked_file_load)
+    paths = [tmp_path / "crash.txt", tmp_path / "a.txt", tmp_path / "b.txt"]
+    results = list(extract_many(paths, workers=1, start_method="fork"))
+    assert results[0].error == "WorkerError: worker exited with code 3"
+    assert [r.text for r in results[1:]] == ["text of a.txt", "text of b.txt"]
+
+
+def test_worker_recycled_after_max_tasks(text_files):
+    results = list(extract_many(text_files, workers=1, max_tasks_per_worker=2))
+    pids = [r.pid for r in results]
+    assert len(set(pids)) == len(text_files) // 2
+    assert pids[0] == pids[1] != pids[2]
+
+
+_HOARD: list[bytes] = []
+
+
+def _hoarding_file_load(self):
+    _HOARD.append(b"x" * (64 << 20))
+    return f"text of {self.file.file_name}"
+
+
+def test_worker_recycled_when_rss_grows(text_files, monkeypatch):
+    monkeypatch.setattr(WordLoader, "file_load", _hoarding_file_load)
+    results = list(
+        extract_many(
+            text_files[:3], workers=1, max_rss_mb=32, start_method="fork"
+        )
+    )
+    assert all(r.ok for r in results)
+    assert len({r.pid for r in results}) == 3
+
+
+def test_inherited_memory_does_not_count_against_rss_ceiling(text_files):
+    # A forked worker starts with the parent's footprint; only growth
+    # after startup should trigger recycling
+    ballast = b"x" * (128 << 20)
+    results = list(
+        extract_many(
+            text_files[:3], workers=1, max_rss_mb=64, start_method="fork"
+        )
+    )
+    del ballast
+    assert all(r.ok for r in results)
+    assert len({r.pid for r in results}) == 1
+
+
+def test_input_is_consumed_lazily(text_files):
+    consumed = []
+
+    def paths():
+        for path in text_files:
+            consumed.append(path)
+            yield path
+
+    results = extract_many(paths(), workers=2)
+    first = next(results)
+    assert first.index == 0
+    assert len(consumed) < len(text_files)
+    results.close()
+
+
+def test_loader_kwargs_and_cache_are_passed_to_workers(text_files, tmp_path):
+    with ResultCache(tmp_path / "cache.sqlite3") as cache:
+        # Create the database (and switch it to WAL) before the workers
+        # open it, so they never race to initialise it
+        assert cache.stats()["entries"] == 0
+        results = list(extract_many(text_files, workers=2, cache=cache))
+        assert [r.error for r in results] == [None] * len(text_files)
+        assert cache.stats()["entries"] == len(text_files)
+
+
+def test_invalid_workers():
+    with pytest.raises(ValueError, match="workers"):
+        extract_many([], workers=-1)
+    with pytest.raises(ValueError, match="workers"):
+        extract_many([], workers=0)
+    with pytest.raises(ValueError, match="max_tasks_per_worker"):
+        extract_many([], max_tasks_per_worker=0)
+
+
+def test_empty_input():
+    assert list(extract_many([], workers=2)) == []
@@ -0,0 +1,224 @@
+"""
+Tests for ResultCache (content-addressed on-disk result cache).
+"""
+
+import pickle
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from TextSpitter import ResultCache, TextChunker, TextNormalizer, TextSpitter
+from TextSpitter.core import FileExtractor
+from TextSpitter.main import WordLoader
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+@pytest.fixture
+def cache(tmp_path):
+    with ResultCache(tmp_path / "cache.sqlite3") as result_cache:
+        yield result_cache
+
+
+@pytest.fixture
+def notes(tmp_path):
+    path = tmp_path / "notes.txt"
+    path.write_text("Hello   cached\n\nworld", encoding="utf-8")
+    return path
+
+
+# ---------------------------------------------------------------------------
+# Text stage
+# ---------------------------------------------------------------------------
+
+def test_second_extraction_is_served_from_cache(cache, notes, mocker):
+    read = mocker.spy(FileExtractor, "text_file_read")
+    assert TextSpitter(str(notes), cache=cache) == "Hello   cached\n\nworld"
+    assert TextSpitter(str(notes), cache=cache) == "Hello   cached\n\nworld"
+    assert read.call_count == 1
+    assert cache.stats()["hits"] == 1
+
+
+def test_key_is_content_addressed(cache, notes, tmp_path):
+    copy = tmp_path / "copy.txt"
+    copy.write_bytes(notes.read_bytes())
+    assert cache.key(FileExtractor(notes)) == cache.key(FileExtractor(copy))
+
+    copy.write_text("different", encoding="utf-8")
+    assert cache.key(FileExtractor(notes)) != cache.key(FileExtractor(copy))
+
+
+def test_key_includes_extractor_config(cache, notes):
+    assert cache.key(FileExtractor(notes)) != cache.key(
+        FileExtractor(notes, max_pages=1)
+    )
+
+
+def test_modified_file_is_re_extracted(cache, notes):
+    assert WordLoader(notes, cache=cache).file_load().startswith("Hello")
+    notes.write_text("Changed", encoding="utf-8")
+    assert WordLoader(notes, cache=cache).file_load() == "Changed"
+
+
+def test_empty_text_is_cached(cache, tmp_path, mocker):
+    empty = tmp_path / "empty.txt"
+    empty.write_bytes(b"")
+    read = mocker.spy(FileExtractor, "text_file_read")
+    assert TextSpitter(str(empty), cache=cache) == ""
+    assert TextSpitter(str(empty), cache=cache) == ""
+    assert read.call_count == 1
+
+
+def test_failed_extraction_is_not_cached(cache, tmp_path, mocker):
+    broken = tmp_path / "broken.docx"
+    broken.write_bytes(b"not a zip archive")
+    read = mocker.spy(FileExtractor, "docx_file_read")
+    assert TextSpitter(str(broken), cache=cache) == ""
+    assert TextSpitter(str(broken), cache=cache) == ""
+    assert read.call_count == 2
+    assert cache.stats()["entries"] == 0
+
+
+@pytest.mark.parametrize("module", ["pymupdf", "_tiktoken"])
+def test_key_includes_installed_backends(cache, notes, monkeypatch, module):
+    from TextSpitter import cache as cache_module
+
+    before = cache.key(FileExtractor(notes))
+    proxy = getattr(cache_module, module)
+    installed = proxy.installed()
+    monkeypatch.setattr(proxy, "installed", lambda: not installed)
+    assert cache.key(FileExtractor(notes)) != before
+
+
+# ---------------------------------------------------------------------------
+# Normalize / chunk stages
+# ---------------------------------------------------------------------------
+
+def test_process_caches_every_stage(cache, notes, mocker):
+    normalizer = TextNormalizer()
+    chunker = TextChunker(max_tokens=50, min_tokens=1)
+    first = cache.process(notes, normalizer=normalizer, chunker=chunker)
+    assert first.normalized == normalizer.normalize(first.text)
+    assert [c.text for c in first.chunks] == [
+        c.text for c in chunker.chunk(first.normalized)
+    ]
+
+    normalize = mocker.spy(normalizer, "normalize")
+    second = cache.process(notes, normalizer=normalizer, chunker=chunker)
+    normalize.assert_not_called()
+    assert second.text == first.text
+    assert second.normalized == first.normalized
+    assert [
+        (c.text, c.token_count, c.char_start, c.char_end, c.chunk_index)
+        for c in second.chunks
+    ] == [
+        (c.text, c.token_count, c.char_start, c.char_end, c.chunk_index)
+        for c in first.chunks
+    ]
+    assert cache.stats()["entries"] == 3
+
+
+def test_changing_chunker_reuses_earlier_stages(cache, notes):
+    normalizer = TextNormalizer()
+    cache.process(notes, normalizer=normalizer, chunker=TextChunker(max_tokens=500))
+    hits = cache.stats()["hits"]
+    cache.process(notes, normalizer=normalizer, chunker=TextChunker(max_tokens=600))
+    stats = cache.stats()
+    assert stats["hits"] == hits + 2  # text and normalized
+    assert stats["entries"] == 4
+
+
+def test_process_without_stages(cache, notes):
+    result = cache.process(notes)
+    assert result == (notes.read_text(encoding="utf-8"), None, None)
+
+
+def test_failed_read_does_not_cache_later_stages(cache, notes, monkeypatch):
+    real_read = FileExtractor.text_file_read
+    calls = []
+
+    def fails_once(self):
+        calls.append(self)
+        if len(calls) == 1:
+            self.read_error = "OSError: transient"
+            return ""
+        return real_read(self)
+
+    monkeypatch.setattr(FileExtractor, "text_file_read", fails_once)
+    normalizer = TextNormalizer()
+    chunker = TextChunker(max_tokens=50, min_tokens=1)
+
+    failed = cache.process(notes, normalizer=normalizer, chunker=chunker)
+    assert failed == ("", "", [])
+    assert cache.stats()["entries"] == 0
+
+    result = cache.process(notes, normalizer=normalizer, chunker=chunker)
+    assert result.text == "Hello   cached\n\nworld"
+    assert result.normalized == normalizer.normalize(result.text)
+    assert result.chunks
+
+
+# ---------------------------------------------------------------------------
+# Eviction and sharing
+# ---------------------------------------------------------------------------
+
+def test_lru_eviction_respects_size_cap(tmp_path):
+    cache = ResultCache(tmp_path / "small.sqlite3", max_bytes=4096)
+    # Hex of random bytes: roughly 1 KiB each after compression
+    payloads = {f"k{i}": random.Random(i).randbytes(1024).hex() for i in range(8)}
+    for key in ("k0", "k1", "k2"):
+        cache.put(key, "text", payloads[key])
+    assert cache.get("k0") == payloads["k0"]  # k0 is now most recently used
+    for key in ("k3", "k4", "k5", "k6", "k7"):
+        cache.put(key, "text", payloads[key])
+
+    stats = cache.stats()
+    assert stats["bytes"] <= 4096
+    assert cache.get("k7") == payloads["k7"]
+    assert cache.get("k1") is None  # least recently used goes first
+    cache.close()
+
+
+def test_oversized_entry_is_not_stored(tmp_path):
+    cache = ResultCache(tmp_path / "tiny.sqlite3", max_bytes=64)
+    cache.put("big", "text", random.Random(0).randbytes(256).hex())
+    assert cache.get("big") is None
+    cache.close()
+
+
+def test_invalid_max_bytes():
+    with pytest.raises(ValueError, match="max_bytes"):
+        ResultCache(max_bytes=0)
+
+
+def _write_entries(path, worker):
+    with ResultCache(path) as cache:
+        for i in range(25):
+            cache.put(f"{worker}-{i}", "text", f"value {worker} {i}")
+    return worker
+
+
+def test_concurrent_processes(tmp_path):
+    path = tmp_path / "shared.sqlite3"
+    with ProcessPoolExecutor(max_workers=4) as pool:
+        list(pool.map(_write_entries, [path] * 4, range(4)))
+    with ResultCache(path) as cache:
+        assert cache.stats()["entries"] == 100
+        assert cache.get("3-24") == "value 3 24"
+
+
+def test_pickled_cache_opens_its_own_connection(cache, notes):
+    TextSpitter(str(notes), cache=cache)
+    copy = pickle.loads(pickle.dumps(cache))
+    assert copy.path == cache.path
+    assert TextSpitter(str(notes), cache=copy) == "Hello   cached\n\nworld"
+    assert copy.stats()["hits"] == 1
+    copy.close()
+
+
+def test_clear(cache, notes):
+    TextSpitter(str(notes), cache=cache)
+    cache.clear()
+    assert cache.stats()["entries"] == 0
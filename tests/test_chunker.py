@@ -39,6 +39,17 @@ def test_instantiation_defaults(Chunker):
     assert chunker is not None
 
 
+def test_config_round_trips(Chunker):
+    config = {
+        "max_tokens": 300,
+        "min_tokens": 10,
+        "tokenizer": "cl100k_base",
+        "preserve_tables": False,
+        "section_patterns": [r"^# "],
+    }
+    assert Chunker(**config).config() == config
+
+
 def test_min_tokens_gt_max_tokens_raises(Chunker):
     with pytest.raises((ValueError, Exception)):
         Chunker(max_tokens=100, min_tokens=200)
@@ -253,6 +264,99 @@ def test_chunk_batch_large_parallel():
     assert all(len(r) >= 1 for r in results)
 
 
+# ---------------------------------------------------------------------------
+# chunk_iter()
+# ---------------------------------------------------------------------------
+
+def test_chunk_iter_matches_chunk(Chunker):
+    chunker = Chunker(max_tokens=20, min_tokens=1)
+    streamed = list(chunker.chunk_iter(THREE_PARAS))
+    collected = chunker.chunk(THREE_PARAS)
+    assert [c.text for c in streamed] == [c.text for c in collected]
+    assert [c.token_count for c in streamed] == [c.token_count for c in collected]
+
+
+def test_chunk_iter_indices_and_no_total(Chunker):
+    chunker = Chunker(max_tokens=20, min_tokens=1)
+    streamed = list(chunker.chunk_iter(THREE_PARAS))
+    assert [c.chunk_index for c in streamed] == list(range(len(streamed)))
+    assert all(c.total_chunks is None for c in streamed)
+
+
+def test_chunk_iter_empty_string(Chunker):
+    chunker = Chunker()
+    assert list(chunker.chunk_iter("")) == []
+
+
+def test_chunk_iter_early_stop(Chunker):
+    chunker = Chunker(max_tokens=10, min_tokens=1)
+    text = "\n\n".join(f"Paragraph number {i} with a few words." for i in range(200))
+    it = iter(chunker.chunk_iter(text))
+    first = next(it)
+    assert first.chunk_index == 0
+    del it  # dropping the iterator must not hang the producer
+
+
+# ---------------------------------------------------------------------------
+# chunk_batch(columnar=True)
+# ---------------------------------------------------------------------------
+
+def test_columnar_batch_rows_match_lists(Chunker):
+    chunker = Chunker(max_tokens=20, min_tokens=1)
+    texts = [SHORT_TEXT, THREE_PARAS, "", "Another short text."]
+    lists = chunker.chunk_batch(texts)
+    batch = chunker.chunk_batch(texts, columnar=True)
+    flat = [c for doc in lists for c in doc]
+    assert len(batch) == len(flat)
+    assert batch.num_documents == len(texts)
+    for b, c in zip(batch, flat, strict=True):
+        assert b.text == c.text
+        assert b.token_count == c.token_count
+        assert (b.char_start, b.char_end) == (c.char_start, c.char_end)
+        assert b.chunk_index == c.chunk_index
+        assert b.total_chunks == c.total_chunks
+    assert batch[-1].text == flat[-1].text
+
+
+def test_columnar_batch_buffers(Chunker):
+    chunker = Chunker(max_tokens=20, min_tokens=1)
+    texts = [SHORT_TEXT, THREE_PARAS]
+    lists = chunker.chunk_batch(texts)
+    batch = chunker.chunk_batch(texts, columnar=True)
+    offsets = memoryview(batch.text_offsets)
+    assert offsets.format == "Q"
+    assert len(offsets) == len(batch) + 1
+    text = bytes(memoryview(batch.text_buffer))
+    flat = [c for doc in lists for c in doc]
+    for i, c in enumerate(flat):
+        assert text[offsets[i] : offsets[i + 1]].decode("utf-8") == c.text
+    assert list(memoryview(batch.token_counts)) == [c.token_count for c in flat]
+    assert memoryview(batch.doc_ids).format == "I"
+    assert list(memoryview(batch.doc_offsets)) == [0, len(lists[0]), len(flat)]
+
+
+def test_columnar_batch_document_and_to_lists(Chunker):
+    chunker = Chunker(max_tokens=20, min_tokens=1)
+    texts = [SHORT_TEXT, THREE_PARAS]
+    lists = chunker.chunk_batch(texts)
+    batch = chunker.chunk_batch(texts, columnar=True)
+    assert [c.text for c in batch.document(1)] == [c.text for c in lists[1]]
+    assert [[c.text for c in d] for d in batch.to_lists()] == [
+        [c.text for c in d] for d in lists
+    ]
+    with pytest.raises(IndexError):
+        batch.document(2)
+    with pytest.raises(IndexError):
+        batch[len(batch)]
+
+
+def test_columnar_batch_empty(Chunker):
+    batch = Chunker().chunk_batch([], columnar=True)
+    assert len(batch) == 0
+    assert batch.num_documents == 0
+    assert list(batch) == []
+
+
 # ---------------------------------------------------------------------------
 # Rust-specific Chunk repr
 # ---------------------------------------------------------------------------
@@ -3,6 +3,7 @@ Tests for the textspitter CLI entry point (TextSpitter.cli:main).
 """
 
 import sys
+import time
 
 import pytest
 
@@ -181,3 +182,632 @@ def test_cli_latin1_file(tmp_path, monkeypatch):
 
     assert code == 0
     assert len(stdout) > 0
+
+
+# ---------------------------------------------------------------------------
+# Parallel jobs
+# ---------------------------------------------------------------------------
+
+
+def test_cli_jobs_preserves_order(tmp_path, monkeypatch):
+    """-j N should produce the same output, in the same order, as serial."""
+    paths = []
+    for i in range(6):
+        path = tmp_path / f"f{i}.txt"
+        path.write_text(f"content {i}", encoding="utf-8")
+        paths.append(str(path))
+
+    stdout, _, code = run_cli(paths + ["-j", "3"], monkeypatch)
+
+    assert stdout == "\n".join(f"content {i}" for i in range(6)) + "\n"
+    assert code == 0
+
+
+def test_cli_jobs_reports_missing_files(tmp_path, monkeypatch):
+    """Missing files are reported on stderr with -j as without it."""
+    good = tmp_path / "good.txt"
+    good.write_text("still extracted", encoding="utf-8")
+    missing = tmp_path / "missing.txt"
+
+    stdout, stderr, code = run_cli(
+        [str(missing), str(good), "--jobs", "2"], monkeypatch
+    )
+
+    assert "still extracted" in stdout
+    assert f"Error processing {str(missing)!r}: file not found" in stderr
+    assert code == 1
+
+
+def test_cli_jobs_reports_errors_like_serial(tmp_path, monkeypatch):
+    """Extraction errors read the same with -j 1 and -j 2."""
+    from functools import partial
+
+    import TextSpitter as package
+    from TextSpitter.main import WordLoader
+
+    real_load = WordLoader.file_load
+
+    def failing(self):
+        if self.file.file_name == "a.txt":
+            raise ValueError("boom")
+        return real_load(self)
+
+    paths = []
+    for name in ("a.txt", "b.txt"):
+        path = tmp_path / name
+        path.write_text(name, encoding="utf-8")
+        paths.append(str(path))
+    monkeypatch.setattr(WordLoader, "file_load", failing)
+    # Forked workers inherit the patched loader
+    monkeypatch.setattr(
+        package,
+        "extract_many",
+        partial(package.extract_many, start_method="fork"),
+    )
+
+    with pytest.MonkeyPatch.context() as mp:
+        _, serial, _ = run_cli(paths + ["-j", "1"], mp)
+    with pytest.MonkeyPatch.context() as mp:
+        _, parallel, _ = run_cli(paths + ["-j", "2"], mp)
+
+    assert serial == f"Error processing {paths[0]!r}: boom\n"
+    assert parallel == serial
+
+
+def test_cli_negative_jobs(tmp_path, monkeypatch):
+    """A negative job count is rejected by argparse."""
+    src = tmp_path / "a.txt"
+    src.write_text("a", encoding="utf-8")
+
+    _, _, code = run_cli([str(src), "-j", "-1"], monkeypatch)
+
+    assert code == 2
+
+
+# ---------------------------------------------------------------------------
+# Streaming output
+# ---------------------------------------------------------------------------
+
+
+def test_cli_output_is_written_as_files_complete(tmp_path, monkeypatch):
+    """Files finished before an interruption are already in the output."""
+    import TextSpitter as package
+
+    first = tmp_path / "first.txt"
+    second = tmp_path / "second.txt"
+    first.write_text("first", encoding="utf-8")
+    second.write_text("second", encoding="utf-8")
+    out = tmp_path / "out.txt"
+
+    real = package.TextSpitter
+
+    def interrupt_on_second(filename):
+        if filename == str(second):
+            raise KeyboardInterrupt
+        return real(filename=filename)
+
+    monkeypatch.setattr(package, "TextSpitter", interrupt_on_second)
+
+    with pytest.raises(KeyboardInterrupt):
+        run_cli([str(first), str(second), "-o", str(out)], monkeypatch)
+
+    assert out.read_text(encoding="utf-8") == "first"
+
+
+def test_cli_errors_do_not_stop_later_files(tmp_path, monkeypatch):
+    """An error is reported and extraction continues with the next file."""
+    good = tmp_path / "good.txt"
+    good.write_text("after the error", encoding="utf-8")
+    out = tmp_path / "out.txt"
+
+    _, stderr, code = run_cli(
+        [str(tmp_path / "missing.txt"), str(good), "-o", str(out)], monkeypatch
+    )
+
+    assert out.read_text(encoding="utf-8") == "after the error"
+    assert "missing.txt" in stderr
+    assert code == 1
+
+
+def test_cli_as_completed(tmp_path, monkeypatch):
+    """--as-completed writes every file, in completion order."""
+    paths = []
+    for i in range(4):
+        path = tmp_path / f"f{i}.txt"
+        path.write_text(f"content {i}", encoding="utf-8")
+        paths.append(str(path))
+
+    stdout, _, code = run_cli(paths + ["-j", "2", "--as-completed"], monkeypatch)
+
+    assert sorted(stdout.splitlines()) == [f"content {i}" for i in range(4)]
+    assert code == 0
+
+
+# ---------------------------------------------------------------------------
+# Directory and list input
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def tree(tmp_path):
+    """docs/{a.txt, b.md, sub/c.txt, build/d.txt}"""
+    root = tmp_path / "docs"
+    (root / "sub").mkdir(parents=True)
+    (root / "build").mkdir()
+    (root / "a.txt").write_text("alpha", encoding="utf-8")
+    (root / "b.md").write_text("bravo", encoding="utf-8")
+    (root / "sub" / "c.txt").write_text("charlie", encoding="utf-8")
+    (root / "build" / "d.txt").write_text("delta", encoding="utf-8")
+    return root
+
+
+def test_cli_walks_directories_in_name_order(tree, monkeypatch):
+    stdout, _, code = run_cli([str(tree)], monkeypatch)
+
+    assert stdout.splitlines() == ["alpha", "bravo", "delta", "charlie"]
+    assert code == 0
+
+
+@pytest.mark.parametrize(
+    ("flags", "expected"),
+    [
+        (["--exclude", "build", "--ext", ".TXT"], ["alpha", "charlie"]),
+        (["--include", "sub/*"], ["charlie"]),
+        (["--ext", "md,txt", "--exclude", "*.txt"], ["bravo"]),
+    ],
+)
+def test_cli_include_exclude_and_ext(tree, monkeypatch, flags, expected):
+    stdout, _, _ = run_cli([str(tree)] + flags, monkeypatch)
+
+    assert stdout.splitlines() == expected
+
+
+def test_cli_explicit_files_are_not_filtered(tree, monkeypatch):
+    stdout, _, _ = run_cli([str(tree / "b.md"), "--ext", "txt"], monkeypatch)
+
+    assert stdout.splitlines() == ["bravo"]
+
+
+def test_cli_symlinks_skipped_unless_followed(tree, tmp_path, monkeypatch):
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    (outside / "e.txt").write_text("echo", encoding="utf-8")
+    (tree / "link").symlink_to(outside, target_is_directory=True)
+    (tree / "sub" / "loop").symlink_to(tree, target_is_directory=True)
+
+    with pytest.MonkeyPatch.context() as mp:
+        stdout, _, _ = run_cli([str(tree)], mp)
+    assert "echo" not in stdout
+
+    stdout, _, code = run_cli([str(tree), "--follow-symlinks"], monkeypatch)
+    assert stdout.splitlines().count("echo") == 1
+    assert stdout.splitlines().count("alpha") == 1  # cycle not re-entered
+    assert code == 0
+
+
+def test_cli_files_from_stdin_null_separated(tree, monkeypatch):
+    from io import BytesIO, TextIOWrapper
+
+    listing = f"{tree / 'a.txt'}\0{tree / 'sub'}\0".encode()
+    monkeypatch.setattr(sys, "stdin", TextIOWrapper(BytesIO(listing)))
+
+    stdout, _, code = run_cli(["--files-from", "-", "-0"], monkeypatch)
+
+    assert stdout.splitlines() == ["alpha", "charlie"]
+    assert code == 0
+
+
+def test_cli_files_from_file(tree, tmp_path, monkeypatch):
+    listing = tmp_path / "list.txt"
+    listing.write_text(
+        f"{tree / 'b.md'}\r\n\n{tree / 'missing.txt'}\n", encoding="utf-8"
+    )
+
+    stdout, stderr, code = run_cli(
+        ["--files-from", str(listing), "-j", "2"], monkeypatch
+    )
+
+    assert stdout.splitlines() == ["bravo"]
+    assert "missing.txt" in stderr
+    assert code == 1
+
+
+def test_cli_walk_feeds_files_lazily(tree, monkeypatch):
+    """The first file is extracted before the walk reaches the last one."""
+    from TextSpitter import cli
+
+    events = []
+    real_walk = cli._walk
+
+    def recording_walk(root, walk_filter):
+        for item in real_walk(root, walk_filter):
+            events.append(("found", item[0]))
+            yield item
+
+    import TextSpitter as package
+
+    real_extract = package.TextSpitter
+
+    def recording_extract(filename):
+        events.append(("extracted", filename))
+        return real_extract(filename=filename)
+
+    monkeypatch.setattr(cli, "_walk", recording_walk)
+    monkeypatch.setattr(package, "TextSpitter", recording_extract)
+
+    run_cli([str(tree)], monkeypatch)
+
+    assert events[:2] == [
+        ("found", str(tree / "a.txt")),
+        ("extracted", str(tree / "a.txt")),
+    ]
+
+
+def _gated_extract_many(release):
+    """extract_many stand-in that holds every result until `release`."""
+    from TextSpitter import ExtractionResult
+
+    def extract_many(paths, workers=None, ordered=True):
+        for index, path in enumerate(paths):
+            assert release.wait(5)
+            yield ExtractionResult(index, path, f"text of {path}", None, 0, 0)
+
+    return extract_many
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+def test_resolved_inputs_are_not_held_for_the_pool(monkeypatch, ordered):
+    import threading
+
+    from TextSpitter import cli
+
+    release = threading.Event()
+    monkeypatch.setattr(
+        "TextSpitter.extract_many", _gated_extract_many(release)
+    )
+    inputs = [
+        ("gone.txt", (None, "file not found")),
+        ("slow.txt", None),
+        ("same.txt", ("reused", None)),
+    ]
+    results = cli._extract(iter(inputs), jobs=2, ordered=ordered)
+
+    # Yielded while the pool is still holding slow.txt
+    assert next(results) == ("gone.txt", None, "file not found")
+    if not ordered:
+        assert next(results) == ("same.txt", "reused", None)
+    release.set()
+    rest = list(results)
+    assert ("slow.txt", "text of slow.txt", None) in rest
+    if ordered:
+        assert rest[-1] == ("same.txt", "reused", None)
+
+
+def test_inputs_held_behind_slow_file_are_bounded(monkeypatch):
+    import threading
+
+    from TextSpitter import cli
+
+    release = threading.Event()
+    monkeypatch.setattr(
+        "TextSpitter.extract_many", _gated_extract_many(release)
+    )
+    consumed = []
+
+    def inputs():
+        yield "slow.txt", None
+        for i in range(100):
+            consumed.append(i)
+            yield f"{i}.txt", ("reused", None)
+
+    output = []
+    reader = threading.Thread(
+        target=lambda: output.extend(cli._extract(inputs(), jobs=2))
+    )
+    reader.start()
+    time.sleep(0.2)
+    # jobs * 4 pending inputs, plus the one that reached the limit
+    assert len(consumed) <= 2 * 4 + 1
+    release.set()
+    reader.join(5)
+
+    assert [path for path, _, _ in output] == ["slow.txt"] + [
+        f"{i}.txt" for i in range(100)
+    ]
+
+
+def test_pool_is_not_started_without_files_to_extract(monkeypatch):
+    from TextSpitter import cli
+
+    def unexpected(*args, **kwargs):
+        raise AssertionError("extract_many called")
+
+    monkeypatch.setattr("TextSpitter.extract_many", unexpected)
+    inputs = [(f"{i}.txt", ("reused", None)) for i in range(3)]
+
+    results = list(cli._extract(iter(inputs), jobs=4))
+
+    assert [r[0] for r in results] == ["0.txt", "1.txt", "2.txt"]
+
+
+# ---------------------------------------------------------------------------
+# JSONL pipeline
+# ---------------------------------------------------------------------------
+
+
+def _records(stdout):
+    import json
+
+    return [json.loads(line) for line in stdout.splitlines()]
+
+
+def test_cli_jsonl_writes_one_record_per_chunk(tree, monkeypatch):
+    stdout, _, code = run_cli(
+        [str(tree / "a.txt"), str(tree / "b.md"), "--format", "jsonl"],
+        monkeypatch,
+    )
+
+    records = _records(stdout)
+    assert [r["path"] for r in records] == [
+        str(tree / "a.txt"),
+        str(tree / "b.md"),
+    ]
+    assert records[0]["text"] == "alpha"
+    assert set(records[0]) == {
+        "path",
+        "chunk_index",
+        "total_chunks",
+        "char_start",
+        "char_end",
+        "token_count",
+        "section_title",
+        "text",
+    }
+    assert records[0]["char_end"] - records[0]["char_start"] == 5
+    assert records[0]["token_count"] > 0
+    assert code == 0
+
+
+def test_cli_jsonl_uses_batch_apis(tree, monkeypatch):
+    """Files are normalized and chunked in batches of --batch-size."""
+    from TextSpitter import _fallback
+
+    batches = []
+    real_chunk_batch = _fallback.TextChunker.chunk_batch
+
+    def recording(self, texts, columnar=False):
+        batches.append(len(texts))
+        return real_chunk_batch(self, texts, columnar)
+
+    # Methods of the Rust extension types cannot be patched
+    monkeypatch.setattr("TextSpitter.TextChunker", _fallback.TextChunker)
+    monkeypatch.setattr(_fallback.TextChunker, "chunk_batch", recording)
+
+    stdout, _, _ = run_cli(
+        [str(tree), "--format", "jsonl", "--batch-size", "3"], monkeypatch
+    )
+
+    assert batches == [3, 1]
+    assert len(_records(stdout)) == 4
+
+
+def test_cli_jsonl_splits_long_text(tmp_path, monkeypatch):
+    long = tmp_path / "long.txt"
+    long.write_text(
+        "\n\n".join(f"Paragraph {i} " + "word " * 40 for i in range(20)),
+        encoding="utf-8",
+    )
+    out = tmp_path / "chunks.jsonl"
+
+    _, _, code = run_cli(
+        [
+            str(long),
+            "--format",
+            "jsonl",
+            "--max-tokens",
+            "100",
+            "--min-tokens",
+            "10",
+            "-o",
+            str(out),
+        ],
+        monkeypatch,
+    )
+
+    records = _records(out.read_text(encoding="utf-8"))
+    assert len(records) > 1
+    assert [r["chunk_index"] for r in records] == list(range(len(records)))
+    assert all(r["total_chunks"] == len(records) for r in records)
+    assert code == 0
+
+
+def test_cli_jsonl_records_files_without_chunks(tmp_path, monkeypatch):
+    empty = tmp_path / "empty.txt"
+    empty.write_bytes(b"")
+    full = tmp_path / "full.txt"
+    full.write_text("alpha", encoding="utf-8")
+
+    stdout, _, code = run_cli(
+        [str(empty), str(full), "--format", "jsonl"], monkeypatch
+    )
+
+    records = _records(stdout)
+    assert records[0] == {"path": str(empty), "total_chunks": 0}
+    assert records[1]["text"] == "alpha"
+    assert code == 0
+
+
+def test_cli_jsonl_invalid_chunker_settings(tree, monkeypatch):
+    _, _, code = run_cli(
+        [
+            str(tree),
+            "--format",
+            "jsonl",
+            "--max-tokens",
+            "10",
+            "--min-tokens",
+            "20",
+        ],
+        monkeypatch,
+    )
+
+    assert code == 2
+
+
+# ---------------------------------------------------------------------------
+# Incremental runs
+# ---------------------------------------------------------------------------
+
+
+def _run_fresh(args):
+    """run_cli with its own patch context, so it can be called repeatedly."""
+    with pytest.MonkeyPatch.context() as mp:
+        return run_cli(args, mp)
+
+
+def _count_extractions(monkeypatch):
+    import TextSpitter as package
+
+    calls = []
+    real = package.TextSpitter
+
+    def counting(filename):
+        calls.append(filename)
+        return real(filename=filename)
+
+    monkeypatch.setattr(package, "TextSpitter", counting)
+    return calls
+
+
+def test_cli_incremental_skips_unchanged_files(tree, tmp_path, monkeypatch):
+    manifest = str(tmp_path / "manifest.sqlite3")
+    calls = _count_extractions(monkeypatch)
+
+    first, _, _ = _run_fresh([str(tree), "--incremental", manifest])
+    assert first.splitlines() == ["alpha", "bravo", "delta", "charlie"]
+    assert len(calls) == 4
+
+    (tree / "a.txt").write_text("alpha v2", encoding="utf-8")
+    second, _, code = _run_fresh([str(tree), "--incremental", manifest])
+
+    assert second.splitlines() == ["alpha v2"]
+    assert calls[4:] == [str(tree / "a.txt")]
+    assert code == 0
+
+
+def test_cli_incremental_touch_is_unchanged(tree, tmp_path, monkeypatch):
+    import os
+
+    manifest = str(tmp_path / "manifest.sqlite3")
+    calls = _count_extractions(monkeypatch)
+    _run_fresh([str(tree), "--incremental", manifest])
+
+    st = (tree / "b.md").stat()
+    os.utime(tree / "b.md", ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    stdout, _, _ = _run_fresh([str(tree), "--incremental", manifest])
+
+    assert stdout == ""
+    assert len(calls) == 4
+
+
+def test_cli_incremental_reuse(tree, tmp_path, monkeypatch):
+    manifest = str(tmp_path / "manifest.sqlite3")
+    calls = _count_extractions(monkeypatch)
+    args = [str(tree), "--incremental", manifest, "--unchanged", "reuse"]
+
+    first, _, _ = _run_fresh(args)
+    second, _, _ = _run_fresh(args + ["-j", "2"])
+
+    assert second == first
+    assert len(calls) == 4
+
+
+def test_cli_incremental_output_file_keeps_unchanged_text(
+    tree, tmp_path, monkeypatch
+):
+    manifest = str(tmp_path / "manifest.sqlite3")
+    out = tmp_path / "out.txt"
+    calls = _count_extractions(monkeypatch)
+    args = [str(tree), "--incremental", manifest, "-o", str(out)]
+
+    _run_fresh(args)
+    (tree / "b.md").write_text("bravo v2", encoding="utf-8")
+    _, _, code = _run_fresh(args)
+
+    assert out.read_text(encoding="utf-8").splitlines() == [
+        "alpha",
+        "bravo v2",
+        "delta",
+        "charlie",
+    ]
+    assert len(calls) == 5
+    assert code == 0
+
+
+def test_cli_incremental_skip_into_text_file_is_rejected(tree, tmp_path):
+    args = [
+        str(tree),
+        "--incremental",
+        str(tmp_path / "manifest.sqlite3"),
+        "--unchanged",
+        "skip",
+        "-o",
+        str(tmp_path / "out.txt"),
+    ]
+
+    _, _, code = _run_fresh(args)
+
+    assert code == 2
+
+
+def test_cli_incremental_settings_change_reprocesses(tree, tmp_path, monkeypatch):
+    manifest = str(tmp_path / "manifest.sqlite3")
+    calls = _count_extractions(monkeypatch)
+    _run_fresh([str(tree), "--incremental", manifest])
+
+    stdout, _, _ = _run_fresh(
+        [str(tree), "--incremental", manifest, "--format", "jsonl"]
+    )
+
+    assert len(calls) == 8
+    assert len(_records(stdout)) == 4
+
+
+def test_cli_incremental_jsonl_marks_unchanged(tree, tmp_path, monkeypatch):
+    manifest = str(tmp_path / "manifest.sqlite3")
+    args = [str(tree), "--incremental", manifest, "--format", "jsonl"]
+    _run_fresh(args)
+
+    (tree / "b.md").write_text("bravo v2", encoding="utf-8")
+    stdout, _, _ = run_cli(args, monkeypatch)
+
+    records = _records(stdout)
+    assert [r.get("unchanged", False) for r in records] == [
+        True,
+        False,
+        True,
+        True,
+    ]
+    assert records[1]["text"] == "bravo v2"
+
+
+def test_cli_incremental_failed_files_are_retried(tree, tmp_path, monkeypatch):
+    manifest = str(tmp_path / "manifest.sqlite3")
+    import TextSpitter as package
+
+    real = package.TextSpitter
+
+    def failing(filename):
+        if filename.endswith("a.txt"):
+            raise RuntimeError("boom")
+        return real(filename=filename)
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(package, "TextSpitter", failing)
+        _, stderr, code = run_cli([str(tree), "--incremental", manifest], mp)
+    assert "boom" in stderr
+    assert code == 1
+
+    stdout, _, code = run_cli([str(tree), "--incremental", manifest], monkeypatch)
+    assert stdout.splitlines() == ["alpha"]
+    assert code == 0
@@ -2,15 +2,29 @@
 Tests for the detect_encoding function (Rust and Python fallback paths).
 """
 
+import io
+
 import pytest
 
-from TextSpitter import _RUST_AVAILABLE, detect_encoding
+from TextSpitter import (
+    _RUST_AVAILABLE,
+    decode_auto,
+    detect_encoding,
+    detect_encoding_batch,
+    detect_encoding_stream,
+)
+from TextSpitter._fallback import decode_auto as fallback_decode_auto
 from TextSpitter._fallback import detect_encoding as fallback_detect
+from TextSpitter._fallback import detect_encoding_batch as fallback_detect_batch
+from TextSpitter._fallback import (
+    detect_encoding_stream as fallback_detect_stream,
+)
 
 # ---------------------------------------------------------------------------
 # Fixtures
 # ---------------------------------------------------------------------------
 
+
 @pytest.fixture(params=["rust", "fallback"])
 def detect(request):
     if request.param == "rust":
@@ -20,10 +34,38 @@ def detect(request):
     return fallback_detect
 
 
+@pytest.fixture(params=["rust", "fallback"])
+def batch(request):
+    if request.param == "rust":
+        if not _RUST_AVAILABLE:
+            pytest.skip("Rust extension not available")
+        return detect_encoding_batch, detect_encoding
+    return fallback_detect_batch, fallback_detect
+
+
+@pytest.fixture(params=["rust", "fallback"])
+def decode(request):
+    if request.param == "rust":
+        if not _RUST_AVAILABLE:
+            pytest.skip("Rust extension not available")
+        return decode_auto
+    return fallback_decode_auto
+
+
+@pytest.fixture(params=["rust", "fallback"])
+def stream(request):
+    if request.param == "rust":
+        if not _RUST_AVAILABLE:
+            pytest.skip("Rust extension not available")
+        return detect_encoding_stream
+    return fallback_detect_stream
+
+
 # ---------------------------------------------------------------------------
 # Core behaviour (both paths)
 # ---------------------------------------------------------------------------
 
+
 def test_utf8_text(detect):
     data = "Hello, world!".encode("utf-8")
     assert detect(data) == "utf-8"
@@ -68,10 +110,145 @@ def test_return_value_is_valid_python_codec(detect):
             pytest.fail(f"detect_encoding returned invalid codec name: {enc!r}")
 
 
+# ---------------------------------------------------------------------------
+# detect_encoding_batch (both paths)
+# ---------------------------------------------------------------------------
+
+BATCH_SAMPLES = [
+    b"",
+    b"plain ascii",
+    "café résumé".encode("utf-8"),
+    b"\xef\xbb\xbfbom",
+    b"He said \x93hello\x94",
+    b"\x81\xfe\xff",
+]
+
+
+def test_batch_matches_single(batch):
+    detect_batch, detect = batch
+    assert detect_batch(BATCH_SAMPLES) == [detect(d) for d in BATCH_SAMPLES]
+
+
+def test_batch_empty(batch):
+    detect_batch, _ = batch
+    assert detect_batch([]) == []
+
+
+def test_batch_large(batch):
+    detect_batch, detect = batch
+    data = BATCH_SAMPLES * 500
+    result = detect_batch(data)
+    assert len(result) == len(data)
+    assert result[: len(BATCH_SAMPLES)] == [detect(d) for d in BATCH_SAMPLES]
+
+
+# ---------------------------------------------------------------------------
+# decode_auto (both paths)
+# ---------------------------------------------------------------------------
+
+
+def test_decode_auto_utf8(decode):
+    text = "café résumé naïve — ok"
+    assert decode(text.encode("utf-8")) == (text, "utf-8")
+
+
+def test_decode_auto_empty(decode):
+    assert decode(b"") == ("", "utf-8")
+
+
+def test_decode_auto_strips_bom(decode):
+    assert decode(b"\xef\xbb\xbfhello") == ("hello", "utf-8-sig")
+
+
+def test_decode_auto_agrees_with_detect_encoding(decode):
+    detect = detect_encoding if decode is decode_auto else fallback_detect
+    data = b"He said \x93hello\x94 to her"
+    text, codec = decode(data)
+    assert codec == detect(data)
+    assert text == data.decode(codec, errors="replace")
+
+
+def test_decode_auto_never_raises(decode):
+    text, codec = decode(b"\x81\xfe\xff\x8d")
+    assert isinstance(text, str)
+    assert isinstance(codec, str)
+
+
+@pytest.mark.parametrize("wrap", [bytearray, memoryview])
+def test_decode_auto_accepts_buffers(decode, wrap):
+    data = "café résumé".encode("utf-8")
+    assert decode(wrap(data)) == decode(data)
+    assert decode(wrap(b"\xef\xbb\xbfhi")) == ("hi", "utf-8-sig")
+
+
+def test_batch_accepts_buffers(batch):
+    detect_batch, detect = batch
+    buffers = [memoryview(d) for d in BATCH_SAMPLES]
+    assert detect_batch(buffers) == [detect(d) for d in BATCH_SAMPLES]
+
+
+# ---------------------------------------------------------------------------
+# detect_encoding_stream (both paths)
+# ---------------------------------------------------------------------------
+
+
+def test_stream_whole_input_is_exact(stream):
+    assert stream("café résumé".encode("utf-8")) == ("utf-8", 1.0)
+    assert stream(b"") == ("utf-8", 1.0)
+
+
+def test_stream_bom_split_across_chunks(stream):
+    assert stream(b"\xef\xbb\xbfhello", chunk_size=1) == ("utf-8-sig", 1.0)
+
+
+def test_stream_multibyte_split_across_chunks(stream):
+    data = "naïve — ✓".encode("utf-8")
+    assert stream(data, chunk_size=1) == ("utf-8", 1.0)
+    assert stream([data[:3], data[3:4], data[4:]]) == ("utf-8", 1.0)
+
+
+def test_stream_stops_at_sample_budget(stream):
+    codec, confidence = stream(b"plain ascii " * 10_000, sample_size=4096)
+    assert codec == "utf-8"
+    assert 0 < confidence < 1.0
+
+
+def test_stream_reads_only_the_sample(stream):
+    src = io.BytesIO(("é" * 100_000).encode("utf-8"))
+    codec, confidence = stream(src, sample_size=1024, chunk_size=256)
+    assert codec == "utf-8"
+    assert confidence < 1.0
+    assert src.tell() <= 1024
+
+
+def test_stream_path_and_pathlike(stream, tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_bytes("a,b\ncafé,1\n".encode("utf-8"))
+    assert stream(path) == ("utf-8", 1.0)
+    assert stream(str(path)) == ("utf-8", 1.0)
+
+
+def test_stream_non_utf8_matches_detect_encoding(stream):
+    detect = (
+        detect_encoding if stream is detect_encoding_stream else fallback_detect
+    )
+    data = b"He said \x93hello\x94 to her. " * 20
+    codec, confidence = stream(data, chunk_size=64)
+    assert codec == detect(data)
+    assert codec != "utf-8"
+    assert 0 < confidence <= 1.0
+
+
+def test_stream_truncated_sequence_at_end_is_not_utf8(stream):
+    codec, _ = stream(b"abc\xc3", chunk_size=2)
+    assert codec != "utf-8"
+
+
 # ---------------------------------------------------------------------------
 # Rust-only: large buffer handled without panic
 # ---------------------------------------------------------------------------
 
+
 def test_large_buffer_does_not_panic():
     if not _RUST_AVAILABLE:
         pytest.skip("Rust extension not available")
@@ -30,3 +30,103 @@ def test_file_extractor_docx(file_input):
 def test_word_loader_docx(file_input):
     loader = WordLoader(file_obj=file_input, filename="sample.docx")
     assert "This is a sample DOCX file." in loader.file_load()
+
+
+# --- Streaming OOXML reader ---
+W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+MC_NS = "http://schemas.openxmlformats.org/markup-compatibility/2006"
+
+
+def _docx_with_body(body_xml):
+    """Replace word/document.xml of a blank python-docx package."""
+    import zipfile
+
+    source = BytesIO()
+    Document().save(source)
+    source.seek(0)
+    target = BytesIO()
+    with zipfile.ZipFile(source) as src, zipfile.ZipFile(target, "w") as dst:
+        for item in src.infolist():
+            data = src.read(item.filename)
+            if item.filename == "word/document.xml":
+                data = (
+                    f'<w:document xmlns:w="{W_NS}" xmlns:mc="{MC_NS}">'
+                    f"<w:body>{body_xml}</w:body></w:document>"
+                ).encode("utf-8")
+            dst.writestr(item, data)
+    target.seek(0)
+    return target
+
+
+def test_stream_matches_python_docx_paragraphs():
+    from docx.enum.text import WD_BREAK
+
+    from TextSpitter._ooxml import iter_docx_paragraphs
+
+    doc = Document()
+    doc.add_heading("Title", 0)
+    paragraph = doc.add_paragraph("Hello ")
+    run = paragraph.add_run("bold")
+    run.bold = True
+    run.add_tab()
+    run.add_text("tabbed")
+    run.add_break()
+    run.add_text("next line")
+    run.add_break(WD_BREAK.PAGE)
+    run.add_text("new page")
+    doc.add_paragraph("  spaced  out  ")
+    buffer = BytesIO()
+    doc.save(buffer)
+
+    expected = [p.text for p in Document(BytesIO(buffer.getvalue())).paragraphs]
+    assert list(iter_docx_paragraphs(BytesIO(buffer.getvalue()))) == expected
+
+
+def test_stream_includes_table_cells_in_order():
+    doc = Document()
+    doc.add_paragraph("Before")
+    table = doc.add_table(rows=2, cols=2)
+    for i, cell in enumerate(table._cells):
+        cell.text = f"cell {i}"
+    doc.add_paragraph("After")
+    buffer = BytesIO()
+    doc.save(buffer)
+
+    extractor = FileExtractor(file_obj=buffer.getvalue(), filename="t.docx")
+    assert extractor.docx_file_read() == "\n".join(
+        ["Before", "cell 0", "cell 1", "cell 2", "cell 3", "After"]
+    )
+
+
+def test_stream_hyperlinks_and_alternate_content():
+    body = (
+        "<w:p><w:r><w:t>See </w:t></w:r>"
+        '<w:hyperlink><w:r><w:t xml:space="preserve">the link</w:t></w:r>'
+        "</w:hyperlink><w:r><w:noBreakHyphen/><w:t>x</w:t></w:r></w:p>"
+        "<mc:AlternateContent>"
+        "<mc:Choice><w:p><w:r><w:t>choice</w:t></w:r></w:p></mc:Choice>"
+        "<mc:Fallback><w:p><w:r><w:t>fallback</w:t></w:r></w:p></mc:Fallback>"
+        "</mc:AlternateContent>"
+        "<w:p><w:r><w:t>box anchor</w:t>"
+        "<w:txbxContent><w:p><w:r><w:t>in box</w:t></w:r></w:p></w:txbxContent>"
+        "</w:r></w:p>"
+    )
+    extractor = FileExtractor(file_obj=_docx_with_body(body), filename="a.docx")
+    assert extractor.docx_file_read() == "See the link-x\nchoice\nbox anchor"
+
+
+def test_stream_failure_falls_back_to_python_docx(mocker):
+    import TextSpitter.core as core
+
+    mocker.patch.object(
+        core, "iter_docx_paragraphs", side_effect=KeyError("word/document.xml")
+    )
+    python_docx = mocker.spy(core, "Document")
+    doc = Document()
+    doc.add_paragraph("Still readable")
+    buffer = BytesIO()
+    doc.save(buffer)
+
+    extractor = FileExtractor(file_obj=buffer.getvalue(), filename="f.docx")
+    assert extractor.docx_file_read() == "Still readable"
+    python_docx.assert_called_once()
@@ -9,6 +9,7 @@ from unittest.mock import MagicMock
 
 import pytest
 
+from TextSpitter import decode_auto
 from TextSpitter.core import FileExtractor
 
 
@@ -146,24 +147,36 @@ def test_init_raises_value_error_if_no_args():
 # --- get_file_type tests ---
 def test_get_file_type_known_mime_docx(mocker):
     mock_guess_type = mocker.patch("TextSpitter.core.mimetypes.guess_type")
-    mock_guess_type.return_value = (
-        "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-        None,
-    )
     file_type = FileExtractor.get_file_type("test.docx")
     assert (
         file_type
         == "vnd.openxmlformats-officedocument.wordprocessingml.document"
     )
-    mock_guess_type.assert_called_with("test.docx")
+    mock_guess_type.assert_not_called()  # served from MIME_SUBTYPES
 
 
 def test_get_file_type_known_mime_pdf(mocker):
     mock_guess_type = mocker.patch("TextSpitter.core.mimetypes.guess_type")
-    mock_guess_type.return_value = ("application/pdf", None)
-    file_type = FileExtractor.get_file_type(Path("mydoc.pdf"))
+    file_type = FileExtractor.get_file_type(Path("mydoc.PDF"))
     assert file_type == "pdf"
-    mock_guess_type.assert_called_with(str(Path("mydoc.pdf")))
+    mock_guess_type.assert_not_called()
+
+
+def test_get_file_type_unlisted_ext_uses_mimetypes(mocker):
+    mock_guess_type = mocker.patch("TextSpitter.core.mimetypes.guess_type")
+    mock_guess_type.return_value = ("text/x-rst", None)
+    file_type = FileExtractor.get_file_type(Path("notes.rst"))
+    assert file_type == "x-rst"
+    mock_guess_type.assert_called_with(str(Path("notes.rst")))
+
+
+@pytest.mark.parametrize(
+    ("name", "expected"),
+    [("main.c", "x-csrc"), ("main.cpp", "x-c++src"), ("Main.java", "x-java")],
+)
+def test_get_file_type_table_matches_mimetypes(name, expected):
+    """Table entries keep the subtypes `mimetypes` returned for them."""
+    assert FileExtractor.get_file_type(name) == expected
 
 
 def test_get_file_type_unknown_mime_fallback_to_ext_py(mocker):
@@ -281,27 +294,30 @@ def test_code_file_read_latin1():
     assert extractor.code_file_read() == content_str
 
 
-def test_code_file_read_fallback_to_replace_on_decode_error(mocker, log_capture):
-    # Bytes that are invalid UTF-8 — will fail the detected encoding decode.
+def test_code_file_read_uses_decode_auto_once(mocker, log_capture):
     original_bytes_content = b"\x80\x90\xa0"
 
     mocker.patch.object(
         FileExtractor, "get_contents", return_value=original_bytes_content
     )
-    # Force detect_encoding to return utf-8 so the decode attempt fails,
-    # exercising the utf-8-with-replacement fallback path in code_file_read.
-    mocker.patch("TextSpitter.core.detect_encoding", return_value="utf-8")
+    mock_decode = mocker.patch(
+        "TextSpitter.core.decode_auto", return_value=("\ufffd", "utf-8")
+    )
 
     extractor = FileExtractor(filename="broken.bin")
     decoded_content = extractor.code_file_read()
 
+    mock_decode.assert_called_once_with(original_bytes_content)
+    assert decoded_content == "\ufffd"
     assert any(
-        "falling back to utf-8 with replacement" in line
+        "Successfully decoded broken.bin using utf-8" in line
         for line in log_capture
     )
-    assert decoded_content == original_bytes_content.decode(
-        "utf-8", errors="replace"
-    )
+
+
+def test_code_file_read_undecodable_bytes_do_not_raise():
+    extractor = FileExtractor(file_obj=b"\x80\x90\xa0", filename="x.py")
+    assert isinstance(extractor.code_file_read(), str)
 
 
 # --- pdf_file_read tests ---
@@ -380,6 +396,132 @@ def test_pdf_file_read_both_fail(mocker, log_capture):
     assert "Both PyMuPDF and PyPDF2 failed for PDF test.pdf: PyPDF reader error" in logs
 
 
+def _mock_pymupdf_pages(mocker, texts):
+    mock_pymupdf_module = mocker.patch("TextSpitter.core.pymupdf", create=True)
+    pages = []
+    for text in texts:
+        page = MagicMock()
+        if isinstance(text, Exception):
+            page.get_text.side_effect = text
+        else:
+            page.get_text.return_value = text
+        pages.append(page)
+    mock_doc = MagicMock()
+    mock_doc.__enter__.return_value = pages
+    mock_pymupdf_module.open.return_value = mock_doc
+    return pages
+
+
+def test_iter_pdf_pages_is_lazy(mocker):
+    pages = _mock_pymupdf_pages(mocker, ["one", "two", "three"])
+    extractor = FileExtractor(file_obj=b"fake pdf data", filename="test.pdf")
+
+    iterator = extractor.iter_pdf_pages()
+    assert next(iterator) == (0, "one", "pymupdf")
+    pages[1].get_text.assert_not_called()
+    assert [page.number for page in iterator] == [1, 2]
+
+
+def test_iter_pdf_pages_fails_over_per_page(mocker, log_capture):
+    pages = _mock_pymupdf_pages(mocker, ["one", RuntimeError("bad page"), "three"])
+    mock_pypdf_module = mocker.patch("TextSpitter.core.pypdf", create=True)
+    pypdf_pages = [MagicMock(), MagicMock(), MagicMock()]
+    for page, text in zip(pypdf_pages, ["ONE", "TWO", "THREE"], strict=True):
+        page.extract_text.return_value = text
+    mock_pypdf_module.PdfReader.return_value.pages = pypdf_pages
+
+    extractor = FileExtractor(file_obj=b"fake pdf data", filename="test.pdf")
+    result = list(extractor.iter_pdf_pages())
+
+    assert result == [
+        (0, "one", "pymupdf"),
+        (1, "TWO", "pypdf"),
+        (2, "three", "pymupdf"),
+    ]
+    pypdf_pages[0].extract_text.assert_not_called()
+    pypdf_pages[2].extract_text.assert_not_called()
+    assert pages[1].get_text.call_count == 1
+    assert "PyMuPDF failed on page 1 (bad page) for PDF: test.pdf" in "\n".join(
+        log_capture
+    )
+
+
+def test_iter_pdf_pages_page_failing_everywhere(mocker, log_capture):
+    _mock_pymupdf_pages(mocker, ["one", RuntimeError("bad page")])
+    mock_pypdf_module = mocker.patch("TextSpitter.core.pypdf", create=True)
+    bad = MagicMock()
+    bad.extract_text.side_effect = RuntimeError("still bad")
+    mock_pypdf_module.PdfReader.return_value.pages = [MagicMock(), bad]
+
+    extractor = FileExtractor(file_obj=b"fake pdf data", filename="test.pdf")
+    assert list(extractor.iter_pdf_pages())[1] == (1, "", None)
+    assert extractor.pdf_file_read() == "one"
+    assert "No PDF backend could extract page 1 of test.pdf" in "\n".join(
+        log_capture
+    )
+
+
+def test_pypdf_not_opened_when_pymupdf_succeeds(mocker):
+    _mock_pymupdf_pages(mocker, ["one", "two"])
+    mock_pypdf_module = mocker.patch("TextSpitter.core.pypdf", create=True)
+    extractor = FileExtractor(file_obj=b"fake pdf data", filename="test.pdf")
+    assert extractor.pdf_file_read() == "onetwo"
+    mock_pypdf_module.PdfReader.assert_not_called()
+
+
+def test_pdf_pages_are_cached(mocker):
+    pages = _mock_pymupdf_pages(mocker, ["one", "two", "three"])
+    get_contents = mocker.spy(FileExtractor, "get_contents")
+    extractor = FileExtractor(
+        file_obj=b"fake pdf data",
+        filename="test.pdf",
+        max_pages=2,
+        cache_pages=True,
+    )
+    assert extractor.pdf_file_read() == "onetwo"
+    extractor.max_pages = None
+    assert extractor.pdf_file_read() == "onetwothree"
+    assert extractor.pdf_file_read() == "onetwothree"
+
+    assert [page.get_text.call_count for page in pages] == [1, 1, 1]
+    assert get_contents.call_count == 2  # third read served from the cache
+
+
+def test_pdf_pages_not_kept_by_default(mocker):
+    pages = _mock_pymupdf_pages(mocker, ["one", "two"])
+    extractor = FileExtractor(file_obj=b"fake pdf data", filename="test.pdf")
+    extractor.pdf_file_read()
+    assert [page.get_text.call_count for page in pages] == [1, 1]
+    extractor.pdf_file_read()
+    assert [page.get_text.call_count for page in pages] == [2, 2]
+    assert extractor._pdf_pages == {}
+
+
+def test_page_failover_when_pypdf_cannot_open(mocker, log_capture):
+    _mock_pymupdf_pages(mocker, ["one", RuntimeError("bad page"), "three"])
+    mock_pypdf_module = mocker.patch("TextSpitter.core.pypdf", create=True)
+    mock_pypdf_module.PdfReader.side_effect = RuntimeError("cannot open")
+
+    extractor = FileExtractor(file_obj=b"fake pdf data", filename="test.pdf")
+    assert list(extractor.iter_pdf_pages()) == [
+        (0, "one", "pymupdf"),
+        (1, "", None),
+        (2, "three", "pymupdf"),
+    ]
+    assert extractor.pdf_file_read() == "onethree"
+    logs = "\n".join(log_capture)
+    assert "PyPDF2 failed (cannot open) for PDF: test.pdf" in logs
+    assert "No PDF backend could extract page 1 of test.pdf" in logs
+
+
+def test_iter_pdf_pages_real_pdf(many_page_pdf):
+    extractor = FileExtractor(file_obj=many_page_pdf, use_mmap=True)
+    pages = list(extractor.iter_pdf_pages())
+    assert [page.number for page in pages] == list(range(12))
+    assert {page.backend for page in pages} == {"pymupdf"}
+    assert "".join(page.text for page in pages) == extractor.pdf_file_read()
+
+
 # --- docx_file_read tests ---
 def test_docx_file_read_success(mocker):
     mock_docx_Document = mocker.patch("TextSpitter.core.Document", create=True)
@@ -429,38 +571,22 @@ def test_text_file_read_latin1_fallback():
     assert extractor.text_file_read() == content_str
 
 
-def test_text_file_read_replace_on_decode_error(mocker, log_capture):
-    original_bytes_content = (
-        b"\x81\xfe\xff"  # Intended to fail utf-8 and latin-1
-    )
-
-    mock_bytes_instance = MagicMock(spec=bytes)
-
-    def mock_decode_side_effect(encoding, errors=None):
-        if encoding == "utf-8" and errors == "replace":
-            return original_bytes_content.decode("utf-8", errors="replace")
-        if encoding in ["utf-8", "latin-1"]:  # For text_file_read loop
-            raise UnicodeDecodeError(
-                encoding, b"", 0, 0, "mocked reason for loop fail"
-            )
-        return original_bytes_content.decode(
-            encoding, errors=errors or "strict"
-        )
-
-    mock_bytes_instance.decode = MagicMock(side_effect=mock_decode_side_effect)
+def test_text_file_read_undecodable_bytes(mocker, log_capture):
+    original_bytes_content = b"\x81\xfe\xff"  # Invalid utf-8 and cp1252
     mocker.patch.object(
-        FileExtractor, "get_contents", return_value=mock_bytes_instance
+        FileExtractor, "get_contents", return_value=original_bytes_content
     )
 
     extractor = FileExtractor(filename="badtext.txt")
     result = extractor.text_file_read()
 
-    assert (
-        "Could not decode text file badtext.txt with utf-8, cp1252, or latin-1"
-        in "\n".join(log_capture)
-    )
-    mock_bytes_instance.decode.assert_any_call("utf-8", errors="replace")
-    assert result == original_bytes_content.decode("utf-8", errors="replace")
+    assert result == decode_auto(original_bytes_content)[0]
+    assert "Decoded text file badtext.txt using" in "\n".join(log_capture)
+
+
+def test_text_file_read_utf8_bom_is_stripped():
+    extractor = FileExtractor(file_obj=b"\xef\xbb\xbfhello", filename="bom.txt")
+    assert extractor.text_file_read() == "hello"
 
 
 def test_csv_file_read_utf8():
@@ -479,35 +605,224 @@ def test_csv_file_read_latin1_fallback():
     assert extractor.csv_file_read() == content_str
 
 
-def test_csv_file_read_replace_on_decode_error(mocker, log_capture):
-    original_bytes_content = (
-        b"\xcc\x81\xfe\xff"  # Intended to fail utf-8 and latin-1
+def test_csv_file_read_undecodable_bytes(mocker, log_capture):
+    original_bytes_content = b"\xcc\x81\xfe\xff"  # Invalid utf-8 and cp1252
+    mocker.patch.object(
+        FileExtractor, "get_contents", return_value=original_bytes_content
     )
 
-    mock_bytes_instance = MagicMock(spec=bytes)
+    extractor = FileExtractor(filename="bad.csv")
+    result = extractor.csv_file_read()
+
+    assert result == decode_auto(original_bytes_content)[0]
+    assert "Decoded CSV file bad.csv using" in "\n".join(log_capture)
 
-    def mock_decode_side_effect(encoding, errors=None):
-        if encoding == "utf-8" and errors == "replace":
-            return original_bytes_content.decode("utf-8", errors="replace")
-        if encoding in ["utf-8", "latin-1"]:  # For csv_file_read loop
-            raise UnicodeDecodeError(
-                encoding, b"", 0, 0, "mocked reason for loop fail"
-            )
-        return original_bytes_content.decode(
-            encoding, errors=errors or "strict"
-        )
 
-    mock_bytes_instance.decode = MagicMock(side_effect=mock_decode_side_effect)
-    mocker.patch.object(
-        FileExtractor, "get_contents", return_value=mock_bytes_instance
+# --- Zero-copy inputs ---
+@pytest.mark.parametrize("wrap", [bytearray, memoryview])
+def test_buffer_inputs_are_read_in_place(wrap):
+    content = "café résumé"
+    extractor = FileExtractor(
+        file_obj=wrap(content.encode("utf-8")), filename="notes.txt"
+    )
+    assert extractor.get_contents() == content.encode("utf-8")
+    with extractor.open_buffer() as buf:
+        assert isinstance(buf, memoryview)
+    assert extractor.text_file_read() == content
+    assert extractor.code_file_read() == content
+
+
+def test_open_buffer_mmap_path(tmp_path):
+    path = tmp_path / "notes.txt"
+    path.write_bytes(b"\xef\xbb\xbfhello mmap")
+    extractor = FileExtractor(file_obj=path, use_mmap=True)
+    with extractor.open_buffer() as buf:
+        assert isinstance(buf, memoryview)
+        assert bytes(buf) == path.read_bytes()
+    assert extractor.text_file_read() == "hello mmap"
+
+
+def test_open_buffer_mmap_empty_file(tmp_path):
+    path = tmp_path / "empty.txt"
+    path.write_bytes(b"")
+    extractor = FileExtractor(file_obj=path, use_mmap=True)
+    with extractor.open_buffer() as buf:
+        assert bytes(buf) == b""
+    assert extractor.text_file_read() == ""
+
+
+def test_mmap_pdf_and_docx_round_trip(tmp_path):
+    pymupdf = pytest.importorskip("pymupdf")
+    import docx
+
+    pdf_path = tmp_path / "doc.pdf"
+    with pymupdf.open() as pdf:
+        pdf.new_page().insert_text((72, 72), "Hello mmap")
+        pdf.save(pdf_path)
+    docx_path = tmp_path / "doc.docx"
+    document = docx.Document()
+    document.add_paragraph("Docx mmap")
+    document.save(docx_path)
+
+    pdf = FileExtractor(file_obj=pdf_path, use_mmap=True)
+    assert pdf.pdf_file_read().strip() == "Hello mmap"
+    word = FileExtractor(file_obj=docx_path, use_mmap=True)
+    assert word.docx_file_read() == "Docx mmap"
+
+
+def test_mmap_pdf_pypdf_fallback(tmp_path, mocker):
+    pymupdf = pytest.importorskip("pymupdf")
+    pytest.importorskip("pypdf")
+
+    pdf_path = tmp_path / "doc.pdf"
+    with pymupdf.open() as pdf:
+        pdf.new_page().insert_text((72, 72), "Hello pypdf")
+        pdf.save(pdf_path)
+
+    mocker.patch("TextSpitter.core.pymupdf", None)
+    extractor = FileExtractor(file_obj=pdf_path, use_mmap=True)
+    assert extractor.pdf_file_read().strip() == "Hello pypdf"
+
+
+# --- Parallel PDF pages ---
+@pytest.fixture
+def many_page_pdf(tmp_path):
+    pymupdf = pytest.importorskip("pymupdf")
+    path = tmp_path / "many.pdf"
+    with pymupdf.open() as pdf:
+        for i in range(12):
+            pdf.new_page().insert_text((72, 72), f"Page number {i}")
+        pdf.save(path)
+    return path
+
+
+@pytest.mark.parametrize("from_bytes", [False, True])
+def test_pdf_parallel_matches_serial(many_page_pdf, monkeypatch, from_bytes):
+    monkeypatch.setattr(FileExtractor, "PDF_PARALLEL_MIN_PAGES", 4)
+    source = many_page_pdf.read_bytes() if from_bytes else many_page_pdf
+    serial = FileExtractor(file_obj=source, filename="many.pdf").pdf_file_read()
+    parallel = FileExtractor(
+        file_obj=source, filename="many.pdf", pdf_workers=2
+    ).pdf_file_read()
+    assert parallel == serial
+    assert parallel.index("Page number 3") < parallel.index("Page number 11")
+
+
+def test_pdf_parallel_pages_are_streamed(many_page_pdf, mocker, monkeypatch):
+    from concurrent.futures import ProcessPoolExecutor
+
+    monkeypatch.setattr(FileExtractor, "PDF_PARALLEL_MIN_PAGES", 4)
+    submit = mocker.spy(ProcessPoolExecutor, "submit")
+    extractor = FileExtractor(file_obj=many_page_pdf, pdf_workers=2)
+    pages = extractor.iter_pdf_pages()
+
+    first = next(pages)
+    # 12 pages in 6 ranges; only 2 ranges per worker are in flight
+    assert first.number == 0 and first.backend == "pymupdf"
+    assert submit.call_count < 6
+    rest = list(pages)
+    assert [page.number for page in rest] == list(range(1, 12))
+    assert submit.call_count == 6
+
+
+def test_pdf_parallel_skips_cached_pages(many_page_pdf, mocker, monkeypatch):
+    from concurrent.futures import ProcessPoolExecutor
+
+    monkeypatch.setattr(FileExtractor, "PDF_PARALLEL_MIN_PAGES", 4)
+    extractor = FileExtractor(
+        file_obj=many_page_pdf, max_pages=4, cache_pages=True
     )
+    list(extractor.iter_pdf_pages())
+    submit = mocker.spy(ProcessPoolExecutor, "submit")
+    extractor.max_pages = None
+    extractor.pdf_workers = 2
 
-    extractor = FileExtractor(filename="bad.csv")
-    result = extractor.csv_file_read()
+    pages = list(extractor.iter_pdf_pages())
 
-    assert (
-        "Could not decode CSV file bad.csv with utf-8, cp1252, or latin-1"
-        in "\n".join(log_capture)
+    submitted = [n for call in submit.call_args_list for n in range(*call.args[2:])]
+    assert submitted == list(range(4, 12))
+    assert [page.number for page in pages] == list(range(12))
+    assert "Page number 7" in pages[7].text
+
+
+def test_pdf_parallel_skipped_below_threshold(many_page_pdf, mocker):
+    pool = mocker.patch("concurrent.futures.ProcessPoolExecutor")
+    extractor = FileExtractor(file_obj=many_page_pdf, pdf_workers=4)
+    assert "Page number 11" in extractor.pdf_file_read()
+    pool.assert_not_called()
+
+
+def test_pdf_parallel_failure_falls_back_to_serial(
+    many_page_pdf, mocker, monkeypatch, log_capture
+):
+    monkeypatch.setattr(FileExtractor, "PDF_PARALLEL_MIN_PAGES", 4)
+    mocker.patch(
+        "concurrent.futures.ProcessPoolExecutor", side_effect=OSError("no fork")
+    )
+    extractor = FileExtractor(file_obj=many_page_pdf, pdf_workers=2)
+    assert "Page number 11" in extractor.pdf_file_read()
+    assert "Parallel PDF extraction failed" in "\n".join(log_capture)
+
+
+# --- Page selection ---
+@pytest.mark.parametrize(
+    "page_range, max_pages, expected",
+    [
+        (None, 3, [0, 1, 2]),
+        ((5, 8), None, [5, 6, 7]),
+        ((10, None), 5, [10, 11]),
+        ((-2, None), None, [10, 11]),
+        ((2, 9), 2, [2, 3]),
+        (None, 0, []),
+    ],
+)
+def test_iter_pdf_pages_selection(many_page_pdf, page_range, max_pages, expected):
+    extractor = FileExtractor(
+        file_obj=many_page_pdf, page_range=page_range, max_pages=max_pages
+    )
+    assert [page.number for page in extractor.iter_pdf_pages()] == expected
+
+
+def test_page_selection_respected_by_pypdf(many_page_pdf, mocker):
+    pytest.importorskip("pypdf")
+    mocker.patch("TextSpitter.core.pymupdf", None)
+    extractor = FileExtractor(file_obj=many_page_pdf, page_range=(4, None), max_pages=2)
+    pages = list(extractor.iter_pdf_pages())
+    assert [(page.number, page.backend) for page in pages] == [(4, "pypdf"), (5, "pypdf")]
+    assert "Page number 4" in pages[0].text
+
+
+def test_page_selection_skips_unselected_pages(mocker):
+    pages = _mock_pymupdf_pages(mocker, ["one", "two", "three", "four"])
+    extractor = FileExtractor(
+        file_obj=b"fake pdf data",
+        filename="test.pdf",
+        max_pages=2,
+        cache_pages=True,
     )
-    mock_bytes_instance.decode.assert_any_call("utf-8", errors="replace")
-    assert result == original_bytes_content.decode("utf-8", errors="replace")
+    assert extractor.pdf_file_read() == "onetwo"
+    pages[2].get_text.assert_not_called()
+    pages[3].get_text.assert_not_called()
+
+
+def test_parallel_respects_page_range(many_page_pdf, monkeypatch):
+    monkeypatch.setattr(FileExtractor, "PDF_PARALLEL_MIN_PAGES", 2)
+    extractor = FileExtractor(
+        file_obj=many_page_pdf, page_range=(3, 9), pdf_workers=2
+    )
+    pages = list(extractor.iter_pdf_pages())
+    assert [page.number for page in pages] == list(range(3, 9))
+    assert "Page number 3" in pages[0].text
+    assert "Page number 8" in pages[-1].text
+
+
+def test_negative_max_pages_raises():
+    with pytest.raises(ValueError, match="max_pages"):
+        FileExtractor(filename="test.pdf", max_pages=-1)
+
+
+def test_text_spitter_forwards_page_selection(many_page_pdf):
+    from TextSpitter import TextSpitter
+
+    text = TextSpitter(file_obj=str(many_page_pdf), page_range=(1, None), max_pages=1)
+    assert text.strip() == "Page number 1"
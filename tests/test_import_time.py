@@ -0,0 +1,63 @@
+"""
+Import-time budget for ``import TextSpitter``.
+
+Extraction backends are loaded on first use, so importing the package (and
+starting the CLI) must not pay for PyMuPDF, pypdf or python-docx.
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+# Generous enough for slow CI runners; importing the backends eagerly costs
+# several hundred milliseconds on its own.
+IMPORT_BUDGET_US = 200_000
+
+HEAVY_MODULES = ("pymupdf", "pypdf", "docx")
+
+
+def _run(code):
+    return subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def test_import_does_not_load_backends():
+    result = _run(
+        "import sys, TextSpitter, TextSpitter.cli; "
+        f"print(sorted(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    assert result.stdout.strip() == "[]"
+
+
+def test_text_extraction_does_not_load_backends(tmp_path):
+    path = tmp_path / "notes.txt"
+    path.write_text("hello")
+    result = _run(
+        "import sys, mimetypes; from TextSpitter import TextSpitter; "
+        f"assert TextSpitter({str(path)!r}) == 'hello'; "
+        "from TextSpitter.core import FileExtractor; "
+        "FileExtractor.get_file_type('a.docx'); "
+        f"print(sorted(m for m in {HEAVY_MODULES!r} if m in sys.modules), "
+        "mimetypes.inited)"
+    )
+    assert result.stdout.strip() == "[] False"
+
+
+@pytest.mark.benchmark
+def test_import_time_budget():
+    result = _run("import TextSpitter")
+    lines = [
+        line for line in result.stderr.splitlines() if line.endswith("| TextSpitter")
+    ]
+    assert lines, result.stderr
+    cumulative_us = int(lines[-1].split("|")[1])
+    if cumulative_us > IMPORT_BUDGET_US:
+        pytest.fail(
+            f"import TextSpitter took {cumulative_us / 1000:.1f} ms "
+            f"(budget {IMPORT_BUDGET_US / 1000:.0f} ms)"
+        )
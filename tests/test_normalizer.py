@@ -2,6 +2,7 @@
 Tests for TextNormalizer (Rust and Python fallback paths).
 """
 
+import time
 import unicodedata
 
 import pytest
@@ -33,6 +34,17 @@ def test_instantiation_defaults(Norm):
     assert norm is not None
 
 
+def test_config_round_trips(Norm):
+    config = {
+        "unicode_form": "NFKC",
+        "collapse_whitespace": False,
+        "repair_ocr": True,
+        "strip_headers_footers": True,
+        "fused": True,
+    }
+    assert Norm(**config).config() == config
+
+
 def test_normalize_returns_str(Norm):
     norm = Norm()
     result = norm.normalize("hello")
@@ -68,6 +80,41 @@ def test_nfkc_collapses_compatibility_chars(Norm):
     assert result == "fi"
 
 
+# ---------------------------------------------------------------------------
+# ASCII / already-normalized fast path
+# ---------------------------------------------------------------------------
+
+def test_stats_start_at_zero(Norm):
+    assert Norm().stats() == {"calls": 0, "fast_path": 0, "ascii": 0}
+
+
+def test_fast_path_counts_ascii_and_normalized(Norm):
+    norm = Norm(unicode_form="NFC", collapse_whitespace=False)
+    nfc = unicodedata.normalize("NFC", "café")
+    nfd = unicodedata.normalize("NFD", "café")
+    assert norm.normalize("plain ascii") == "plain ascii"
+    assert norm.normalize(nfc) == nfc
+    assert norm.normalize(nfd) == nfc
+    assert norm.stats() == {"calls": 3, "fast_path": 2, "ascii": 1}
+
+
+@pytest.mark.parametrize("form", ["NFC", "NFD", "NFKC", "NFKD"])
+def test_fast_path_output_unchanged(Norm, form):
+    norm = Norm(unicode_form=form, collapse_whitespace=False)
+    samples = ["ascii only", "café", "cafe\u0301", "ﬁle ①", "Ångström"]
+    for text in samples:
+        assert norm.normalize(text) == unicodedata.normalize(form, text)
+
+
+def test_batch_updates_stats(Norm):
+    norm = Norm()
+    norm.normalize_batch(["a", "b", "ç"])
+    stats = norm.stats()
+    assert stats["calls"] == 3
+    assert stats["ascii"] == 2
+    assert stats["fast_path"] == 3
+
+
 # ---------------------------------------------------------------------------
 # Whitespace collapsing
 # ---------------------------------------------------------------------------
@@ -134,6 +181,37 @@ def test_ocr_disabled_leaves_artifacts(Norm):
     assert norm.normalize("5l3") == "5l3"
 
 
+# ---------------------------------------------------------------------------
+# Fused single-pass mode
+# ---------------------------------------------------------------------------
+
+FUSED_SAMPLES = [
+    "",
+    "  leading and   trailing \t ",
+    "arnrnb cornrnon 1l1l1 2l3",
+    "para one\n\n\n\n  para   two\t\n \n\n\nend",
+    "rn at edges: rnx xrn 1l l1",
+    "mixed\u00a0nbsp\u2003em\u3000ideo",
+]
+
+
+@pytest.mark.parametrize("repair_ocr", [True, False])
+@pytest.mark.parametrize("collapse", [True, False])
+def test_fused_matches_sequential(Norm, repair_ocr, collapse):
+    kwargs = {"repair_ocr": repair_ocr, "collapse_whitespace": collapse}
+    sequential = Norm(**kwargs)
+    fused = Norm(fused=True, **kwargs)
+    for text in FUSED_SAMPLES:
+        assert fused.normalize(text) == sequential.normalize(text)
+
+
+def test_fused_batch_matches_single(Norm):
+    norm = Norm(repair_ocr=True, fused=True)
+    assert norm.normalize_batch(FUSED_SAMPLES) == [
+        norm.normalize(t) for t in FUSED_SAMPLES
+    ]
+
+
 # ---------------------------------------------------------------------------
 # Header/footer stripping
 # ---------------------------------------------------------------------------
@@ -165,6 +243,65 @@ def test_strip_headers_removes_repeated_lines(Norm):
     assert confidential_count < 3
 
 
+def test_strip_headers_ignores_cover_page_and_indentation(Norm):
+    norm = Norm(strip_headers_footers=True, collapse_whitespace=False)
+    pages = ["Cover page"] + [f"  ACME Corp \nbody {i}" for i in range(4)]
+    result = norm.normalize("\x0c".join(pages))
+    assert "ACME" not in result
+    assert result.split("\x0c") == ["Cover page"] + [
+        f"body {i}" for i in range(4)
+    ]
+
+
+def _report_pages(count: int) -> str:
+    return "\x0c".join(
+        f"ACME Corp Quarterly Report\n"
+        f"Section {i % 7} paragraph {i} with some body text.\n"
+        f"Another unique line for page {i}.\n"
+        f"Page {i + 1} of {count}"
+        for i in range(count)
+    )
+
+
+def test_strip_headers_2000_pages(Norm):
+    """Synthetic 2,000-page document: only the repeated header goes."""
+    norm = Norm(strip_headers_footers=True, collapse_whitespace=False)
+    result = norm.normalize(_report_pages(2000))
+    assert "ACME Corp" not in result
+    assert result.count("\x0c") == 1999
+    assert "Another unique line for page 1999." in result
+
+
+def test_strip_headers_fallback_reads_each_page_once(monkeypatch):
+    """Line counting makes one pass over the pages, not one per line."""
+    from TextSpitter import _fallback
+
+    updates = 0
+
+    class CountingCounter(_fallback.Counter):
+        def update(self, iterable=None, /, **kwargs):
+            nonlocal updates
+            updates += iterable is not None  # Counter() calls update(None)
+            super().update(iterable, **kwargs)
+
+    monkeypatch.setattr(_fallback, "Counter", CountingCounter)
+    norm = FallbackNormalizer(
+        strip_headers_footers=True, collapse_whitespace=False
+    )
+    norm.normalize(_report_pages(500))
+    assert updates == 500
+
+
+@pytest.mark.benchmark
+def test_strip_headers_benchmark_2000_pages(Norm):
+    """Quadratic implementations take minutes here; linear ones take ms."""
+    norm = Norm(strip_headers_footers=True, collapse_whitespace=False)
+    text = _report_pages(2000)
+    start = time.perf_counter()
+    norm.normalize(text)
+    assert time.perf_counter() - start < 2.0
+
+
 def test_strip_headers_disabled_preserves_all(Norm):
     norm = Norm(strip_headers_footers=False)
     pages = ["HDR\nBody1", "HDR\nBody2"]
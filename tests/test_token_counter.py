@@ -6,7 +6,10 @@ import pytest
 
 from TextSpitter import _RUST_AVAILABLE
 from TextSpitter import TokenCounter as RustCounter
+from TextSpitter import tokenizer_cache_info, warm_up
 from TextSpitter._fallback import TokenCounter as FallbackCounter
+from TextSpitter._fallback import tokenizer_cache_info as fallback_cache_info
+from TextSpitter._fallback import warm_up as fallback_warm_up
 
 # ---------------------------------------------------------------------------
 # Fixtures
@@ -21,6 +24,17 @@ def Counter(request):
     return FallbackCounter
 
 
+@pytest.fixture(params=["rust", "fallback"])
+def registry(request):
+    """Return (warm_up, tokenizer_cache_info, TokenCounter) for one path."""
+    if request.param == "rust":
+        if not _RUST_AVAILABLE:
+            pytest.skip("Rust extension not available")
+        return warm_up, tokenizer_cache_info, RustCounter
+    pytest.importorskip("tiktoken")
+    return fallback_warm_up, fallback_cache_info, FallbackCounter
+
+
 # ---------------------------------------------------------------------------
 # Construction
 # ---------------------------------------------------------------------------
@@ -190,3 +204,43 @@ def test_cl100k_base_count_batch_parallel():
     results = c.count_batch(texts)
     assert len(results) == 500
     assert all(n > 0 for n in results)
+
+
+# ---------------------------------------------------------------------------
+# Shared tokenizer registry
+# ---------------------------------------------------------------------------
+
+def test_cache_info_shape():
+    for info in (tokenizer_cache_info(), fallback_cache_info()):
+        assert isinstance(info["loads"], int)
+        assert isinstance(info["hits"], int)
+        assert isinstance(info["encodings"], list)
+
+
+def test_warm_up_empty_list_is_noop():
+    before = fallback_cache_info()
+    fallback_warm_up([])
+    assert fallback_cache_info() == before
+
+
+def test_warm_up_registers_encoding(registry):
+    warm, info, _ = registry
+    warm(["cl100k_base"])
+    assert "cl100k_base" in info()["encodings"]
+
+
+def test_warm_up_unknown_encoding_raises(registry):
+    warm, _, _ = registry
+    with pytest.raises((ValueError, Exception)):
+        warm(["this-model-does-not-exist-xyz"])
+
+
+def test_counters_reuse_cached_tokenizer(registry):
+    warm, info, Counter = registry
+    warm(["cl100k_base"])
+    loads = info()["loads"]
+    hits = info()["hits"]
+    for _ in range(3):
+        Counter(model="cl100k_base").count("hello world")
+    assert info()["loads"] == loads
+    assert info()["hits"] > hits